@@ -0,0 +1,6 @@
+"""
+Benchmark suite (synthetic data, no database)
+
+    python -m benchmarks.runner --scale small --save-baseline
+    python -m benchmarks.runner --scale small --baseline benchmarks/baselines/small.json
+"""
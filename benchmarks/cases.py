@@ -0,0 +1,182 @@
+"""
+Benchmark cases: one callable per pipeline stage
+
+Stages, on the same synthetic data set per scale:
+
+    fetch:sqlite                cluster_5g window from a local SQLite source
+    rollup                      build_daily_rollup of the raw window
+    rollup:store                warm persisted rollup store (newest days re-aggregated)
+    aggregate:<function>        each aggregate_* on the raw per-cluster rows
+    plan:build_chart_jobs       catalog plan: rollup, day selections, curves, jobs
+    chart:<slide>:<chart>       each chart class's create() (one PNG)
+    ppt:assemble                PPTBuilder, both slides from pre-rendered PNGs
+    deck:monthly_png            end-to-end create_monthly_dashboard
+    deck:monthly_png_fixed_layout  same, charts exported with cached layouts
+    deck:monthly_native         same, native PowerPoint charts
+"""
+import io
+import os
+from contextlib import redirect_stdout, redirect_stderr
+from data import SQLiteSource, get_stored_daily_rollup
+from data.synthetic import generate_cluster_data
+from generators import (
+    build_5g_chart_jobs, build_4g_chart_jobs, build_chart_jobs, DAILY_AGGREGATIONS_4G,
+    get_column_groups, get_daily_aggregations
+)
+from charts import fixed_layout
+from presentation import PPTBuilder
+from utils import (
+    build_daily_rollup,
+    aggregate_daily_data,
+    aggregate_availability_data,
+    aggregate_accessibility_data,
+    aggregate_cdr_data,
+    aggregate_sgnb_sr_data,
+    aggregate_traffic_data,
+    aggregate_eut_thp_data,
+    aggregate_user5g_data,
+    aggregate_prb_util_data,
+    aggregate_inter_esgnb_data,
+    aggregate_intra_esgnb_data,
+    aggregate_intra_sgnb_data,
+    aggregate_inter_sgnb_intrafreq_data
+)
+
+# Scale -> synthetic data set + timed runs per case
+SCALES = {
+    'small': {'n_clusters': 50, 'n_days': 35, 'repeat': 7},
+    'medium': {'n_clusters': 1000, 'n_days': 90, 'repeat': 5},
+    'large': {'n_clusters': 10000, 'n_days': 120, 'repeat': 3}
+}
+
+# Window of the dashboards (days_back)
+DECK_DAYS = 35
+
+# Fixed so every run (and the baseline) charts the same dates
+SYNTHETIC_ARGS = {
+    'end_date': '2025-10-05',
+    'missing_days': 2,
+    'zero_days': 1,
+    'nan_rate': 0.005,
+    'seed': 0
+}
+
+# Same calls (columns, days_back, interval) as the 5G/4G generators
+AGGREGATIONS = [
+    (aggregate_availability_data, ('avail_auto_5g',), {'days_back': DECK_DAYS}),
+    (aggregate_accessibility_data, ('da_5g',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_cdr_data, ('g5_cdr',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_sgnb_sr_data, ('sgnb_addition_sr',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_traffic_data, ('traffic_5g',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_eut_thp_data, ('g5_eut_bhv', 'g5_userdl_thp'), {'days_back': DECK_DAYS}),
+    (aggregate_user5g_data, ('sum_en_dc_user_5g_wd',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_prb_util_data, ('g5_dlprb_util', 'dl_prb_util_5g_count_gt_085'),
+     {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_inter_esgnb_data, ('inter_esgnb',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_intra_esgnb_data, ('intra_esgnb',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_intra_sgnb_data, ('intra_sgnb_intrafreq',), {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_inter_sgnb_intrafreq_data, ('inter_sgnb_intrafreq',),
+     {'days_back': DECK_DAYS, 'interval': 2}),
+    (aggregate_availability_data, ('g4_avail_auto',), {'days_back': DECK_DAYS})
+]
+
+def quiet(func, *args, **kwargs):
+    """Call func with its progress prints (and warnings) discarded"""
+    with redirect_stdout(io.StringIO()), redirect_stderr(io.StringIO()):
+        return func(*args, **kwargs)
+
+class BenchContext:
+    """Synthetic data set of one scale, written to a SQLite source in workdir"""
+
+    def __init__(self, scale, workdir):
+        self.scale = scale
+        self.workdir = workdir
+        settings = SCALES[scale]
+
+        self.raw_all = generate_cluster_data(
+            n_clusters=settings['n_clusters'], n_days=settings['n_days'], **SYNTHETIC_ARGS
+        )
+        self.source = SQLiteSource(os.path.join(workdir, f'cluster_5g_{scale}.db'))
+        self.source.write(self.raw_all)
+
+        # Dashboard inputs: deck window, its daily rollup, chart jobs, PNGs
+        self.raw = quiet(self.source.fetch, days_back=DECK_DAYS, column_groups=get_column_groups())
+        self.daily = quiet(build_daily_rollup, self.raw, get_daily_aggregations())
+        self.jobs = {
+            '5g': quiet(build_5g_chart_jobs, self.daily),
+            '4g': quiet(build_4g_chart_jobs, self.daily)
+        }
+        self.pngs = {
+            slide: {name: quiet(job.create).getvalue() for name, job in jobs.items()}
+            for slide, jobs in self.jobs.items()
+        }
+
+    @property
+    def rows(self):
+        """Rows in the deck window"""
+        return len(self.raw)
+
+def assemble_deck(pngs):
+    """Build both slides from PNG bytes and save to memory"""
+    ppt = PPTBuilder()
+    ppt.create_5g_slide({name: io.BytesIO(png) for name, png in pngs['5g'].items()})
+    ppt.create_4g_slide({name: io.BytesIO(png) for name, png in pngs['4g'].items()})
+    ppt.save(io.BytesIO())
+
+def deck_with_fixed_layout(create_dashboard, **kwargs):
+    """Build a deck with cached chart layouts (charts.fixed_layout)"""
+    with fixed_layout():
+        return create_dashboard(**kwargs)
+
+def build_cases(ctx):
+    """
+    Benchmark cases of one scale
+
+    Args:
+        ctx (BenchContext): Data set of the scale
+
+    Returns:
+        dict: Case name -> callable (no arguments)
+    """
+    # Imported here: the dashboard modules are scripts at the repo root
+    from dashboard_monthly import create_monthly_dashboard
+
+    aggregations = get_daily_aggregations()
+    cases = {
+        'fetch:sqlite': lambda: ctx.source.fetch(days_back=DECK_DAYS, column_groups=get_column_groups()),
+        'rollup': lambda: build_daily_rollup(ctx.raw, aggregations),
+        # Filled by the warm-up call, timed runs only refresh the newest days
+        'rollup:store': lambda: get_stored_daily_rollup(
+            aggregations, days_back=DECK_DAYS, source=ctx.source, offline=False,
+            store_path=os.path.join(ctx.workdir, f'daily_rollup_{ctx.scale}.db')
+        )
+    }
+
+    for func, columns, kwargs in AGGREGATIONS:
+        name = f'aggregate:{func.__name__}'
+        if name in cases:
+            name += f':{columns[0]}'
+        cases[name] = (lambda func=func, columns=columns, kwargs=kwargs:
+                       func(ctx.raw, *columns, **kwargs))
+
+    # 4G charts: one aggregate_daily_data call for every metric but availability
+    metrics_4g = {column: agg for column, agg in DAILY_AGGREGATIONS_4G.items()
+                  if column != 'g4_avail_auto'}
+    cases['aggregate:aggregate_daily_data'] = lambda: aggregate_daily_data(ctx.raw, metrics_4g)
+    cases['plan:build_chart_jobs'] = lambda: build_chart_jobs(ctx.raw)
+
+    for slide, jobs in ctx.jobs.items():
+        for chart, job in jobs.items():
+            cases[f'chart:{slide}:{chart}'] = job.create
+
+    cases['ppt:assemble'] = lambda: assemble_deck(ctx.pngs)
+    cases['deck:monthly_png'] = lambda: create_monthly_dashboard(
+        days_back=DECK_DAYS, source=ctx.source, chart_mode='png'
+    )
+    cases['deck:monthly_png_fixed_layout'] = lambda: deck_with_fixed_layout(
+        create_monthly_dashboard, days_back=DECK_DAYS, source=ctx.source, chart_mode='png'
+    )
+    cases['deck:monthly_native'] = lambda: create_monthly_dashboard(
+        days_back=DECK_DAYS, source=ctx.source, chart_mode='native'
+    )
+    return cases
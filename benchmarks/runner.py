@@ -0,0 +1,199 @@
+"""
+Benchmark runner
+
+Runs every case of benchmarks.cases at the selected scales, records
+median / p95 wall time and peak memory (tracemalloc, one extra run so the
+timings are not slowed down by tracing) and compares against a baseline.
+
+    python -m benchmarks.runner --scale small medium
+    python -m benchmarks.runner --scale small --save-baseline
+    python -m benchmarks.runner --scale small --baseline benchmarks/baselines/small.json
+
+Exit code 1 if any case regressed by more than the threshold.
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+import numpy as np
+from config import apply_chart_styles
+from .cases import SCALES, BenchContext, build_cases, quiet
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+BASELINES_DIR = os.path.join(BENCH_DIR, 'baselines')
+
+# Regression: median slower than baseline by more than THRESHOLD (fraction)
+# and by more than MIN_DELTA_S (ignores noise on sub-millisecond cases)
+THRESHOLD = 0.20
+MIN_DELTA_S = 0.005
+
+def measure(func, repeat):
+    """
+    Time a case and measure its peak memory
+
+    Args:
+        func: Callable without arguments
+        repeat (int): Timed runs (after one warm-up run)
+
+    Returns:
+        dict: median_s, p95_s, min_s, runs, peak_mb
+    """
+    quiet(func)
+
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        quiet(func)
+        timings.append(time.perf_counter() - start)
+
+    started_tracing = not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        quiet(func)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        if started_tracing:
+            tracemalloc.stop()
+
+    return {
+        'median_s': float(np.median(timings)),
+        'p95_s': float(np.percentile(timings, 95)),
+        'min_s': float(min(timings)),
+        'runs': repeat,
+        'peak_mb': (peak - base) / 1024 / 1024
+    }
+
+def run_scale(scale, repeat=None, only=None):
+    """
+    Run every case of one scale
+
+    Args:
+        scale (str): Key of SCALES
+        repeat (int): Timed runs per case (default: SCALES[scale]['repeat'])
+        only (str): Only cases whose name contains this text
+
+    Returns:
+        dict: JSON-serializable results
+    """
+    settings = SCALES[scale]
+    repeat = repeat or settings['repeat']
+    cwd = os.getcwd()
+
+    with tempfile.TemporaryDirectory(prefix=f'kpi_bench_{scale}_') as workdir:
+        print(f"[{scale}] Generating {settings['n_clusters']} clusters x {settings['n_days']} days...")
+        ctx = BenchContext(scale, workdir)
+        cases = build_cases(ctx)
+        if only:
+            cases = {name: func for name, func in cases.items() if only in name}
+
+        results = {}
+        # Decks are saved to the working directory
+        os.chdir(workdir)
+        try:
+            for name, func in cases.items():
+                results[name] = measure(func, repeat)
+                print(f"[{scale}] {name:<52} median {results[name]['median_s'] * 1000:>9.1f} ms"
+                      f"  p95 {results[name]['p95_s'] * 1000:>9.1f} ms"
+                      f"  peak {results[name]['peak_mb']:>7.1f} MB")
+        finally:
+            os.chdir(cwd)
+
+    return {
+        'scale': scale,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': platform.machine(),
+        'data': dict(settings, rows_in_window=ctx.rows),
+        'cases': results
+    }
+
+def compare(results, baseline, threshold=THRESHOLD, min_delta=MIN_DELTA_S):
+    """
+    Compare case medians against a baseline
+
+    Args:
+        results (dict): run_scale() output
+        baseline (dict): run_scale() output saved earlier
+        threshold (float): Allowed slowdown as a fraction of the baseline
+        min_delta (float): Slowdowns below this many seconds are ignored
+
+    Returns:
+        list: (case, baseline median, new median, ratio) of regressed cases
+    """
+    regressions = []
+    print(f"\n{'CASE':<56} {'BASE (ms)':>10} {'NEW (ms)':>10} {'RATIO':>7}")
+    for name, new in results['cases'].items():
+        old = baseline['cases'].get(name)
+        if old is None:
+            print(f"{name:<56} {'-':>10} {new['median_s'] * 1000:>10.1f} {'new':>7}")
+            continue
+
+        ratio = new['median_s'] / old['median_s'] if old['median_s'] else float('inf')
+        regressed = (ratio > 1 + threshold and
+                     new['median_s'] - old['median_s'] > min_delta)
+        flag = '  REGRESSION' if regressed else ''
+        print(f"{name:<56} {old['median_s'] * 1000:>10.1f} {new['median_s'] * 1000:>10.1f} "
+              f"{ratio:>7.2f}{flag}")
+        if regressed:
+            regressions.append((name, old['median_s'], new['median_s'], ratio))
+    return regressions
+
+def save_json(data, filename):
+    """Write results as JSON"""
+    os.makedirs(os.path.dirname(filename), exist_ok=True)
+    with open(filename, 'w') as f:
+        json.dump(data, f, indent=2)
+    return filename
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="KPI dashboard benchmarks (synthetic data)")
+    parser.add_argument('--scale', nargs='+', choices=list(SCALES), default=['small'])
+    parser.add_argument('--repeat', type=int, help="Timed runs per case (default per scale)")
+    parser.add_argument('--only', help="Only cases whose name contains this text")
+    parser.add_argument('--output-dir', default=RESULTS_DIR)
+    parser.add_argument('--baseline', help="Baseline JSON (one --scale only); "
+                                           "default benchmarks/baselines/<scale>.json if present")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="Also save the results as benchmarks/baselines/<scale>.json")
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    args = parser.parse_args(argv)
+
+    if args.baseline and len(args.scale) > 1:
+        parser.error("--baseline needs exactly one --scale")
+
+    apply_chart_styles()
+    regressed = False
+    for scale in args.scale:
+        results = run_scale(scale, repeat=args.repeat, only=args.only)
+        output = save_json(results, os.path.join(args.output_dir, f'{scale}.json'))
+        print(f"[{scale}] Results saved as: {output}")
+
+        baseline_file = args.baseline or os.path.join(BASELINES_DIR, f'{scale}.json')
+        if os.path.exists(baseline_file) and not args.save_baseline:
+            with open(baseline_file) as f:
+                baseline = json.load(f)
+            regressions = compare(results, baseline, threshold=args.threshold)
+            if regressions:
+                regressed = True
+                print(f"[{scale}] ✗ {len(regressions)} case(s) slower than baseline "
+                      f"by more than {args.threshold:.0%}")
+            else:
+                print(f"[{scale}] ✓ No regression against {baseline_file}")
+
+        if args.save_baseline:
+            print(f"[{scale}] Baseline saved as: "
+                  f"{save_json(results, os.path.join(BASELINES_DIR, f'{scale}.json'))}")
+
+    return 1 if regressed else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
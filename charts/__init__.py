@@ -23,11 +23,20 @@ from .chart_4g import (
     DualLineChart4G,
     StackedBarChart4G
 )
+from .renderer import (
+    ChartJob, render_jobs, create_render_pool, create_thread_render_pool, render_pool
+)
+from .render_cache import RenderCache
+from .figure_pool import figure_pool, set_figure_pool
+from .fixed_layout import fixed_layout, set_fixed_layout
 
 __all__ = [
     'AvailabilityChart5G', 'LineChart5G', 'AreaChart5G', 'BarChart5G',
     'DualLineChart5G', 'StackedBarChart5G', 'CDRChart5G', 'SgnbSRChart5G',
     'TrafficChart5G', 'EUTThpChart5G', 'User5GChart', 'PRBUtilChart5G',  # ADD PRBUtilChart5G
     'AvailabilityChart4G', 'LineChart4G', 'AreaChart4G', 'BarChart4G',
-    'DualLineChart4G', 'StackedBarChart4G'
+    'DualLineChart4G', 'StackedBarChart4G',
+    'ChartJob', 'render_jobs', 'create_render_pool', 'create_thread_render_pool',
+    'render_pool', 'RenderCache',
+    'figure_pool', 'set_figure_pool', 'fixed_layout', 'set_fixed_layout'
 ]
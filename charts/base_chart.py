@@ -1,27 +1,35 @@
 """
 Base chart class with border and common formatting
 """
-import matplotlib.pyplot as plt
 import matplotlib.dates as mdates
 import numpy as np
 from io import BytesIO
-from scipy.interpolate import make_interp_spline
-from config import COLORS, CHART_SIZE, BORDER_WIDTH, LINE_WIDTH_BOLD
+from config import COLORS, CHART_DPI, BORDER_WIDTH, LINE_WIDTH_BOLD
+from utils.smoothing import smooth_series, sample_count
+from .figure_pool import acquire_figure, new_figure
+from .fixed_layout import fixed_layout_enabled, apply_fixed_layout
 
 class BaseChart:
     """Base class for all charts"""
     
-    def __init__(self, dates, values, title, ylabel):
+    def __init__(self, dates, values, title, ylabel, smoothed=None):
         self.dates = dates
         self.values = values
         self.title = title
         self.ylabel = ylabel
+        # Line name -> curve precomputed in the data stage (smooth_chart_lines)
+        self.smoothed = smoothed or {}
         self.fig = None
         self.ax = None
         
     def create_figure(self):
-        """Create figure with border"""
-        self.fig, self.ax = plt.subplots(figsize=CHART_SIZE)
+        """
+        Create figure with border (reused from the figure pool if enabled)
+        
+        Figure + Agg canvas without pyplot: no global figure state, so
+        charts can render concurrently in threads.
+        """
+        self.fig, self.ax = acquire_figure(type(self)) or new_figure()
         self.fig.patch.set_edgecolor(COLORS['border'])
         self.fig.patch.set_linewidth(BORDER_WIDTH)
         
@@ -77,7 +85,22 @@ class BaseChart:
             spine.set_linewidth(0.6)
             spine.set_alpha(0.4)
     
-    def smooth_line(self, values, color, clip_min=None, clip_max=None):
+    def smooth_samples(self):
+        """Spline samples for this figure's exported width"""
+        return sample_count(self.fig.get_figwidth() * CHART_DPI)
+    
+    def precomputed_curve(self, name):
+        """
+        Precomputed curve of a line (None: compute it when drawing)
+        
+        Curves sampled for another width than this figure's are ignored.
+        """
+        curve = self.smoothed.get(name)
+        if curve is not None and len(curve[0]) != self.smooth_samples():
+            return None
+        return curve
+    
+    def smooth_line(self, values, color, clip_min=None, clip_max=None, smoothed=None):
         """
         Create BOLD smooth line using spline interpolation with HIGH zorder
         
@@ -86,38 +109,42 @@ class BaseChart:
             color: Line color
             clip_min: Minimum value for clipping (optional)
             clip_max: Maximum value for clipping (optional)
+            smoothed: Precomputed (x_smooth, y_smooth) from utils.smoothing
+                (optional, computed here if None)
         """
         n_points = len(values)
         x_data = np.arange(n_points)
         
-        if n_points > 3:
-            x_smooth = np.linspace(0, n_points - 1, 300)
-            try:
-                spl = make_interp_spline(x_data, values, k=3)
-                values_smooth = spl(x_smooth)
-                
-                # Apply clipping if specified
-                if clip_min is not None:
-                    values_smooth = np.maximum(values_smooth, clip_min)
-                if clip_max is not None:
-                    values_smooth = np.minimum(values_smooth, clip_max)
-                
-                # BOLD line with HIGH zorder (always on top)
-                self.ax.plot(x_smooth, values_smooth, color=color, 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
-            except:
-                self.ax.plot(x_data, values, color=color, 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
+        if smoothed is None:
+            smoothed = smooth_series(x_data, values, self.smooth_samples())
+        
+        if smoothed is not None:
+            x_smooth, values_smooth = smoothed
+            
+            # Apply clipping if specified
+            if clip_min is not None:
+                values_smooth = np.maximum(values_smooth, clip_min)
+            if clip_max is not None:
+                values_smooth = np.minimum(values_smooth, clip_max)
+            
+            # BOLD line with HIGH zorder (always on top)
+            self.ax.plot(x_smooth, values_smooth, color=color, 
+                       linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
         else:
+            # Too few points (or not finite): straight segments
             self.ax.plot(x_data, values, color=color, 
                        linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
     
     def save_to_stream(self):
         """Save chart to BytesIO stream"""
-        plt.tight_layout()
+        if fixed_layout_enabled():
+            # Cached margins + crop box: the figure is drawn once
+            bbox_inches = apply_fixed_layout(self.fig, type(self))
+        else:
+            self.fig.tight_layout()
+            bbox_inches = 'tight'
         img_stream = BytesIO()
-        plt.savefig(img_stream, format='png', dpi=150, bbox_inches='tight', 
-                   facecolor=COLORS['background'])
+        self.fig.savefig(img_stream, format='png', dpi=CHART_DPI, bbox_inches=bbox_inches, 
+                         facecolor=COLORS['background'])
         img_stream.seek(0)
-        plt.close()
         return img_stream
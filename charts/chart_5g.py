@@ -4,7 +4,8 @@
 import matplotlib.dates as mdates
 import numpy as np
 import pandas as pd  # ADD THIS IMPORT
-from scipy.interpolate import make_interp_spline
+from utils.smoothing import smooth_series, smooth_many
+from utils.data_processor import positive_points
 from .base_chart import BaseChart
 from config import COLORS, LINE_WIDTH_BOLD
 
@@ -20,7 +21,7 @@ class AvailabilityChart5G(BaseChart):
         values_chart = self.values * 100
         
         # Plot BOLD smooth line (style update only)
-        self.smooth_line(values_chart, COLORS['primary'])
+        self.smooth_line(values_chart, COLORS['primary'], smoothed=self.precomputed_curve('values'))
         
         # Custom y-axis: 99.00 to 100.20 with interval 0.20 - UNCHANGED
         self.ax.set_ylim(99.00, 100.20)
@@ -42,7 +43,8 @@ class CDRChart5G(BaseChart):
         values_chart = self.values * 100
         
         # Plot BOLD smooth line with clipping to min=0
-        self.smooth_line(values_chart, COLORS['primary'], clip_min=0)
+        self.smooth_line(values_chart, COLORS['primary'], clip_min=0,
+                         smoothed=self.precomputed_curve('values'))
         
         # Custom y-axis: 0.000% to 0.016% with interval 0.002%
         self.ax.set_ylim(0, 0.016)
@@ -70,7 +72,7 @@ class SgnbSRChart5G(BaseChart):
         values_chart = self.values * 100
         
         # Plot BOLD smooth line
-        self.smooth_line(values_chart, COLORS['primary'])
+        self.smooth_line(values_chart, COLORS['primary'], smoothed=self.precomputed_curve('values'))
         
         # Custom y-axis: 99.00% to 100.20% with interval 0.20% (SAME AS AVAILABILITY)
         self.ax.set_ylim(99.00, 100.20)
@@ -90,8 +92,8 @@ class LineChart5G(BaseChart):
     """Standard line chart for 5G metrics"""
     
     def __init__(self, dates, values, title, ylabel, ylim=None, ytick_format=None, 
-                 color=None, hide_top_label=False):
-        super().__init__(dates, values, title, ylabel)
+                 color=None, hide_top_label=False, smoothed=None):
+        super().__init__(dates, values, title, ylabel, smoothed=smoothed)
         self.ylim = ylim
         self.ytick_format = ytick_format
         self.color = color or COLORS['primary']
@@ -102,11 +104,12 @@ class LineChart5G(BaseChart):
         self.create_figure()
         
         # Plot BOLD smooth line with clipping if ylim is set
+        smoothed = self.precomputed_curve('values')
         if self.ylim:
             self.smooth_line(self.values, self.color, 
-                           clip_min=self.ylim[0], clip_max=self.ylim[1])
+                           clip_min=self.ylim[0], clip_max=self.ylim[1], smoothed=smoothed)
         else:
-            self.smooth_line(self.values, self.color)
+            self.smooth_line(self.values, self.color, smoothed=smoothed)
         
         if self.ylim:
             self.ax.set_ylim(self.ylim)
@@ -179,8 +182,8 @@ class DualLineChart5G(BaseChart):
     """Dual line chart for comparison"""
     
     def __init__(self, dates, values1, values2, title, ylabel, label1, label2, 
-                 color1=None, color2=None):
-        super().__init__(dates, values1, title, ylabel)
+                 color1=None, color2=None, smoothed=None):
+        super().__init__(dates, values1, title, ylabel, smoothed=smoothed)
         self.values2 = values2
         self.label1 = label1
         self.label2 = label2
@@ -191,27 +194,21 @@ class DualLineChart5G(BaseChart):
         """Create BOLD dual line chart"""
         self.create_figure()
         
-        # Smooth both lines with BOLD width
-        self.smooth_line(self.values, self.color1)
+        # Smooth both lines with BOLD width (one batched fit when they align)
+        samples = self.smooth_samples()
+        smoothed = [self.precomputed_curve('values'), self.precomputed_curve('values2')]
+        if any(curve is None for curve in smoothed) and len(self.values) == len(self.values2):
+            smoothed = smooth_many(np.arange(len(self.values)), [self.values, self.values2], samples)
+        
+        self.smooth_line(self.values, self.color1, smoothed=smoothed[0])
         self.ax.plot([], [], color=self.color1, linewidth=LINE_WIDTH_BOLD, label=self.label1)
         
         # Second line
-        n_points = len(self.values2)
-        x_data = np.arange(n_points)
-        
-        if n_points > 3:
-            x_smooth = np.linspace(0, n_points - 1, 300)
-            try:
-                spl = make_interp_spline(x_data, self.values2, k=3)
-                values_smooth = spl(x_smooth)
-                self.ax.plot(x_smooth, values_smooth, color=self.color2, 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20)
-            except:
-                self.ax.plot(x_data, self.values2, color=self.color2, 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20)
-        else:
-            self.ax.plot(x_data, self.values2, color=self.color2, 
-                       linewidth=LINE_WIDTH_BOLD, zorder=20)
+        x_data = np.arange(len(self.values2))
+        line2 = smoothed[1] or smooth_series(x_data, self.values2, samples)
+        if line2 is None:
+            line2 = (x_data, self.values2)
+        self.ax.plot(*line2, color=self.color2, linewidth=LINE_WIDTH_BOLD, zorder=20)
         
         self.ax.plot([], [], color=self.color2, linewidth=LINE_WIDTH_BOLD, label=self.label2)
         
@@ -284,8 +281,8 @@ class TrafficChart5G(BaseChart):
 class EUTThpChart5G(BaseChart):
     """EUT vs DL User Thp chart for 5G (Dual Line)"""
     
-    def __init__(self, dates, eut_values, thp_values, title, ylabel):
-        super().__init__(dates, eut_values, title, ylabel)
+    def __init__(self, dates, eut_values, thp_values, title, ylabel, smoothed=None):
+        super().__init__(dates, eut_values, title, ylabel, smoothed=smoothed)
         self.thp_values = thp_values
     
     def create(self):
@@ -295,44 +292,24 @@ class EUTThpChart5G(BaseChart):
         n_points = len(self.dates)
         x_data = np.arange(n_points)
         
+        samples = self.smooth_samples()
+        
         # Line 2 (Thp - PRIMARY, orange) - plot first so it's behind
-        if n_points > 3:
-            x_smooth = np.linspace(0, n_points - 1, 300)
-            try:
-                from scipy.interpolate import make_interp_spline
-                spl2 = make_interp_spline(x_data, self.thp_values, k=3)
-                values_smooth2 = spl2(x_smooth)
-                self.ax.plot(x_smooth, values_smooth2, color='#ff7f0e', 
-                           linewidth=LINE_WIDTH_BOLD, zorder=19, solid_capstyle='round')
-            except:
-                self.ax.plot(x_data, self.thp_values, color='#ff7f0e', 
-                           linewidth=LINE_WIDTH_BOLD, zorder=19, solid_capstyle='round')
-        else:
-            self.ax.plot(x_data, self.thp_values, color='#ff7f0e', 
-                       linewidth=LINE_WIDTH_BOLD, zorder=19, solid_capstyle='round')
+        line2 = self.precomputed_curve('thp_values') or smooth_series(x_data, self.thp_values, samples)
+        if line2 is None:
+            line2 = (x_data, self.thp_values)
+        self.ax.plot(*line2, color='#ff7f0e', 
+                   linewidth=LINE_WIDTH_BOLD, zorder=19, solid_capstyle='round')
         
         # Line 1 (EUT - FOLLOWS index, blue) - only where data exists
-        # Mask for valid EUT data
-        eut_mask = (pd.Series(self.values).notna()) & (pd.Series(self.values) > 0)
-        eut_indices = np.where(eut_mask)[0]
+        eut_x, eut_y = positive_points(self.values)
         
-        if len(eut_indices) > 0:
-            eut_x = x_data[eut_indices]
-            eut_y = self.values[eut_indices]
-            
-            if len(eut_indices) > 3:
-                x_smooth_eut = np.linspace(eut_x.min(), eut_x.max(), 300)
-                try:
-                    spl1 = make_interp_spline(eut_x, eut_y, k=3)
-                    values_smooth1 = spl1(x_smooth_eut)
-                    self.ax.plot(x_smooth_eut, values_smooth1, color='#1f77b4', 
-                               linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
-                except:
-                    self.ax.plot(eut_x, eut_y, color='#1f77b4', 
-                               linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
-            else:
-                self.ax.plot(eut_x, eut_y, color='#1f77b4', 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
+        if len(eut_x) > 0:
+            line1 = self.precomputed_curve('values') or smooth_series(eut_x, eut_y, samples)
+            if line1 is None:
+                line1 = (eut_x, eut_y)
+            self.ax.plot(*line1, color='#1f77b4', 
+                       linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
         
         # Legend
         self.ax.plot([], [], color='#1f77b4', linewidth=LINE_WIDTH_BOLD, label='g5_eut_bhv')
@@ -385,8 +362,9 @@ class User5GChart(BaseChart):
 class PRBUtilChart5G(BaseChart):
     """PRB Util chart for 5G (Line + Bar with Dual Y-Axis)"""
     
-    def __init__(self, dates, prb_util_values, cells_count_values, title, ylabel_left, ylabel_right):
-        super().__init__(dates, prb_util_values, title, ylabel_left)
+    def __init__(self, dates, prb_util_values, cells_count_values, title, ylabel_left, ylabel_right,
+                 smoothed=None):
+        super().__init__(dates, prb_util_values, title, ylabel_left, smoothed=smoothed)
         self.cells_count_values = cells_count_values
         self.ylabel_right = ylabel_right
     
@@ -404,20 +382,12 @@ class PRBUtilChart5G(BaseChart):
         values_line = self.values * 100
         
         # Plot BOLD smooth line on left Y-axis
-        if n_points > 3:
-            x_smooth = np.linspace(0, n_points - 1, 300)
-            try:
-                from scipy.interpolate import make_interp_spline
-                spl = make_interp_spline(x_data, values_line, k=3)
-                values_smooth = spl(x_smooth)
-                self.ax.plot(x_smooth, values_smooth, color='#1f77b4', 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
-            except:
-                self.ax.plot(x_data, values_line, color='#1f77b4', 
-                           linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
-        else:
-            self.ax.plot(x_data, values_line, color='#1f77b4', 
-                       linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
+        line = (self.precomputed_curve('values') or
+                smooth_series(x_data, values_line, self.smooth_samples()))
+        if line is None:
+            line = (x_data, values_line)
+        self.ax.plot(*line, color='#1f77b4', 
+                   linewidth=LINE_WIDTH_BOLD, zorder=20, solid_capstyle='round')
         
         # RIGHT Y-AXIS: Bar chart (Cells count) - VERY TRANSPARENT
         bar_mask = (pd.Series(self.cells_count_values).notna()) & (pd.Series(self.cells_count_values) > 0)
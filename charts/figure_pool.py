@@ -0,0 +1,122 @@
+"""
+Figure/Axes pool: charts of the same class reuse one pre-built figure
+
+Off by default. When enabled, BaseChart.create_figure takes the figure of
+its chart class from the pool instead of building a new one; only the
+artists, ticks and layout are reset between renders (Axes.cla, extra axes
+such as twinx removed, subplot parameters restored), so the PNG is
+pixel-identical to a fresh figure.
+
+The pool is per thread (and so per worker process).
+
+    with figure_pool():
+        png = AvailabilityChart5G(...).create()
+"""
+import threading
+from contextlib import contextmanager
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from config import CHART_SIZE
+
+# Subplot parameters restored on reuse (tight_layout changes them)
+SUBPLOT_PARAMS = ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')
+
+_local = threading.local()
+_enabled = False
+
+def new_figure():
+    """
+    Build a chart figure without pyplot (no global state, thread-safe)
+
+    Returns:
+        tuple: (Figure with an Agg canvas, its Axes)
+    """
+    fig = Figure(figsize=CHART_SIZE)
+    FigureCanvasAgg(fig)
+    return fig, fig.add_subplot()
+
+class PooledFigure:
+    """One reusable figure with its main axes and their initial state"""
+
+    def __init__(self):
+        self.fig, self.ax = new_figure()
+        self.subplot_params = {name: getattr(self.fig.subplotpars, name) for name in SUBPLOT_PARAMS}
+        # Spine styling is not reset by Axes.cla()
+        self.spines = {
+            name: (spine.get_edgecolor(), spine.get_linewidth(), spine.get_alpha(), spine.get_visible())
+            for name, spine in self.ax.spines.items()
+        }
+
+    def reset(self):
+        """Back to the state of a freshly built figure"""
+        fig, ax = self.fig, self.ax
+
+        # Extra axes (twinx) and figure-level artists
+        for other in fig.axes:
+            if other is not ax:
+                other.remove()
+        fig.legends.clear()
+        fig.texts.clear()
+
+        ax.cla()
+        for name, (edgecolor, linewidth, alpha, visible) in self.spines.items():
+            spine = ax.spines[name]
+            spine.set_edgecolor(edgecolor)
+            spine.set_linewidth(linewidth)
+            spine.set_alpha(alpha)
+            spine.set_visible(visible)
+
+        fig.set_layout_engine('none')
+        fig.subplots_adjust(**self.subplot_params)
+
+def pool_enabled():
+    """True if create_figure takes figures from the pool"""
+    return _enabled
+
+def set_figure_pool(enabled=True):
+    """Turn the figure pool on or off for this process"""
+    global _enabled
+    _enabled = enabled
+    if not enabled:
+        clear_figure_pool()
+
+@contextmanager
+def figure_pool(enabled=True):
+    """Enable the figure pool inside the block (figures dropped afterwards)"""
+    global _enabled
+    previous = _enabled
+    _enabled = enabled
+    try:
+        yield
+    finally:
+        _enabled = previous
+        if not previous:
+            clear_figure_pool()
+
+def acquire_figure(key):
+    """
+    Get the pooled figure of a chart class, reset for a new render
+
+    Args:
+        key: Chart class (one figure per class)
+
+    Returns:
+        tuple: (Figure, Axes), or None if the pool is disabled
+    """
+    if not _enabled:
+        return None
+
+    figures = getattr(_local, 'figures', None)
+    if figures is None:
+        figures = _local.figures = {}
+
+    pooled = figures.get(key)
+    if pooled is None:
+        pooled = figures[key] = PooledFigure()
+    else:
+        pooled.reset()
+    return pooled.fig, pooled.ax
+
+def clear_figure_pool():
+    """Drop this thread's pooled figures"""
+    _local.figures = {}
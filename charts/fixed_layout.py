@@ -0,0 +1,120 @@
+"""
+Fixed-layout export: one draw per chart instead of three layout passes
+
+The default export runs tight_layout() and then savefig(bbox_inches='tight'),
+which lays the figure out (and traverses every artist) several times before
+the final raster. In fixed-layout mode the subplot margins and the crop box
+are computed once per layout key and reused, so each figure is drawn exactly
+once. The layout key covers everything that moves the margins or the crop:
+chart class, titles and axis labels, tick label lengths of every axes (twin
+axes included, e.g. PRBUtilChart5G) and legends.
+
+The crop box is the same one bbox_inches='tight' would compute, so PNG
+dimensions match the default export. Off by default (PNGs are close to,
+not byte-identical with, the default export).
+
+    with fixed_layout():
+        png = PRBUtilChart5G(...).create()
+"""
+import threading
+from contextlib import contextmanager
+import matplotlib as mpl
+from config import CHART_DPI
+
+_enabled = False
+# Layout key -> (subplot parameters, crop Bbox in inches)
+_layouts = {}
+_layouts_lock = threading.Lock()
+
+def fixed_layout_enabled():
+    """True if charts are exported with cached layouts"""
+    return _enabled
+
+def set_fixed_layout(enabled=True):
+    """Turn fixed-layout export on or off for this process"""
+    global _enabled
+    _enabled = enabled
+
+@contextmanager
+def fixed_layout(enabled=True):
+    """Enable fixed-layout export inside the block"""
+    global _enabled
+    previous = _enabled
+    _enabled = enabled
+    try:
+        yield
+    finally:
+        _enabled = previous
+
+def label_lengths(labels):
+    """Longest tick label (characters)"""
+    return max((len(label.get_text()) for label in labels), default=0)
+
+def layout_key(fig, chart_class):
+    """
+    Everything in a chart that changes its tight margins or crop box
+
+    Tick labels are compared by length: the chart fonts draw digits with
+    equal widths.
+    """
+    axes = []
+    for ax in fig.axes:
+        legend = ax.get_legend()
+        axes.append((
+            ax.get_title(), ax.get_xlabel(), ax.get_ylabel(),
+            label_lengths(ax.get_xticklabels()),
+            label_lengths(ax.get_yticklabels()),
+            None if legend is None else tuple(text.get_text() for text in legend.get_texts())
+        ))
+    return (chart_class.__module__, chart_class.__qualname__, tuple(axes))
+
+def compute_layout(fig):
+    """
+    tight_layout() margins and the bbox_inches='tight' crop box of fig
+
+    Returns:
+        tuple: (subplot parameters, Bbox in inches)
+    """
+    fig.tight_layout()
+    fig.set_layout_engine('none')
+    params = {name: getattr(fig.subplotpars, name)
+              for name in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
+
+    # Crop box as savefig computes it: at the export dpi, after a layout pass
+    original_dpi = fig.dpi
+    fig.set_dpi(CHART_DPI)
+    try:
+        renderer = fig.canvas.get_renderer()
+        fig.draw_without_rendering()
+        bbox = fig.get_tightbbox(renderer).padded(mpl.rcParams['savefig.pad_inches'])
+    finally:
+        fig.set_dpi(original_dpi)
+    return params, bbox
+
+def apply_fixed_layout(fig, chart_class):
+    """
+    Set the cached margins of fig (computed on first use of its key)
+
+    Args:
+        fig: Chart figure, fully built
+        chart_class: Chart class (part of the layout key)
+
+    Returns:
+        Bbox: Crop box to pass to savefig(bbox_inches=...)
+    """
+    key = layout_key(fig, chart_class)
+    layout = _layouts.get(key)
+    if layout is None:
+        layout = compute_layout(fig)
+        with _layouts_lock:
+            _layouts[key] = layout
+        return layout[1]
+
+    params, bbox = layout
+    fig.subplots_adjust(**params)
+    return bbox
+
+def clear_layouts():
+    """Forget every cached layout"""
+    with _layouts_lock:
+        _layouts.clear()
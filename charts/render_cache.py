@@ -0,0 +1,188 @@
+"""
+Content-addressed PNG render cache
+
+A chart is identified by a hash of everything that changes its pixels:
+chart class, input arrays and arguments (title, ylim, labels, colors...),
+chart style constants (CHART_SIZE, COLORS, dpi...) and the source of the
+chart/style modules. On a hit the stored PNG bytes are returned without
+drawing anything.
+
+Layout (one file per rendered chart, LRU by file mtime):
+
+    <cache_dir>/
+        3f5a...e1.png
+        9c0b...42.png
+"""
+import hashlib
+import inspect
+import os
+import sys
+import numpy as np
+import pandas as pd
+import matplotlib
+from config import (
+    CACHE_CONFIG, COLORS, CHART_SIZE, CHART_DPI,
+    BORDER_WIDTH, LINE_WIDTH, LINE_WIDTH_BOLD
+)
+
+# Bump to invalidate every cached PNG
+CACHE_VERSION = 1
+
+_source_hashes = {}
+
+def style_signature():
+    """Chart style parameters that affect every rendered chart"""
+    return (
+        CACHE_VERSION, matplotlib.__version__,
+        sorted(COLORS.items()), CHART_SIZE, CHART_DPI,
+        BORDER_WIDTH, LINE_WIDTH, LINE_WIDTH_BOLD
+    )
+
+def source_hash(module_name):
+    """Hash of a module's source file (a code change invalidates its charts)"""
+    if module_name not in _source_hashes:
+        module = sys.modules.get(module_name)
+        try:
+            with open(inspect.getsourcefile(module), 'rb') as f:
+                _source_hashes[module_name] = hashlib.sha256(f.read()).hexdigest()
+        except (TypeError, OSError):
+            _source_hashes[module_name] = module_name
+    return _source_hashes[module_name]
+
+def update_hash(h, obj):
+    """
+    Feed an argument into the hash (arrays by content, not by identity)
+
+    Args:
+        h: hashlib object
+        obj: Chart argument (Series, ndarray, scalar, list, dict...)
+    """
+    if isinstance(obj, pd.Series):
+        h.update(b'series')
+        update_hash(h, obj.index.to_numpy())
+        update_hash(h, obj.to_numpy())
+    elif isinstance(obj, pd.DataFrame):
+        h.update(b'frame')
+        update_hash(h, list(obj.columns))
+        update_hash(h, obj.index.to_numpy())
+        for column in obj.columns:
+            update_hash(h, obj[column].to_numpy())
+    elif isinstance(obj, np.ndarray):
+        h.update(f'ndarray:{obj.dtype.str}:{obj.shape}'.encode())
+        if obj.dtype == object:
+            h.update(repr(obj.tolist()).encode())
+        else:
+            h.update(np.ascontiguousarray(obj).tobytes())
+    elif isinstance(obj, (list, tuple)):
+        h.update(f'{type(obj).__name__}:{len(obj)}'.encode())
+        for item in obj:
+            update_hash(h, item)
+    elif isinstance(obj, dict):
+        h.update(f'dict:{len(obj)}'.encode())
+        for key in sorted(obj, key=repr):
+            update_hash(h, key)
+            update_hash(h, obj[key])
+    elif isinstance(obj, type):
+        h.update(f'class:{obj.__module__}.{obj.__qualname__}'.encode())
+    else:
+        # Scalars (str, int, float, None, Timestamp, np.float64...)
+        h.update(f'{type(obj).__name__}:{obj!r}'.encode())
+    h.update(b';')
+
+def job_key(job):
+    """
+    Cache key of a ChartJob
+
+    Returns:
+        str: sha256 hex digest
+    """
+    chart_class = job.chart_class
+    h = hashlib.sha256()
+    update_hash(h, style_signature())
+
+    # Chart code: class module + every base class module (BaseChart...)
+    for klass in chart_class.__mro__:
+        if klass is not object:
+            h.update(source_hash(klass.__module__).encode())
+    h.update(source_hash('config.chart_styles').encode())
+
+    update_hash(h, chart_class)
+    update_hash(h, job.args)
+    update_hash(h, job.kwargs)
+    return h.hexdigest()
+
+class RenderCache:
+    """On-disk cache of rendered chart PNGs with LRU eviction"""
+
+    def __init__(self, cache_dir=None, max_bytes=None):
+        self.cache_dir = cache_dir or CACHE_CONFIG['render_cache_dir']
+        if max_bytes is None:
+            max_bytes = CACHE_CONFIG['render_cache_max_mb'] * 1024 * 1024
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+    def path(self, key):
+        """PNG file of one cache key"""
+        return os.path.join(self.cache_dir, f'{key}.png')
+
+    def get(self, key):
+        """
+        Get cached PNG bytes
+
+        Returns:
+            bytes: PNG, or None on a miss
+        """
+        path = self.path(key)
+        try:
+            with open(path, 'rb') as f:
+                png = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+
+        # Mark as recently used
+        os.utime(path)
+        self.hits += 1
+        return png
+
+    def put(self, key, png):
+        """Store PNG bytes, then evict least recently used files over the cap"""
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self.path(key)
+        tmp_path = f'{path}.{os.getpid()}.tmp'
+        with open(tmp_path, 'wb') as f:
+            f.write(png)
+        os.replace(tmp_path, path)
+        self.evict()
+
+    def evict(self):
+        """Remove least recently used PNGs until the cache fits max_bytes"""
+        entries = []
+        total = 0
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith('.png'):
+                continue
+            stat = entry.stat()
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+            total += stat.st_size
+
+        if total <= self.max_bytes:
+            return
+
+        for _, size, path in sorted(entries):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    def clear(self):
+        """Remove every cached PNG"""
+        if not os.path.isdir(self.cache_dir):
+            return
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.png'):
+                os.remove(entry.path)
@@ -0,0 +1,153 @@
+"""
+Chart rendering scheduler
+
+Charts are described as ChartJob (chart class + constructor arguments)
+and rendered either in-process (one at a time), on a pool of worker
+processes with matplotlib already imported and styled, or on a pool of
+threads (charts draw on their own Figure + Agg canvas, no pyplot state,
+so a long-lived service process can render concurrently without forking).
+An optional RenderCache skips charts whose PNG is already on disk.
+"""
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from io import BytesIO
+from utils.instrumentation import stage
+from .render_cache import job_key
+from .figure_pool import pool_enabled, set_figure_pool
+from .fixed_layout import fixed_layout_enabled, set_fixed_layout
+
+class ChartJob:
+    """One chart to render: chart class + its constructor arguments"""
+
+    def __init__(self, chart_class, *args, **kwargs):
+        self.chart_class = chart_class
+        self.args = args
+        self.kwargs = kwargs
+
+    def create(self):
+        """Render the chart, returns BytesIO (PNG)"""
+        return self.chart_class(*self.args, **self.kwargs).create()
+
+    def __repr__(self):
+        return f'ChartJob({self.chart_class.__name__})'
+
+def init_worker(use_figure_pool=False, use_fixed_layout=False):
+    """Pool initializer: pre-import matplotlib (Agg) and apply chart styles"""
+    import matplotlib.backends.backend_agg  # noqa: F401 (pre-import)
+    from config import apply_chart_styles
+    apply_chart_styles()
+    # Each worker keeps its own pooled figures and layout cache
+    set_figure_pool(use_figure_pool)
+    set_fixed_layout(use_fixed_layout)
+
+def render_job(job):
+    """Worker entry point: render one job, returns PNG bytes"""
+    return job.create().getvalue()
+
+def create_render_pool(processes=None, use_figure_pool=None, use_fixed_layout=None):
+    """
+    Create a pool of chart rendering worker processes
+
+    Args:
+        processes (int): Number of worker processes (default: CPU count)
+        use_figure_pool (bool): Workers reuse figures per chart class
+            (charts.figure_pool), default: same as this process
+        use_fixed_layout (bool): Workers export with cached layouts
+            (charts.fixed_layout), default: same as this process
+
+    Returns:
+        ProcessPoolExecutor: Pool to pass to render_jobs (caller shuts it down)
+    """
+    if use_figure_pool is None:
+        use_figure_pool = pool_enabled()
+    if use_fixed_layout is None:
+        use_fixed_layout = fixed_layout_enabled()
+    return ProcessPoolExecutor(max_workers=processes, initializer=init_worker,
+                               initargs=(use_figure_pool, use_fixed_layout))
+
+def create_thread_render_pool(threads=None):
+    """
+    Create a pool of chart rendering threads (no fork, no pickling)
+
+    Chart styles must already be applied in this process
+    (config.apply_chart_styles).
+
+    Args:
+        threads (int): Number of threads (default: ThreadPoolExecutor default)
+
+    Returns:
+        ThreadPoolExecutor: Pool to pass to render_jobs (caller shuts it down)
+    """
+    return ThreadPoolExecutor(max_workers=threads, thread_name_prefix='chart-render')
+
+@contextmanager
+def render_pool(processes=None, use_figure_pool=None, threads=None, use_fixed_layout=None):
+    """
+    Context manager: worker pool shared by several render_jobs calls
+
+    Yields a process pool if processes > 1, else a thread pool if
+    threads > 1, else None (render in-process one at a time).
+    """
+    if processes is not None and processes > 1:
+        with create_render_pool(processes, use_figure_pool, use_fixed_layout) as executor:
+            yield executor
+    elif threads is not None and threads > 1:
+        with create_thread_render_pool(threads) as executor:
+            yield executor
+    else:
+        yield None
+
+def stage_label(name):
+    """Chart name for the run report ('Weekly/5g/cdr' for tuple keys)"""
+    return '/'.join(name) if isinstance(name, tuple) else name
+
+def render_jobs(jobs, processes=None, executor=None, cache=None, threads=None):
+    """
+    Render chart jobs, results in the same order as the jobs
+
+    Args:
+        jobs (dict): Chart name -> ChartJob
+        processes (int): None/1 renders in-process one at a time, N > 1
+            renders on a temporary pool of N worker processes
+        executor: Existing pool from create_render_pool or
+            create_thread_render_pool (takes precedence)
+        cache (RenderCache): PNG cache, only charts not in the cache are
+            rendered (None: always render)
+        threads (int): N > 1 renders on a temporary pool of N threads
+            (when processes is None/1)
+
+    Returns:
+        dict: Chart name -> BytesIO (PNG)
+    """
+    pngs = {}
+    keys = {}
+
+    if cache is not None:
+        for name, job in jobs.items():
+            keys[name] = job_key(job)
+            png = cache.get(keys[name])
+            if png is not None:
+                pngs[name] = png
+
+    todo = [name for name in jobs if name not in pngs]
+
+    if executor is not None or not todo:
+        pool_context = nullcontext(executor)
+    else:
+        pool_context = render_pool(processes, threads=threads)
+
+    with pool_context as pool:
+        if pool is None:
+            for name in todo:
+                with stage(f'chart:{stage_label(name)}'):
+                    pngs[name] = render_job(jobs[name])
+        else:
+            with stage(f'render_pool:{len(todo)} charts'):
+                pngs.update(zip(todo, pool.map(render_job, [jobs[name] for name in todo])))
+
+    if cache is not None:
+        for name in todo:
+            cache.put(keys[name], pngs[name])
+        print(f"Render cache: {len(jobs) - len(todo)} hit(s), {len(todo)} rendered")
+
+    return {name: BytesIO(pngs[name]) for name in jobs}
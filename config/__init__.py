@@ -1,11 +1,13 @@
 """
 Configuration module
 """
-from .database import DB_CONFIG
+from .database import DB_CONFIG, POOL_CONFIG, FETCH_CONFIG
+from .cache import CACHE_CONFIG
 from .chart_styles import (
     apply_chart_styles, 
     COLORS, 
     CHART_SIZE, 
+    CHART_DPI, 
     BORDER_WIDTH, 
     LINE_WIDTH, 
     LINE_WIDTH_BOLD  # Add this
@@ -13,9 +15,13 @@ from .chart_styles import (
 
 __all__ = [
     'DB_CONFIG', 
+    'POOL_CONFIG', 
+    'FETCH_CONFIG', 
+    'CACHE_CONFIG',
     'apply_chart_styles', 
     'COLORS', 
     'CHART_SIZE', 
+    'CHART_DPI', 
     'BORDER_WIDTH', 
     'LINE_WIDTH', 
     'LINE_WIDTH_BOLD'  # Add this
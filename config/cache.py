@@ -0,0 +1,21 @@
+"""
+Local data cache configuration
+"""
+import os
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CACHE_CONFIG = {
+    # One sub-directory per date_column, one .npy file per column
+    'cache_dir': os.path.join(PROJECT_ROOT, '.cache', 'cluster_5g'),
+    # Re-fetch this many days before the newest cached date (late-arriving rows)
+    'lookback_days': 3,
+    # Persisted daily rollup, one SQLite file per source (data.RollupStore)
+    'rollup_dir': os.path.join(PROJECT_ROOT, '.cache', 'rollup'),
+    # Serve from cache only, never connect to the database (KPI_CACHE_OFFLINE=1)
+    'offline': os.environ.get('KPI_CACHE_OFFLINE', '0') == '1',
+    # Rendered chart PNGs, one file per content hash (charts.RenderCache)
+    'render_cache_dir': os.path.join(PROJECT_ROOT, '.cache', 'charts'),
+    # Least recently used PNGs are evicted above this size
+    'render_cache_max_mb': 200
+}
@@ -1,45 +1,45 @@
 """
 Chart styling configuration
 """
-import matplotlib.pyplot as plt
+import matplotlib as mpl
 
 def apply_chart_styles():
     """Apply global matplotlib styling with transparent grid and bold lines"""
-    plt.rcParams['font.size'] = 9
-    plt.rcParams['axes.titlesize'] = 10
-    plt.rcParams['axes.labelsize'] = 8
-    plt.rcParams['xtick.labelsize'] = 7
-    plt.rcParams['ytick.labelsize'] = 7
-    plt.rcParams['legend.fontsize'] = 7
-    plt.rcParams['figure.autolayout'] = False
+    mpl.rcParams['font.size'] = 9
+    mpl.rcParams['axes.titlesize'] = 10
+    mpl.rcParams['axes.labelsize'] = 8
+    mpl.rcParams['xtick.labelsize'] = 7
+    mpl.rcParams['ytick.labelsize'] = 7
+    mpl.rcParams['legend.fontsize'] = 7
+    mpl.rcParams['figure.autolayout'] = False
     
     # TRANSPARENT grid for better line visibility
-    plt.rcParams['grid.alpha'] = 0.15  # Very transparent
-    plt.rcParams['grid.linewidth'] = 0.5
-    plt.rcParams['grid.linestyle'] = '--'
-    plt.rcParams['grid.color'] = 'lightgray'
+    mpl.rcParams['grid.alpha'] = 0.15  # Very transparent
+    mpl.rcParams['grid.linewidth'] = 0.5
+    mpl.rcParams['grid.linestyle'] = '--'
+    mpl.rcParams['grid.color'] = 'lightgray'
     
     # THIN and TRANSPARENT tick marks
-    plt.rcParams['xtick.major.width'] = 0.5
-    plt.rcParams['ytick.major.width'] = 0.5
-    plt.rcParams['xtick.minor.width'] = 0.4
-    plt.rcParams['ytick.minor.width'] = 0.4
-    plt.rcParams['xtick.major.size'] = 3
-    plt.rcParams['ytick.major.size'] = 3
-    plt.rcParams['xtick.color'] = 'gray'
-    plt.rcParams['ytick.color'] = 'gray'
-    plt.rcParams['xtick.direction'] = 'out'
-    plt.rcParams['ytick.direction'] = 'out'
+    mpl.rcParams['xtick.major.width'] = 0.5
+    mpl.rcParams['ytick.major.width'] = 0.5
+    mpl.rcParams['xtick.minor.width'] = 0.4
+    mpl.rcParams['ytick.minor.width'] = 0.4
+    mpl.rcParams['xtick.major.size'] = 3
+    mpl.rcParams['ytick.major.size'] = 3
+    mpl.rcParams['xtick.color'] = 'gray'
+    mpl.rcParams['ytick.color'] = 'gray'
+    mpl.rcParams['xtick.direction'] = 'out'
+    mpl.rcParams['ytick.direction'] = 'out'
     
     # Backgrounds
-    plt.rcParams['figure.facecolor'] = 'white'
-    plt.rcParams['axes.facecolor'] = 'white'
-    plt.rcParams['savefig.facecolor'] = 'white'
-    plt.rcParams['savefig.transparent'] = False
+    mpl.rcParams['figure.facecolor'] = 'white'
+    mpl.rcParams['axes.facecolor'] = 'white'
+    mpl.rcParams['savefig.facecolor'] = 'white'
+    mpl.rcParams['savefig.transparent'] = False
     
     # Transparent axes
-    plt.rcParams['axes.edgecolor'] = 'gray'
-    plt.rcParams['axes.linewidth'] = 0.6
+    mpl.rcParams['axes.edgecolor'] = 'gray'
+    mpl.rcParams['axes.linewidth'] = 0.6
 
 # Chart colors
 COLORS = {
@@ -52,8 +52,9 @@ COLORS = {
 
 # Chart dimensions
 CHART_SIZE = (5, 3.5)
+CHART_DPI = 150  # PNG export resolution
 BORDER_WIDTH = 1
 LINE_WIDTH = 2  # Standard
 LINE_WIDTH_BOLD = 3.5  # Bold for better visibility
 
-__all__ = ['apply_chart_styles', 'COLORS', 'CHART_SIZE', 'BORDER_WIDTH', 'LINE_WIDTH', 'LINE_WIDTH_BOLD']
+__all__ = ['apply_chart_styles', 'COLORS', 'CHART_SIZE', 'CHART_DPI', 'BORDER_WIDTH', 'LINE_WIDTH', 'LINE_WIDTH_BOLD']
@@ -1,6 +1,7 @@
 """
 Database configuration
 """
+import os
 
 DB_CONFIG = {
     'host': '1.tcp.ap.ngrok.io',
@@ -9,3 +10,29 @@ DB_CONFIG = {
     'user': 'postgres',
     'password': 'option88'
 }
+
+# Shared connection pool (data.connection_pool)
+POOL_CONFIG = {
+    'minconn': 1,
+    'maxconn': int(os.environ.get('KPI_DB_MAXCONN', '4')),
+    # Server-side limit per statement, 0 disables
+    'statement_timeout_ms': 10 * 60 * 1000,
+    'connect_timeout': 15,
+    # Connections idle longer than this are pinged (SELECT 1) before reuse
+    'health_check_idle_s': 60
+}
+
+FETCH_CONFIG = {
+    # Where cluster_5g rows come from (data.get_data_source): 'postgres',
+    # 'sqlite:///path.db', or a .csv / .parquet file for offline runs
+    'source': os.environ.get('KPI_DATA_SOURCE', 'postgres'),
+    # How get_data_from_db reads rows: 'read_sql' (pandas, reference),
+    # 'stream' (server-side cursor, typed chunks, bounded memory),
+    # 'copy' (COPY ... TO STDOUT bulk transfer) or 'auto' (read_sql or copy
+    # depending on the estimated row count)
+    'method': os.environ.get('KPI_FETCH_METHOD', 'read_sql'),
+    # Rows per round trip of the server-side cursor ('stream')
+    'itersize': 20000,
+    # 'auto' switches to COPY from this many estimated rows on
+    'copy_min_rows': 100000
+}
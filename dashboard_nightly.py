@@ -0,0 +1,162 @@
+"""
+Auto-generate KPI Monitoring Dashboard PowerPoint - Weekly + Monthly
+Both decks from ONE fetch and ONE daily rollup (nightly job)
+Slide 1: 5G East Java
+Slide 2: 4G East Java
+Data: widest window fetched once, each deck sliced from the daily rollup
+"""
+
+from contextlib import nullcontext
+from config import apply_chart_styles
+from data import get_cached_data, get_data_source, get_stored_daily_rollup
+from generators import (
+    build_chart_jobs,
+    get_required_columns, get_column_groups, get_daily_aggregations
+)
+from charts import render_jobs, RenderCache
+from presentation import PPTBuilder
+from utils import build_daily_rollup, get_date_range_data, instrument_run
+
+# Deck name -> (days_back, slide title suffix)
+DECKS = {
+    'Weekly': (7, ' (WEEKLY)'),
+    'Monthly': (35, '')
+}
+
+def fetch_daily_rollup(days_back, aggregation='pandas', use_cache=False, source=None):
+    """
+    Fetch the widest window once and aggregate it to one row per date
+
+    Args:
+        days_back (int): Number of days to fetch from database
+        aggregation (str): 'pandas' (aggregate fetched rows), 'sql' (push-down) or
+            'store' (persisted rollup, only the newest days re-aggregated)
+        use_cache (bool): Fetch through the local columnar cache ('pandas' only)
+        source: DataSource or URI (default: env KPI_DATA_SOURCE, else PostgreSQL)
+
+    Returns:
+        pd.DataFrame: Daily rollup of every column read by the charts
+    """
+    aggregations = get_daily_aggregations()
+    source = get_data_source(source)
+
+    if aggregation == 'sql':
+        return source.fetch_daily_rollup(aggregations, days_back=days_back)
+    elif aggregation == 'store':
+        return get_stored_daily_rollup(aggregations, days_back=days_back, source=source)
+    elif aggregation == 'pandas':
+        if use_cache:
+            df = get_cached_data(days_back=days_back, columns=get_required_columns(), source=source)
+        else:
+            # PostgreSQL: 5G and 4G columns as two concurrent queries (pooled connections)
+            df = source.fetch(days_back=days_back, column_groups=get_column_groups())
+        return build_daily_rollup(df, aggregations)
+    else:
+        raise ValueError(f"Unknown aggregation mode: {aggregation}")
+
+def save_deck(name, charts_5g, charts_4g, title_suffix=''):
+    """
+    Build and save one deck from rendered charts
+
+    Args:
+        name (str): Deck name, used as filename prefix
+        charts_5g (dict): 5G chart name -> BytesIO (or ChartJob, native mode)
+        charts_4g (dict): 4G chart name -> BytesIO (or ChartJob, native mode)
+        title_suffix (str): Appended to the slide titles
+
+    Returns:
+        str: Output filename
+    """
+    print(f"[{name}] Creating PowerPoint presentation...")
+    ppt = PPTBuilder()
+    ppt.create_5g_slide(charts_5g, title=f'KPI MONITORING 5G EAST JAVA{title_suffix}')
+    ppt.create_4g_slide(charts_4g, title=f'KPI MONITORING 4G EAST JAVA{title_suffix}')
+
+    output_file = ppt.save(prefix=name)
+    print(f"[{name}] ✓ Presentation saved as: {output_file}")
+
+    return output_file
+
+def create_nightly_dashboards(decks=None, aggregation='pandas', use_cache=False, processes=None,
+                              render_cache=False, chart_mode='png', run_report=None, source=None):
+    """
+    Create weekly and monthly KPI monitoring dashboards in one run
+
+    The widest window is fetched once and aggregated per day once; each
+    deck is a slice of that shared daily rollup (same dates as fetching
+    its own days_back window).
+
+    Args:
+        decks (dict): Deck name -> (days_back, title suffix), default DECKS
+        aggregation (str): 'pandas' (aggregate fetched rows), 'sql' (push-down) or
+            'store' (persisted rollup, only the newest days re-aggregated)
+        use_cache (bool): Fetch through the local columnar cache ('pandas' only)
+        processes (int): Render the charts of ALL decks on N worker processes
+            (None: in-process)
+        render_cache (bool): Reuse the PNGs of charts whose inputs did not
+            change since a previous run (charts.RenderCache)
+        chart_mode (str): 'png' inserts matplotlib images, 'native' inserts
+            editable PowerPoint charts (no matplotlib rendering)
+        run_report (str): Record wall/CPU time and peak memory of every stage
+            (fetch, aggregators, charts, PPT) to this JSON file and print a
+            summary table (None: off)
+        source: DataSource or URI of the cluster_5g data ('postgres',
+            'sqlite:///path.db', 'path.csv', 'path.parquet'); default
+            env KPI_DATA_SOURCE, else PostgreSQL
+
+    Returns:
+        dict: Deck name -> output filename
+    """
+    with instrument_run(run_report) if run_report else nullcontext():
+        decks = decks or DECKS
+
+        # Apply chart styling
+        apply_chart_styles()
+
+        # Fetch + aggregate ONCE for the widest window
+        max_days_back = max(days_back for days_back, _ in decks.values())
+        print(f"Fetching data (widest window: {max_days_back} days)...")
+        daily = fetch_daily_rollup(max_days_back, aggregation=aggregation, use_cache=use_cache,
+                                   source=source)
+
+        # Each deck: slice of the shared daily rollup -> chart jobs
+        jobs = {}
+        for name, (days_back, _) in decks.items():
+            deck_daily, _, _ = get_date_range_data(daily, days_back=days_back)
+            print(f"\n[{name}] {len(deck_daily)} days: "
+                  f"{deck_daily['date_column'].min()} to {deck_daily['date_column'].max()}")
+
+            print(f"[{name}] Preparing 5G/4G charts...")
+            for slide, slide_jobs in build_chart_jobs(deck_daily).items():
+                for chart, job in slide_jobs.items():
+                    jobs[(name, slide, chart)] = job
+
+        if chart_mode == 'native':
+            # Chart jobs go straight to PPTBuilder as native charts
+            rendered = jobs
+        elif chart_mode == 'png':
+            # Render ALL charts of ALL decks in one batch (one worker pool)
+            print(f"\nRendering {len(jobs)} charts...")
+            rendered = render_jobs(jobs, processes=processes,
+                                   cache=RenderCache() if render_cache else None)
+        else:
+            raise ValueError(f"Unknown chart mode: {chart_mode}")
+
+        output_files = {}
+        for name, (_, title_suffix) in decks.items():
+            charts_5g = {chart: png for (deck, slide, chart), png in rendered.items()
+                         if deck == name and slide == '5g'}
+            charts_4g = {chart: png for (deck, slide, chart), png in rendered.items()
+                         if deck == name and slide == '4g'}
+            output_files[name] = save_deck(name, charts_5g, charts_4g, title_suffix)
+
+        return output_files
+
+if __name__ == "__main__":
+    try:
+        create_nightly_dashboards()
+        print("\n✓ Dashboards generated successfully!")
+    except Exception as e:
+        print(f"\n✗ Error: {e}")
+        import traceback
+        traceback.print_exc()
@@ -5,47 +5,98 @@ Slide 2: 4G East Java
 Data: Per minggu terbaru (7 hari)
 """
 
+from contextlib import nullcontext
 from config import apply_chart_styles
-from data import get_data_from_db
-from generators import generate_5g_charts, generate_4g_charts
+from data import get_cached_data, get_data_source, get_stored_daily_rollup
+from generators import (
+    build_chart_jobs, get_required_columns, get_column_groups, get_daily_aggregations
+)
+from charts import render_jobs, render_pool, RenderCache
 from presentation import PPTBuilder
+from utils import instrument_run
 
-def create_weekly_dashboard(days_back=7):
+def create_weekly_dashboard(days_back=7, aggregation='pandas', use_cache=False, processes=None,
+                            render_cache=False, chart_mode='png', run_report=None, source=None):
     """
     Create weekly KPI monitoring dashboard
     
     Args:
         days_back (int): Number of days to fetch from database
+        aggregation (str): 'pandas' fetches per-cluster rows and aggregates per day
+            in pandas (reference), 'sql' pushes the daily MAX/SUM down to the
+            database and fetches one row per date, 'store' keeps the daily
+            rollup in a local SQLite store and only re-aggregates the newest
+            days (data.get_stored_daily_rollup)
+        use_cache (bool): Fetch per-cluster rows through the local columnar
+            cache (only new dates are downloaded), 'pandas' aggregation only
+        processes (int): Render charts on N worker processes (None: in-process)
+        render_cache (bool): Reuse the PNGs of charts whose inputs did not
+            change since a previous run (charts.RenderCache)
+        chart_mode (str): 'png' inserts matplotlib images, 'native' inserts
+            editable PowerPoint charts (no matplotlib rendering)
+        run_report (str): Record wall/CPU time and peak memory of every stage
+            (fetch, aggregators, charts, PPT) to this JSON file and print a
+            summary table (None: off)
+        source: DataSource or URI of the cluster_5g data ('postgres',
+            'sqlite:///path.db', 'path.csv', 'path.parquet'); default
+            env KPI_DATA_SOURCE, else PostgreSQL
         
     Returns:
         str: Output filename
     """
-    # Apply chart styling
-    apply_chart_styles()
-    
-    # Fetch data
-    print("Fetching data from database...")
-    df = get_data_from_db(days_back=days_back)
-    print(f"Data fetched: {len(df)} records")
-    print(f"Date range: {df['date_column'].min()} to {df['date_column'].max()}")
-    
-    # Generate charts (USING SAME GENERATORS AS MONTHLY)
-    print("\nGenerating 5G charts...")
-    charts_5g = generate_5g_charts(df)
-    
-    print("Generating 4G charts...")
-    charts_4g = generate_4g_charts(df)
-    
-    # Create presentation
-    print("\nCreating PowerPoint presentation...")
-    ppt = PPTBuilder()
-    ppt.create_5g_slide(charts_5g, title='KPI MONITORING 5G EAST JAVA (WEEKLY)')
-    ppt.create_4g_slide(charts_4g, title='KPI MONITORING 4G EAST JAVA (WEEKLY)')
-    
-    output_file = ppt.save(prefix='Weekly')
-    print(f"\n✓ Presentation saved as: {output_file}")
-    
-    return output_file
+    with instrument_run(run_report) if run_report else nullcontext():
+        # Apply chart styling
+        apply_chart_styles()
+        
+        # Fetch data (only the columns used by the charts)
+        source = get_data_source(source)
+        print(f"Fetching data from {source.name}...")
+        if aggregation == 'sql':
+            df = source.fetch_daily_rollup(get_daily_aggregations(), days_back=days_back)
+        elif aggregation == 'store':
+            df = get_stored_daily_rollup(get_daily_aggregations(), days_back=days_back, source=source)
+        elif aggregation == 'pandas':
+            if use_cache:
+                df = get_cached_data(days_back=days_back, columns=get_required_columns(), source=source)
+            else:
+                # PostgreSQL: 5G and 4G columns as two concurrent queries (pooled connections)
+                df = source.fetch(days_back=days_back, column_groups=get_column_groups())
+        else:
+            raise ValueError(f"Unknown aggregation mode: {aggregation}")
+        print(f"Data fetched: {len(df)} records")
+        print(f"Date range: {df['date_column'].min()} to {df['date_column'].max()}")
+        
+        # One daily rollup + selection passes for both slides (generators/catalog.json)
+        jobs = build_chart_jobs(df)
+        
+        # Generate charts (USING SAME GENERATORS AS MONTHLY)
+        if chart_mode == 'native':
+            # Chart jobs go straight to PPTBuilder as native charts
+            print("\nPreparing native 5G/4G charts...")
+            charts_5g = jobs.get('5g', {})
+            charts_4g = jobs.get('4g', {})
+        elif chart_mode == 'png':
+            # One worker pool for both slides if processes > 1
+            cache = RenderCache() if render_cache else None
+            with render_pool(processes) as executor:
+                print("\nGenerating 5G charts...")
+                charts_5g = render_jobs(jobs.get('5g', {}), executor=executor, cache=cache)
+                
+                print("Generating 4G charts...")
+                charts_4g = render_jobs(jobs.get('4g', {}), executor=executor, cache=cache)
+        else:
+            raise ValueError(f"Unknown chart mode: {chart_mode}")
+        
+        # Create presentation
+        print("\nCreating PowerPoint presentation...")
+        ppt = PPTBuilder()
+        ppt.create_5g_slide(charts_5g, title='KPI MONITORING 5G EAST JAVA (WEEKLY)')
+        ppt.create_4g_slide(charts_4g, title='KPI MONITORING 4G EAST JAVA (WEEKLY)')
+        
+        output_file = ppt.save(prefix='Weekly')
+        print(f"\n✓ Presentation saved as: {output_file}")
+        
+        return output_file
 
 if __name__ == "__main__":
     try:
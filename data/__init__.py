@@ -1,6 +1,15 @@
 """
 Data module
 """
-from .data_fetcher import get_data_from_db
+from .data_fetcher import get_data_from_db, get_daily_rollup_from_db
+from .sources import DataSource, PostgresSource, SQLiteSource, FileSource, get_data_source
+from .cache import ColumnarCache, get_cached_data
+from .rollup_store import RollupStore, get_stored_daily_rollup
+from .connection_pool import pooled_connection, get_connection, release_connection, close_pool
 
-__all__ = ['get_data_from_db']
+__all__ = [
+    'get_data_from_db', 'get_daily_rollup_from_db', 'ColumnarCache', 'get_cached_data',
+    'RollupStore', 'get_stored_daily_rollup',
+    'DataSource', 'PostgresSource', 'SQLiteSource', 'FileSource', 'get_data_source',
+    'pooled_connection', 'get_connection', 'release_connection', 'close_pool'
+]
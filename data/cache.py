@@ -0,0 +1,307 @@
+"""
+Local columnar cache of cluster_5g
+
+Layout (one partition per date_column, one NumPy file per column):
+
+    <cache_dir>/
+        _meta.json                  covered date range, window + cached columns
+        2025-09-01/nc_5g.npy
+        2025-09-01/da_5g.npy
+        ...
+
+Each run only fetches the dates newer than the newest cached date
+(minus a lookback for late-arriving rows) and rewrites those partitions.
+Partitions older than the widest window served are then removed.
+"""
+import json
+import os
+import shutil
+import numpy as np
+import pandas as pd
+from config.cache import CACHE_CONFIG
+from utils.instrumentation import staged
+from .data_fetcher import KEY_COLUMNS
+from .sources import get_data_source
+
+META_FILE = '_meta.json'
+
+class ColumnarCache:
+    """On-disk cache of cluster_5g rows, partitioned by date_column"""
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = cache_dir or CACHE_CONFIG['cache_dir']
+
+    # ---------- metadata ----------
+
+    def load_meta(self):
+        """Load cache metadata (covered_from date, window and cached columns)"""
+        path = os.path.join(self.cache_dir, META_FILE)
+        if not os.path.exists(path):
+            return None
+        with open(path) as f:
+            return json.load(f)
+
+    def save_meta(self, covered_from, columns, days_back, all_columns=False):
+        """
+        Save cache metadata
+
+        Args:
+            covered_from: All database rows from this date on are cached
+            columns (list): Cached columns (without date_column)
+            days_back (int): Widest window served (older partitions are pruned)
+            all_columns (bool): Cached columns are a full snapshot (SELECT *)
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+        meta = {
+            'covered_from': pd.Timestamp(covered_from).strftime('%Y-%m-%d'),
+            'columns': list(columns),
+            'days_back': int(days_back),
+            'all_columns': bool(all_columns)
+        }
+        with open(os.path.join(self.cache_dir, META_FILE), 'w') as f:
+            json.dump(meta, f, indent=2)
+
+    # ---------- partitions ----------
+
+    def partition_dir(self, date):
+        """Directory of the partition for one date"""
+        return os.path.join(self.cache_dir, pd.Timestamp(date).strftime('%Y-%m-%d'))
+
+    def cached_dates(self):
+        """
+        Get all cached dates
+
+        Returns:
+            list: Sorted pd.Timestamp of every cached partition
+        """
+        if not os.path.isdir(self.cache_dir):
+            return []
+
+        dates = []
+        for name in os.listdir(self.cache_dir):
+            if name.startswith(('_', '.')):
+                continue
+            try:
+                dates.append(pd.Timestamp(name))
+            except ValueError:
+                continue
+        return sorted(dates)
+
+    def watermark(self):
+        """Newest cached date (None if cache is empty)"""
+        dates = self.cached_dates()
+        return dates[-1] if dates else None
+
+    def write(self, df):
+        """
+        Write rows to the cache, replacing the partitions of their dates
+
+        Args:
+            df (pd.DataFrame): Raw rows (must contain date_column)
+        """
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        for date, rows in df.groupby('date_column'):
+            final_dir = self.partition_dir(date)
+            tmp_dir = final_dir + '.tmp'
+
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
+            os.makedirs(tmp_dir)
+
+            for column in rows.columns:
+                if column == 'date_column':
+                    continue
+                np.save(os.path.join(tmp_dir, f'{column}.npy'),
+                        to_numpy_column(rows[column]), allow_pickle=False)
+
+            # Swap in the new partition
+            if os.path.exists(final_dir):
+                shutil.rmtree(final_dir)
+            os.rename(tmp_dir, final_dir)
+
+    def drop(self, dates):
+        """Remove the partitions of the given dates"""
+        for date in dates:
+            path = self.partition_dir(date)
+            if os.path.exists(path):
+                shutil.rmtree(path)
+
+    def read(self, start_date, columns=None):
+        """
+        Read cached rows from start_date on
+
+        Args:
+            start_date: First date to read
+            columns (list): Columns to read (key columns always included),
+                None reads every cached column
+
+        Returns:
+            pd.DataFrame: Rows ordered by date_column, nc_5g
+        """
+        start_date = pd.Timestamp(start_date)
+        frames = []
+
+        for date in self.cached_dates():
+            if date < start_date:
+                continue
+
+            part_dir = self.partition_dir(date)
+            if columns is None:
+                names = sorted(f[:-4] for f in os.listdir(part_dir) if f.endswith('.npy'))
+                # Keys first, same as the database query
+                names = [c for c in KEY_COLUMNS if c in names] + [c for c in names if c not in KEY_COLUMNS]
+            else:
+                names = list(dict.fromkeys(KEY_COLUMNS[1:] + list(columns)))
+
+            data = {name: np.load(os.path.join(part_dir, f'{name}.npy'), allow_pickle=False)
+                    for name in names}
+            n_rows = len(next(iter(data.values()))) if data else 0
+            frame = pd.DataFrame(data)
+            frame.insert(0, 'date_column', np.repeat(date.to_datetime64(), n_rows))
+            frames.append(frame)
+
+        if not frames:
+            return pd.DataFrame(columns=['date_column'] + KEY_COLUMNS[1:] + list(columns or []))
+
+        df = pd.concat(frames, ignore_index=True)
+        return df.sort_values(['date_column', 'nc_5g'], kind='stable').reset_index(drop=True)
+
+def to_numpy_column(series):
+    """
+    Convert a column to a plain (non-object) NumPy array for np.save
+
+    Numeric values coming back as objects (e.g. Decimal) are converted to
+    float, everything else (e.g. nc_5g, also when categorical) is stored as
+    fixed-width unicode.
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.astype(str).to_numpy(dtype=str)
+
+    if series.dtype != object:
+        return series.to_numpy()
+
+    try:
+        return pd.to_numeric(series).to_numpy(dtype=float)
+    except (ValueError, TypeError):
+        return series.astype(str).to_numpy(dtype=str)
+
+def window_start(max_date, days_back):
+    """Start of the last-N-days window (same as the database query)"""
+    return pd.Timestamp(max_date).normalize() - pd.Timedelta(days=days_back)
+
+@staged(name='fetch_cached')
+def get_cached_data(days_back=35, columns=None, lookback_days=None, offline=None, cache_dir=None,
+                    source=None):
+    """
+    Fetch data for last N days through the local columnar cache
+
+    Cold cache (or window/columns not covered): full fetch of the window,
+    written to the cache. Warm cache: only dates >= (newest cached date -
+    lookback_days) are fetched and their partitions replaced; partitions
+    older than the widest window served are removed.
+
+    Args:
+        days_back (int): Number of days to return from most recent date
+        columns (iterable): Columns to return (plus date_column and nc_5g),
+            None returns every column (served from the cache once a full
+            snapshot has been cached)
+        lookback_days (int): Days before the newest cached date to re-fetch
+            (default: CACHE_CONFIG['lookback_days'])
+        offline (bool): Serve from cache only, never connect to the database
+            (default: CACHE_CONFIG['offline'])
+        cache_dir (str): Cache directory (default: the source's cache_dir,
+            CACHE_CONFIG['cache_dir'] for PostgreSQL)
+        source: DataSource or URI to fetch from (default: get_data_source(),
+            env KPI_DATA_SOURCE)
+
+    Returns:
+        pd.DataFrame: Same data as get_data_from_db(days_back, columns)
+    """
+    if lookback_days is None:
+        lookback_days = CACHE_CONFIG['lookback_days']
+    if offline is None:
+        offline = CACHE_CONFIG['offline']
+
+    source = get_data_source(source)
+    cache = ColumnarCache(cache_dir or source.cache_dir)
+    meta = cache.load_meta()
+    watermark = cache.watermark()
+    requested = None if columns is None else list(columns)
+    # Every column: in query order (as cached)
+    read_columns = meta['columns'] if requested is None and meta else requested
+
+    if offline:
+        if watermark is None:
+            raise RuntimeError(f"Offline mode: no cached data in {cache.cache_dir}")
+        if requested is not None and meta is not None:
+            missing = [c for c in requested if c not in meta['columns']]
+            if missing:
+                raise RuntimeError(f"Offline mode: columns not cached in {cache.cache_dir}: "
+                                   f"{', '.join(missing)} (refresh the cache online first)")
+        print(f"Offline mode: serving cached data (newest date {watermark.date()})")
+        return report_cached_data(cache.read(window_start(watermark, days_back), read_columns), days_back)
+
+    cached_columns = meta['columns'] if meta else []
+    all_columns = bool(meta and meta.get('all_columns'))
+    if requested is None:
+        columns_covered = all_columns
+    else:
+        columns_covered = set(requested) <= set(cached_columns)
+
+    # Window covered if the cache holds every row from the window start on
+    # (window start estimated from the current watermark)
+    window_covered = (
+        meta is not None and watermark is not None and
+        pd.Timestamp(meta['covered_from']) <= window_start(watermark, days_back)
+    )
+
+    if not (columns_covered and window_covered):
+        # Cold: fetch the whole window (with every column cached so far)
+        if requested is None or all_columns:
+            fetch_columns = None
+        else:
+            fetch_columns = list(dict.fromkeys(cached_columns + requested))
+        print(f"Cache miss: fetching last {days_back} days from {source.name}...")
+        df = source.fetch(days_back=days_back, columns=fetch_columns)
+
+        cache.drop(cache.cached_dates())
+        cache.write(df)
+        if len(df) > 0:
+            cache.save_meta(window_start(df['date_column'].max(), days_back),
+                            [c for c in df.columns if c != 'date_column'],
+                            days_back, all_columns=fetch_columns is None)
+        if requested is not None:
+            df = df[list(dict.fromkeys(KEY_COLUMNS + requested))]
+        return report_cached_data(df, days_back)
+
+    # Warm: fetch only new dates (+ lookback) and replace their partitions
+    refresh_from = watermark - pd.Timedelta(days=lookback_days)
+    print(f"Cache hit (newest date {watermark.date()}): refreshing from {refresh_from.date()}...")
+    delta = source.fetch(columns=cached_columns, start_date=refresh_from)
+
+    # Dates deleted in the database since the last run
+    stale = [d for d in cache.cached_dates()
+             if d >= refresh_from and d not in set(delta['date_column'])]
+    cache.drop(stale)
+    cache.write(delta)
+
+    watermark = cache.watermark()
+    if watermark is None:
+        raise RuntimeError(f"No data left in {source.name} from {refresh_from.date()} on")
+
+    # Keep the widest window served, drop older partitions
+    keep_days = max(meta.get('days_back', days_back), days_back)
+    covered_from = max(pd.Timestamp(meta['covered_from']), window_start(watermark, keep_days))
+    cache.drop([d for d in cache.cached_dates() if d < covered_from])
+    cache.save_meta(covered_from, cached_columns, keep_days, all_columns)
+
+    df = cache.read(window_start(watermark, days_back), read_columns)
+    return report_cached_data(df, days_back)
+
+def report_cached_data(df, days_back):
+    """Print the same summary as get_data_from_db and return the data"""
+    df = df.reset_index(drop=True)
+    print(f"Cached data: last {days_back} days, {df['date_column'].min()} to {df['date_column'].max()}")
+    print(f"Total records: {len(df)}, unique dates: {df['date_column'].nunique()}")
+    return df
@@ -0,0 +1,170 @@
+"""
+Shared PostgreSQL connection pool
+
+One psycopg2 ThreadedConnectionPool per process, created on first use.
+Connections are reused across queries (and decks, and debug scripts), so
+the TCP + auth handshake through the tunnel is paid once per connection
+instead of once per query.
+
+    with pooled_connection() as conn:
+        df = pd.read_sql(query, conn)
+
+Scripts that open/close a connection explicitly use get_connection() /
+release_connection(conn) instead of psycopg2.connect() / conn.close().
+"""
+import atexit
+import threading
+import time
+import psycopg2
+from contextlib import contextmanager
+from psycopg2 import pool
+from config.database import DB_CONFIG, POOL_CONFIG
+
+_pool = None
+_pool_lock = threading.Lock()
+# Blocks callers while all maxconn connections are checked out
+# (ThreadedConnectionPool itself raises PoolError instead of waiting)
+_slots = None
+# id(conn) -> time.monotonic() when it was returned to the pool
+_last_used = {}
+# id(conn) -> (pool, slots) it was checked out from
+_checked_out = {}
+
+def get_pool():
+    """
+    Get the process-wide connection pool (created on first call)
+
+    Returns:
+        ThreadedConnectionPool
+    """
+    global _pool, _slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                options = f"-c statement_timeout={int(POOL_CONFIG['statement_timeout_ms'])}"
+                _slots = threading.BoundedSemaphore(POOL_CONFIG['maxconn'])
+                _pool = pool.ThreadedConnectionPool(
+                    POOL_CONFIG['minconn'],
+                    POOL_CONFIG['maxconn'],
+                    connect_timeout=POOL_CONFIG['connect_timeout'],
+                    keepalives=1,
+                    options=options,
+                    **DB_CONFIG
+                )
+    return _pool
+
+def is_healthy(conn):
+    """
+    Check a pooled connection before handing it out
+
+    Connections idle for less than POOL_CONFIG['health_check_idle_s'] are
+    trusted without a round trip; older ones are pinged with SELECT 1.
+    """
+    if conn.closed:
+        return False
+
+    # Never used yet (just connected) or used recently: no round trip
+    last_used = _last_used.get(id(conn))
+    if last_used is None or time.monotonic() - last_used < POOL_CONFIG['health_check_idle_s']:
+        return True
+
+    try:
+        with conn.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+def get_connection():
+    """
+    Check a healthy connection out of the pool
+
+    Blocks while all POOL_CONFIG['maxconn'] connections are in use.
+    Must be returned with release_connection().
+
+    Returns:
+        psycopg2 connection
+    """
+    # Pool and its slots as one pair (close_pool may run concurrently)
+    while True:
+        connection_pool = get_pool()
+        with _pool_lock:
+            if _pool is connection_pool:
+                slots = _slots
+                break
+    slots.acquire()
+
+    try:
+        for _ in range(POOL_CONFIG['maxconn'] + 1):
+            conn = connection_pool.getconn()
+            if is_healthy(conn):
+                _checked_out[id(conn)] = (connection_pool, slots)
+                return conn
+            # Broken (server restart, tunnel drop): discard and retry
+            _last_used.pop(id(conn), None)
+            connection_pool.putconn(conn, close=True)
+        raise psycopg2.OperationalError("No healthy database connection available")
+    except BaseException:
+        slots.release()
+        raise
+
+def release_connection(conn):
+    """
+    Return a connection to the pool
+
+    Any open transaction is rolled back; a broken connection is closed
+    instead of being reused. A connection checked out before close_pool()
+    is closed (the current pool does not own it).
+    """
+    connection_pool, slots = _checked_out.pop(id(conn), (None, None))
+    with _pool_lock:
+        owned = connection_pool is not None and connection_pool is _pool
+
+    if not owned:
+        _last_used.pop(id(conn), None)
+        try:
+            if not conn.closed:
+                conn.close()
+        finally:
+            if slots is not None:
+                slots.release()
+        return
+
+    broken = conn.closed
+    if not broken:
+        try:
+            conn.rollback()
+        except psycopg2.Error:
+            broken = True
+
+    if broken:
+        _last_used.pop(id(conn), None)
+    else:
+        _last_used[id(conn)] = time.monotonic()
+
+    try:
+        connection_pool.putconn(conn, close=broken)
+    finally:
+        slots.release()
+
+@contextmanager
+def pooled_connection():
+    """Context manager: connection from the pool, returned on exit"""
+    conn = get_connection()
+    try:
+        yield conn
+    finally:
+        release_connection(conn)
+
+def close_pool():
+    """Close every pooled connection (the pool is recreated on next use)"""
+    global _pool, _slots
+    with _pool_lock:
+        if _pool is not None and not _pool.closed:
+            _pool.closeall()
+        _pool = None
+        _slots = None
+        _last_used.clear()
+
+atexit.register(close_pool)
@@ -1,11 +1,79 @@
 """
 Database data fetching
 """
-import psycopg2
+import io
+import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import reduce
+import numpy as np
 import pandas as pd
-from config.database import DB_CONFIG
+from config.database import FETCH_CONFIG, POOL_CONFIG
+from .connection_pool import pooled_connection
+from utils.instrumentation import staged
 
-def get_data_from_db(days_back=35):
+# Key columns, always fetched (used for date range and ordering)
+KEY_COLUMNS = ['date_column', 'nc_5g']
+# Occurrence of a key within a column group (fetch_shards merge key)
+SHARD_ROW_KEY = '_key_row'
+
+# Streaming fetch: dtype of the KPI columns (half the memory of float64)
+STREAM_FLOAT_DTYPE = np.float32
+
+def build_select_list(columns=None):
+    """
+    Build the SELECT column list for cluster_5g
+    
+    Args:
+        columns (iterable): Column names to fetch, or None for all columns
+        
+    Returns:
+        str: Comma separated column list (or '*')
+    """
+    if columns is None:
+        return '*'
+    
+    # Key columns first, then requested columns (no duplicates, order kept)
+    selected = list(dict.fromkeys(KEY_COLUMNS + list(columns)))
+    return ', '.join(selected)
+
+def build_fetch_query(days_back=35, columns=None, start_date=None, date_shard=None):
+    """
+    Build the cluster_5g query of get_data_from_db
+    
+    Args:
+        date_shard (tuple): (k, n) only fetch every n-th date (day number
+            modulo n == k), None fetches every date
+    
+    Returns:
+        tuple: (query, params)
+    """
+    if start_date is not None:
+        # Query: everything from start_date up to max date
+        date_filter = "date_column >= %(start_date)s"
+        params = {'start_date': pd.Timestamp(start_date).date()}
+    else:
+        # Query: get last N days from max date
+        # This ensures we always get data from (max_date - N days) to max_date
+        # Even if some days in between have no data
+        date_filter = f"date_column >= (SELECT MAX(date_column)::date - INTERVAL '{days_back} days' FROM cluster_5g)"
+        params = None
+    
+    if date_shard is not None:
+        # Shard by day number: no need to know the window start up front
+        k, n = date_shard
+        date_filter += f" AND MOD(date_column::date - DATE '2000-01-01', {int(n)}) = {int(k)}"
+    
+    query = f"""
+    SELECT {build_select_list(columns)}
+    FROM cluster_5g 
+    WHERE {date_filter}
+    ORDER BY date_column ASC, nc_5g
+    """
+    return query, params
+
+@staged(name='fetch')
+def get_data_from_db(days_back=35, columns=None, start_date=None, method=None,
+                     column_groups=None, date_shards=1):
     """
     Fetch data from database for last N days
     
@@ -14,29 +82,364 @@ def get_data_from_db(days_back=35):
     
     Args:
         days_back (int): Number of days to fetch from most recent date
+        columns (iterable): Only fetch these columns (plus date_column and nc_5g).
+            Use generators.get_required_columns() for the columns read by the
+            registered charts. None fetches all columns (SELECT *)
+        start_date: If given, fetch all dates >= start_date instead of the
+            last days_back days (used for incremental cache refresh)
+        method (str): 'read_sql' (pd.read_sql, reference), 'stream'
+            (server-side cursor, float32 KPIs, categorical nc_5g; memory stays
+            bounded for long windows), 'copy' (COPY ... TO STDOUT, parsed
+            with read_csv; fastest for large windows) or 'auto' (copy if the
+            planner estimates >= FETCH_CONFIG['copy_min_rows'] rows, else
+            read_sql). Default: FETCH_CONFIG['method']
+        column_groups (list): Column lists (e.g. 5G and 4G columns) fetched
+            as separate concurrent queries and merged on (date_column, nc_5g);
+            replaces columns
+        date_shards (int): Also split each query into N date shards (every
+            N-th day), run concurrently
         
     Returns:
         pd.DataFrame: Raw data from database
     """
-    conn = psycopg2.connect(**DB_CONFIG)
+    method = method or FETCH_CONFIG['method']
+    
+    if column_groups is not None and len(column_groups) == 1:
+        columns, column_groups = column_groups[0], None
+    
+    if column_groups is None and date_shards <= 1:
+        query, params = build_fetch_query(days_back, columns, start_date)
+        with pooled_connection() as conn:
+            df = read_query(conn, query, params, method)
+        df['date_column'] = pd.to_datetime(df['date_column'])
+    else:
+        df = fetch_shards(column_groups or [columns], days_back, start_date, method, date_shards)
+    
+    print_fetch_summary(df)
     
-    # Query: get last N days from max date
-    # This ensures we always get data from (max_date - N days) to max_date
-    # Even if some days in between have no data
+    return df
+
+def print_fetch_summary(df, source='database'):
+    """Print date range, row, date and column counts of fetched rows"""
+    print(f"Date range in {source}: {df['date_column'].min()} to {df['date_column'].max()}")
+    print(f"Total records fetched: {len(df)}")
+    print(f"Unique dates: {df['date_column'].nunique()}")
+    print(f"Columns fetched: {len(df.columns)}")
+
+def read_query(conn, query, params=None, method='read_sql'):
+    """
+    Run a cluster_5g query with the given fetch method
+    
+    Args:
+        conn: psycopg2 connection
+        query (str): SQL query
+        params (dict): Query parameters
+        method (str): 'read_sql', 'stream', 'copy' or 'auto'
+        
+    Returns:
+        pd.DataFrame: Query result
+    """
+    if method == 'auto':
+        estimated_rows = estimate_row_count(conn, query, params)
+        method = 'copy' if estimated_rows >= FETCH_CONFIG['copy_min_rows'] else 'read_sql'
+        print(f"Estimated rows: {estimated_rows} -> fetch method: {method}")
+    
+    if method == 'read_sql':
+        return pd.read_sql(query, conn, params=params)
+    elif method == 'stream':
+        return read_sql_streaming(conn, query, params)
+    elif method == 'copy':
+        return read_sql_copy(conn, query, params)
+    else:
+        raise ValueError(f"Unknown fetch method: {method}")
+
+def fetch_shards(column_groups, days_back=35, start_date=None, method='read_sql', date_shards=1):
+    """
+    Fetch column groups / date shards as concurrent queries and stitch them
+    
+    Every shard runs on its own pooled connection (one thread per shard, at
+    most POOL_CONFIG['maxconn'] at a time), so the round trips overlap.
+    Date shards of a column group are concatenated, column groups are
+    outer-merged on (date_column, nc_5g) plus the occurrence of that key
+    within the group: the key is not unique (NULL nc_5g rows share one),
+    so repeated keys are matched one to one, in query order.
+    
+    Args:
+        column_groups (list): Column lists (None: all columns, one group only)
+        days_back (int): Number of days to fetch from most recent date
+        start_date: Fetch all dates >= start_date instead of the last days_back days
+        method (str): Fetch method of every shard query
+        date_shards (int): Number of date shards per column group
+        
+    Returns:
+        pd.DataFrame: Same rows and columns as one query of all columns,
+            ordered by date_column, nc_5g
+    """
+    date_shards = max(1, int(date_shards))
+    tasks = [
+        (group_index, build_fetch_query(days_back, group, start_date,
+                                        (k, date_shards) if date_shards > 1 else None))
+        for group_index, group in enumerate(column_groups)
+        for k in range(date_shards)
+    ]
+    
+    def run(task):
+        _, (query, params) = task
+        with pooled_connection() as conn:
+            return read_query(conn, query, params, method)
+    
+    workers = min(len(tasks), POOL_CONFIG['maxconn'])
+    print(f"Fetching {len(tasks)} shards concurrently ({workers} connections)...")
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(run, tasks))
+    
+    # Date shards -> one frame per column group
+    groups = []
+    for group_index in range(len(column_groups)):
+        parts = [df for (index, _), df in zip(tasks, results) if index == group_index]
+        df = pd.concat(parts, ignore_index=True) if len(parts) > 1 else parts[0]
+        df['date_column'] = pd.to_datetime(df['date_column'])
+        groups.append(df)
+    
+    # Column groups -> one frame (keys stay first, no duplicated columns)
+    for df in groups:
+        df[SHARD_ROW_KEY] = df.groupby(KEY_COLUMNS, dropna=False, sort=False).cumcount()
+    
+    def stitch(left, right):
+        right = right[KEY_COLUMNS + [SHARD_ROW_KEY] +
+                      [c for c in right.columns if c not in left.columns]]
+        return left.merge(right, on=KEY_COLUMNS + [SHARD_ROW_KEY], how='outer')
+    
+    df = reduce(stitch, groups).drop(columns=SHARD_ROW_KEY)
+    return df.sort_values(KEY_COLUMNS, kind='stable').reset_index(drop=True)
+
+def estimate_row_count(conn, query, params=None):
+    """
+    Row count of a query as estimated by the Postgres planner (EXPLAIN)
+    
+    Returns:
+        int: Estimated number of rows
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {query}", params)
+        plan = cursor.fetchone()[0]
+    
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]['Plan']['Plan Rows'])
+
+def read_sql_copy(conn, query, params=None):
+    """
+    Run a query through COPY (...) TO STDOUT (CSV) and parse it vectorized
+    
+    One bulk transfer instead of row-by-row fetching, parsed by read_csv into
+    the same columns and dtypes as pd.read_sql (floats round-trip exactly,
+    nc_5g stays text, empty fields are NULL).
+    
+    Args:
+        conn: psycopg2 connection
+        query (str): SQL query (SELECT)
+        params (dict): Query parameters
+        
+    Returns:
+        pd.DataFrame: Query result
+    """
+    buffer = io.BytesIO()
+    
+    with conn.cursor() as cursor:
+        # COPY takes no bind parameters: inline them (quoted by psycopg2)
+        select = cursor.mogrify(query, params).decode().strip()
+        cursor.copy_expert(f"COPY ({select}) TO STDOUT WITH (FORMAT csv, HEADER true)", buffer)
+    
+    buffer.seek(0)
+    return pd.read_csv(buffer, dtype={'nc_5g': str}, float_precision='round_trip')
+
+class ChunkedFrameBuilder:
+    """
+    Assemble a DataFrame from row chunks, one typed NumPy array per column
+    
+    Each chunk of row tuples is converted right away (no Python objects
+    kept between chunks): date_column -> datetime64, nc_5g -> category
+    codes (NULL -> missing), numeric columns -> STREAM_FLOAT_DTYPE,
+    anything else -> object. A column that is all NULL so far stays object
+    until a chunk with a value decides its type. Columns are concatenated
+    once in build().
+    """
+    
+    def __init__(self, names):
+        self.names = list(names)
+        self.chunks = {name: [] for name in self.names}
+        self.kinds = {}
+        # nc_5g value -> category code
+        self.categories = {}
+    
+    def column_kind(self, name, values):
+        """Decide the column type from a chunk (None: only NULLs, undecided)"""
+        if name == 'date_column':
+            return 'date'
+        if name == 'nc_5g':
+            return 'category'
+        if all(v is None for v in values):
+            return None
+        try:
+            np.asarray(values, dtype=STREAM_FLOAT_DTYPE)
+            return 'float'
+        except (TypeError, ValueError):
+            return 'object'
+    
+    def set_kind(self, name, kind):
+        """Set the column type and convert the chunks held so far"""
+        self.kinds[name] = kind
+        if kind == 'float':
+            # Held chunks are all NULL
+            self.chunks[name] = [np.full(len(chunk), np.nan, dtype=STREAM_FLOAT_DTYPE)
+                                 for chunk in self.chunks[name]]
+        elif kind == 'object':
+            self.chunks[name] = [chunk.astype(object) for chunk in self.chunks[name]]
+    
+    def add(self, rows):
+        """Convert one chunk of row tuples"""
+        if not rows:
+            return
+        
+        for name, values in zip(self.names, zip(*rows)):
+            kind = self.kinds.get(name)
+            if kind is None:
+                kind = self.column_kind(name, values)
+                if kind is not None:
+                    self.set_kind(name, kind)
+            
+            if kind == 'date':
+                array = np.array(values, dtype='datetime64[ns]')
+            elif kind == 'category':
+                codes = self.categories
+                array = np.fromiter((-1 if v is None else codes.setdefault(v, len(codes))
+                                     for v in values),
+                                    dtype=np.int32, count=len(values))
+            elif kind == 'float':
+                try:
+                    array = np.asarray(values, dtype=STREAM_FLOAT_DTYPE)
+                except (TypeError, ValueError):
+                    # Text after numeric chunks: keep the column as object
+                    self.set_kind(name, 'object')
+                    array = np.array(values, dtype=object)
+            else:
+                array = np.array(values, dtype=object)
+            self.chunks[name].append(array)
+    
+    def build(self):
+        """
+        Concatenate the chunks
+        
+        Returns:
+            pd.DataFrame: One column per name, in query order
+        """
+        data = {}
+        for name in self.names:
+            chunks = self.chunks.pop(name)
+            kind = self.kinds.get(name)
+            array = np.concatenate(chunks) if chunks else np.array([], dtype=object)
+            
+            if kind == 'category':
+                data[name] = pd.Categorical.from_codes(array, categories=list(self.categories))
+            else:
+                data[name] = array
+        return pd.DataFrame(data, columns=self.names)
+
+def read_sql_streaming(conn, query, params=None, itersize=None):
+    """
+    Run a query on a server-side (named) cursor and assemble the result
+    chunk by chunk (see ChunkedFrameBuilder)
+    
+    Args:
+        conn: psycopg2 connection
+        query (str): SQL query
+        params (dict): Query parameters
+        itersize (int): Rows per round trip (default: FETCH_CONFIG['itersize'])
+        
+    Returns:
+        pd.DataFrame: Query result
+    """
+    itersize = itersize or FETCH_CONFIG['itersize']
+    
+    with conn.cursor(name='cluster_5g_stream') as cursor:
+        cursor.itersize = itersize
+        cursor.execute(query, params)
+        
+        rows = cursor.fetchmany(itersize)
+        # Named cursor: description is known after the first fetch
+        builder = ChunkedFrameBuilder(col.name for col in cursor.description)
+        while rows:
+            builder.add(rows)
+            rows = cursor.fetchmany(itersize)
+    
+    return builder.build()
+
+# SQL expression for each pandas aggregation used by the daily rollup
+# SUM is wrapped in COALESCE to match pandas (sum of all-NaN is 0, not NULL)
+SQL_AGGREGATIONS = {
+    'max': 'MAX({column})',
+    'min': 'MIN({column})',
+    'sum': 'COALESCE(SUM({column}), 0)',
+    'mean': 'AVG({column})'
+}
+
+def build_rollup_select_list(aggregations):
+    """
+    Build the SELECT list for the daily rollup query
+    
+    Args:
+        aggregations (dict): Column name -> aggregation ('max', 'min', 'sum', 'mean')
+        
+    Returns:
+        str: Comma separated select list, date_column first
+    """
+    select_list = ['date_column']
+    
+    for column, agg in aggregations.items():
+        if agg not in SQL_AGGREGATIONS:
+            raise ValueError(f"Unsupported aggregation '{agg}' for column '{column}'")
+        select_list.append(f"{SQL_AGGREGATIONS[agg].format(column=column)} AS {column}")
+    
+    return ', '.join(select_list)
+
+@staged(name='fetch_daily_rollup')
+def get_daily_rollup_from_db(aggregations, days_back=35):
+    """
+    Fetch the daily rollup (one row per date) for last N days
+    
+    The per-day MAX/SUM over all clusters is computed by the database
+    in a single GROUP BY query, so only one row per date is transferred.
+    The result has the same columns as the raw data (aggregated), so it
+    can be passed to the generators / aggregate_* functions as-is
+    (grouping one row per date by date_column is a no-op).
+    
+    The pandas path (get_data_from_db + aggregate_*) stays the reference
+    implementation.
+    
+    Args:
+        aggregations (dict): Column name -> aggregation ('max', 'min', 'sum', 'mean')
+            Use generators.get_daily_aggregations() for all charts
+        days_back (int): Number of days to fetch from most recent date
+        
+    Returns:
+        pd.DataFrame: Daily aggregated data from database
+    """
+    # Same date range as get_data_from_db, aggregated per date in the database
     query = f"""
-    SELECT *
+    SELECT {build_rollup_select_list(aggregations)}
     FROM cluster_5g 
     WHERE date_column >= (SELECT MAX(date_column)::date - INTERVAL '{days_back} days' FROM cluster_5g)
-    ORDER BY date_column ASC, nc_5g
+    GROUP BY date_column
+    ORDER BY date_column ASC
     """
     
-    df = pd.read_sql(query, conn)
-    conn.close()
+    with pooled_connection() as conn:
+        df = pd.read_sql(query, conn)
     
     df['date_column'] = pd.to_datetime(df['date_column'])
     
     print(f"Date range in database: {df['date_column'].min()} to {df['date_column'].max()}")
-    print(f"Total records fetched: {len(df)}")
-    print(f"Unique dates: {df['date_column'].nunique()}")
+    print(f"Daily rows fetched (aggregated in database): {len(df)}")
     
     return df
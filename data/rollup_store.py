@@ -0,0 +1,297 @@
+"""
+Persisted daily rollup of cluster_5g (local SQLite file)
+
+One row per date per metric, with the daily MAX/SUM already applied:
+
+    daily_rollup(date, metric, value)       PRIMARY KEY (date, metric)
+    rollup_meta(name, value)                covered_from, window + aggregation per metric
+
+Each run only fetches the raw rows of the dates newer than the newest stored
+date (minus a lookback for late-arriving rows), aggregates those days and
+upserts the values that changed. Older days are read back as stored, so the
+aggregation cost follows the number of new days, not the window length.
+Days older than the widest window served are deleted.
+"""
+import json
+import os
+import sqlite3
+import pandas as pd
+from config.cache import CACHE_CONFIG
+from utils.data_processor import build_daily_rollup
+from utils.instrumentation import staged
+from .cache import window_start
+from .sources import get_data_source, sqlite_date
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS daily_rollup (
+    date TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL,
+    PRIMARY KEY (date, metric)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS rollup_meta (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+# Only rewrite values that differ (NULL = NaN)
+UPSERT = """
+INSERT INTO daily_rollup (date, metric, value) VALUES (?, ?, ?)
+ON CONFLICT (date, metric) DO UPDATE SET value = excluded.value
+WHERE daily_rollup.value IS NOT excluded.value
+"""
+
+class RollupStore:
+    """Daily rollup values persisted in SQLite, one row per (date, metric)"""
+
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CACHE_CONFIG['rollup_dir'], 'postgres.db')
+
+    def connect(self):
+        """Open the store (created on first use)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        conn.executescript(SCHEMA)
+        return conn
+
+    # ---------- metadata ----------
+
+    def load_meta(self):
+        """Load store metadata (covered_from date, window and aggregation per metric)"""
+        conn = self.connect()
+        try:
+            rows = dict(conn.execute("SELECT name, value FROM rollup_meta"))
+        finally:
+            conn.close()
+        if 'covered_from' not in rows:
+            return None
+        return {'covered_from': rows['covered_from'],
+                'days_back': int(rows.get('days_back', 0)),
+                'aggregations': json.loads(rows['aggregations'])}
+
+    def save_meta(self, covered_from, aggregations, days_back):
+        """
+        Save store metadata
+
+        Args:
+            covered_from: Every date from this one on is stored
+            aggregations (dict): Metric -> aggregation the values were built with
+            days_back (int): Widest window served (older days are pruned)
+        """
+        conn = self.connect()
+        try:
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO rollup_meta (name, value) VALUES (?, ?)", [
+                    ('covered_from', pd.Timestamp(covered_from).strftime('%Y-%m-%d')),
+                    ('days_back', str(int(days_back))),
+                    ('aggregations', json.dumps(aggregations, sort_keys=True))
+                ])
+        finally:
+            conn.close()
+
+    # ---------- values ----------
+
+    def stored_dates(self):
+        """
+        Get all stored dates
+
+        Returns:
+            list: Sorted pd.Timestamp of every stored date
+        """
+        conn = self.connect()
+        try:
+            dates = [row[0] for row in conn.execute("SELECT DISTINCT date FROM daily_rollup ORDER BY date")]
+        finally:
+            conn.close()
+        return [pd.Timestamp(date) for date in dates]
+
+    def watermark(self):
+        """Newest stored date (None if the store is empty)"""
+        conn = self.connect()
+        try:
+            newest = conn.execute("SELECT MAX(date) FROM daily_rollup").fetchone()[0]
+        finally:
+            conn.close()
+        return None if newest is None else pd.Timestamp(newest)
+
+    def upsert(self, daily, metrics):
+        """
+        Write daily values, rewriting only the (date, metric) rows that changed
+
+        Args:
+            daily (pd.DataFrame): One row per date (date_column + metric columns)
+            metrics (list): Metric columns to store
+
+        Returns:
+            int: Number of rows inserted or updated
+        """
+        long = daily.melt(id_vars='date_column', value_vars=list(metrics),
+                          var_name='metric', value_name='value')
+        values = long['value'].astype(float)
+        rows = zip(long['date_column'].map(sqlite_date), long['metric'],
+                   values.where(values.notna(), None))
+
+        conn = self.connect()
+        try:
+            with conn:
+                before = conn.total_changes
+                conn.executemany(UPSERT, rows)
+                return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def drop(self, dates=None):
+        """Remove the values of the given dates (None: every date)"""
+        conn = self.connect()
+        try:
+            with conn:
+                if dates is None:
+                    conn.execute("DELETE FROM daily_rollup")
+                else:
+                    conn.executemany("DELETE FROM daily_rollup WHERE date = ?",
+                                     [(sqlite_date(date),) for date in dates])
+        finally:
+            conn.close()
+
+    def drop_before(self, date):
+        """Remove the values of every date older than date"""
+        conn = self.connect()
+        try:
+            with conn:
+                conn.execute("DELETE FROM daily_rollup WHERE date < ?", (sqlite_date(date),))
+        finally:
+            conn.close()
+
+    def read(self, start_date, metrics):
+        """
+        Read stored days from start_date on
+
+        Args:
+            start_date: First date to read
+            metrics (list): Metric columns to return
+
+        Returns:
+            pd.DataFrame: One row per date (same layout as build_daily_rollup)
+        """
+        metrics = list(metrics)
+        placeholders = ', '.join('?' * len(metrics))
+        query = f"""
+        SELECT date, metric, value
+        FROM daily_rollup
+        WHERE date >= ? AND metric IN ({placeholders})
+        """
+        conn = self.connect()
+        try:
+            long = pd.read_sql(query, conn, params=[sqlite_date(start_date)] + metrics)
+        finally:
+            conn.close()
+
+        daily = long.pivot(index='date', columns='metric', values='value')
+        daily = daily.reindex(columns=metrics).astype(float)
+        daily.index = pd.to_datetime(daily.index)
+        daily = daily.rename_axis('date_column').rename_axis(None, axis=1)
+        return daily.sort_index().reset_index()
+
+@staged(name='fetch_rollup_store')
+def get_stored_daily_rollup(aggregations, days_back=35, lookback_days=None, offline=None,
+                            store_path=None, source=None):
+    """
+    Daily rollup for last N days through the persisted rollup store
+
+    Cold store (or window/metrics/aggregations not covered): the whole window
+    is fetched, aggregated and stored. Warm store: only the raw rows of dates
+    >= (newest stored date - lookback_days) are fetched and aggregated; the
+    values that changed are upserted, every older day is read back as stored;
+    days older than the widest window served are deleted.
+
+    Args:
+        aggregations (dict): Column name -> aggregation ('max', 'sum', ...)
+            Use generators.get_daily_aggregations() for all charts
+        days_back (int): Number of days to return from most recent date
+        lookback_days (int): Days before the newest stored date to re-aggregate
+            (default: CACHE_CONFIG['lookback_days'])
+        offline (bool): Serve from the store only, never connect to the
+            database (default: CACHE_CONFIG['offline'])
+        store_path (str): SQLite file of the store (default: the source's
+            rollup_path)
+        source: DataSource or URI to fetch from (default: get_data_source(),
+            env KPI_DATA_SOURCE)
+
+    Returns:
+        pd.DataFrame: Same data as build_daily_rollup(get_data_from_db(days_back), aggregations)
+    """
+    if lookback_days is None:
+        lookback_days = CACHE_CONFIG['lookback_days']
+    if offline is None:
+        offline = CACHE_CONFIG['offline']
+
+    source = get_data_source(source)
+    store = RollupStore(store_path or source.rollup_path)
+    metrics = list(aggregations)
+    meta = store.load_meta()
+    watermark = store.watermark()
+
+    if offline:
+        if watermark is None:
+            raise RuntimeError(f"Offline mode: no stored daily rollup in {store.path}")
+        print(f"Offline mode: serving stored daily rollup (newest date {watermark.date()})")
+        return report_stored_rollup(store.read(window_start(watermark, days_back), metrics), days_back)
+
+    stored_aggregations = meta['aggregations'] if meta else {}
+    metrics_covered = all(stored_aggregations.get(c) == agg for c, agg in aggregations.items())
+    window_covered = (
+        meta is not None and watermark is not None and
+        pd.Timestamp(meta['covered_from']) <= window_start(watermark, days_back)
+    )
+
+    if not (metrics_covered and window_covered):
+        # Cold: aggregate the whole window (with every metric stored so far)
+        all_aggregations = {c: agg for c, agg in stored_aggregations.items() if c not in aggregations}
+        all_aggregations.update(aggregations)
+        print(f"Rollup store miss: aggregating last {days_back} days from {source.name}...")
+        df = source.fetch(days_back=days_back, columns=list(all_aggregations))
+        daily = build_daily_rollup(df, all_aggregations)
+
+        store.drop()
+        store.upsert(daily, all_aggregations)
+        if len(daily) > 0:
+            store.save_meta(window_start(daily['date_column'].max(), days_back), all_aggregations,
+                            days_back)
+        return report_stored_rollup(daily[['date_column'] + metrics], days_back)
+
+    # Warm: aggregate only new dates (+ lookback), upsert what changed
+    refresh_from = watermark - pd.Timedelta(days=lookback_days)
+    print(f"Rollup store hit (newest date {watermark.date()}): re-aggregating from {refresh_from.date()}...")
+    delta = source.fetch(columns=list(stored_aggregations), start_date=refresh_from)
+    delta_daily = build_daily_rollup(delta, stored_aggregations)
+
+    # Dates deleted in the database since the last run
+    stale = [d for d in store.stored_dates()
+             if d >= refresh_from and d not in set(delta_daily['date_column'])]
+    store.drop(stale)
+    changed = store.upsert(delta_daily, stored_aggregations)
+    print(f"Rollup store: {len(delta_daily)} days re-aggregated, {changed} values changed, "
+          f"{len(stale)} days dropped")
+
+    watermark = store.watermark()
+    if watermark is None:
+        raise RuntimeError(f"No data left in {source.name} from {refresh_from.date()} on")
+
+    # Keep the widest window served, delete older days
+    keep_days = max(meta['days_back'], days_back)
+    covered_from = max(pd.Timestamp(meta['covered_from']), window_start(watermark, keep_days))
+    store.drop_before(covered_from)
+    store.save_meta(covered_from, stored_aggregations, keep_days)
+
+    df = store.read(window_start(watermark, days_back), metrics)
+    return report_stored_rollup(df, days_back)
+
+def report_stored_rollup(df, days_back):
+    """Print the same summary as fetch_daily_rollup and return the data"""
+    df = df.reset_index(drop=True)
+    print(f"Stored daily rollup: last {days_back} days, {df['date_column'].min()} to {df['date_column'].max()}")
+    print(f"Daily rows: {len(df)}")
+    return df
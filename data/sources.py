@@ -0,0 +1,306 @@
+"""
+Pluggable cluster_5g data sources
+
+Every source serves the same cluster_5g schema (date_column, nc_5g and the
+KPI columns) with the same window semantics as get_data_from_db: the last
+N days counted back from the newest date in the source.
+
+    PostgresSource()                    production database (pooled connections)
+    SQLiteSource('cluster_5g.db')       local SQLite file, table cluster_5g
+    FileSource('cluster_5g.csv')        CSV or Parquet file (Parquet needs pyarrow)
+
+get_data_source() picks one from a URI ('postgres', 'sqlite:///path.db',
+a .db/.csv/.parquet path); by default from FETCH_CONFIG['source']
+(env KPI_DATA_SOURCE), so dashboards and test scripts run offline with:
+
+    KPI_DATA_SOURCE=sqlite:///cluster_5g.db python dashboard_weekly.py
+"""
+import os
+import re
+import sqlite3
+import pandas as pd
+from config.cache import CACHE_CONFIG
+from config.database import FETCH_CONFIG
+from utils.data_processor import build_daily_rollup
+from utils.instrumentation import staged
+from .data_fetcher import (
+    get_data_from_db, get_daily_rollup_from_db, build_select_list,
+    build_rollup_select_list, print_fetch_summary, KEY_COLUMNS
+)
+
+TABLE_NAME = 'cluster_5g'
+
+SQLITE_SUFFIXES = ('.db', '.sqlite', '.sqlite3')
+CSV_SUFFIXES = ('.csv', '.csv.gz')
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+class DataSource:
+    """Base class: rows of cluster_5g for the last N days"""
+
+    # Short name used in messages and cache directory names
+    name = 'source'
+
+    @staged(name='fetch')
+    def fetch(self, days_back=35, columns=None, start_date=None, column_groups=None):
+        """
+        Fetch rows for last N days (same contract as get_data_from_db)
+
+        Args:
+            days_back (int): Number of days to fetch from most recent date
+            columns (iterable): Only fetch these columns (plus date_column
+                and nc_5g), None fetches all columns
+            start_date: If given, fetch all dates >= start_date instead
+            column_groups (list): Column lists fetched separately where the
+                source supports it (local sources read their union)
+
+        Returns:
+            pd.DataFrame: Rows sorted by date_column, nc_5g
+        """
+        if column_groups is not None:
+            columns = [column for group in column_groups for column in group]
+
+        df = self.read_rows(days_back, columns, start_date)
+        df['date_column'] = pd.to_datetime(df['date_column'])
+        if 'nc_5g' in df.columns:
+            df['nc_5g'] = df['nc_5g'].astype(str)
+        df = df.sort_values(KEY_COLUMNS).reset_index(drop=True)
+
+        print_fetch_summary(df, source=self.name)
+        return df
+
+    @staged(name='fetch_daily_rollup')
+    def fetch_daily_rollup(self, aggregations, days_back=35):
+        """
+        Fetch the daily rollup (one row per date) for last N days
+
+        Args:
+            aggregations (dict): Column name -> aggregation ('max', 'min', 'sum', 'mean')
+            days_back (int): Number of days to fetch from most recent date
+
+        Returns:
+            pd.DataFrame: Same as get_daily_rollup_from_db
+        """
+        df = self.fetch(days_back=days_back, columns=list(aggregations))
+        return build_daily_rollup(df, aggregations)
+
+    def read_rows(self, days_back, columns, start_date):
+        """Read the raw rows of the window (implemented by each source)"""
+        raise NotImplementedError
+
+    @property
+    def cache_dir(self):
+        """Columnar cache directory of this source (one cache per source)"""
+        return f"{CACHE_CONFIG['cache_dir']}-{self.name}"
+
+    @property
+    def rollup_path(self):
+        """Persisted daily rollup of this source (one store per source)"""
+        return os.path.join(CACHE_CONFIG['rollup_dir'], f'{self.name}.db')
+
+    def __repr__(self):
+        return f'{type(self).__name__}()'
+
+class PostgresSource(DataSource):
+    """Production PostgreSQL database (get_data_from_db, pooled connections)"""
+
+    name = 'postgres'
+
+    def __init__(self, method=None, date_shards=1):
+        """
+        Args:
+            method (str): Fetch method of get_data_from_db (default:
+                FETCH_CONFIG['method'])
+            date_shards (int): Split each query into N concurrent date shards
+        """
+        self.method = method
+        self.date_shards = date_shards
+
+    def fetch(self, days_back=35, columns=None, start_date=None, column_groups=None):
+        return get_data_from_db(days_back=days_back, columns=columns, start_date=start_date,
+                                method=self.method, column_groups=column_groups,
+                                date_shards=self.date_shards)
+
+    def fetch_daily_rollup(self, aggregations, days_back=35):
+        # Aggregated in the database
+        return get_daily_rollup_from_db(aggregations, days_back=days_back)
+
+    @property
+    def cache_dir(self):
+        # Keep the existing cache location
+        return CACHE_CONFIG['cache_dir']
+
+class SQLiteSource(DataSource):
+    """
+    Local SQLite file with a cluster_5g table
+
+    date_column is stored as ISO text ('YYYY-MM-DD' or 'YYYY-MM-DD HH:MM:SS'),
+    which is what DataFrame.to_sql writes (see write()).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.name = 'sqlite-' + file_stem(path)
+
+    def connect(self):
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"SQLite data source not found: {self.path}")
+        return sqlite3.connect(self.path)
+
+    def window_filter(self, days_back, start_date):
+        """WHERE clause + parameters, same window as build_fetch_query"""
+        if start_date is not None:
+            return "date_column >= ?", [sqlite_date(start_date)]
+        return (f"date_column >= (SELECT date(MAX(date_column), '-{int(days_back)} days') "
+                f"FROM {TABLE_NAME})"), []
+
+    def read_rows(self, days_back, columns, start_date):
+        date_filter, params = self.window_filter(days_back, start_date)
+        query = f"""
+        SELECT {build_select_list(columns)}
+        FROM {TABLE_NAME}
+        WHERE {date_filter}
+        ORDER BY date_column ASC, nc_5g
+        """
+        conn = self.connect()
+        try:
+            return pd.read_sql(query, conn, params=params)
+        finally:
+            conn.close()
+
+    @staged(name='fetch_daily_rollup')
+    def fetch_daily_rollup(self, aggregations, days_back=35):
+        # Same GROUP BY push-down as get_daily_rollup_from_db
+        date_filter, params = self.window_filter(days_back, None)
+        query = f"""
+        SELECT {build_rollup_select_list(aggregations)}
+        FROM {TABLE_NAME}
+        WHERE {date_filter}
+        GROUP BY date_column
+        ORDER BY date_column ASC
+        """
+        conn = self.connect()
+        try:
+            df = pd.read_sql(query, conn, params=params)
+        finally:
+            conn.close()
+
+        df['date_column'] = pd.to_datetime(df['date_column'])
+        print(f"Date range in {self.name}: {df['date_column'].min()} to {df['date_column'].max()}")
+        print(f"Daily rows fetched (aggregated in SQLite): {len(df)}")
+        return df
+
+    def write(self, df, if_exists='replace'):
+        """
+        Write rows to the cluster_5g table (indexed on date_column)
+
+        Args:
+            df (pd.DataFrame): cluster_5g rows
+            if_exists (str): 'replace' or 'append'
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        conn = sqlite3.connect(self.path)
+        try:
+            df.to_sql(TABLE_NAME, conn, if_exists=if_exists, index=False, chunksize=50000)
+            conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{TABLE_NAME}_date ON {TABLE_NAME} (date_column)")
+            conn.commit()
+        finally:
+            conn.close()
+        return self.path
+
+    def __repr__(self):
+        return f'SQLiteSource({self.path!r})'
+
+class FileSource(DataSource):
+    """Local CSV or Parquet file holding cluster_5g rows (Parquet needs pyarrow)"""
+
+    def __init__(self, path):
+        self.path = path
+        self.format = file_format(path)
+        self.name = f'{self.format}-' + file_stem(path)
+
+    def read_file(self, columns=None):
+        """Read the whole file (only the given columns)"""
+        if not os.path.exists(self.path):
+            raise FileNotFoundError(f"{self.format.upper()} data source not found: {self.path}")
+        selected = None if columns is None else list(dict.fromkeys(KEY_COLUMNS + list(columns)))
+
+        if self.format == 'parquet':
+            return pd.read_parquet(self.path, columns=selected)
+        return pd.read_csv(self.path, usecols=selected, dtype={'nc_5g': str},
+                           parse_dates=['date_column'])
+
+    def read_rows(self, days_back, columns, start_date):
+        df = self.read_file(columns)
+        dates = pd.to_datetime(df['date_column'])
+
+        if start_date is not None:
+            start = pd.Timestamp(start_date)
+        else:
+            # Same as MAX(date_column)::date - INTERVAL 'N days'
+            start = dates.max().normalize() - pd.Timedelta(days=days_back)
+        return df[dates >= start]
+
+    def write(self, df):
+        """Write rows to the file (format from the file suffix)"""
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if self.format == 'parquet':
+            df.to_parquet(self.path, index=False)
+        else:
+            df.to_csv(self.path, index=False)
+        return self.path
+
+    def __repr__(self):
+        return f'FileSource({self.path!r})'
+
+def file_stem(path):
+    """File name without directory and suffix, safe for directory names"""
+    stem = os.path.basename(path).split('.')[0]
+    return re.sub(r'[^A-Za-z0-9_-]', '_', stem) or 'data'
+
+def file_format(path):
+    """'csv' or 'parquet' from the file suffix"""
+    lower = path.lower()
+    if lower.endswith(CSV_SUFFIXES):
+        return 'csv'
+    if lower.endswith(PARQUET_SUFFIXES):
+        return 'parquet'
+    raise ValueError(f"Unsupported data file (expected .csv or .parquet): {path}")
+
+def sqlite_date(value):
+    """Timestamp as the ISO text stored in SQLite (date only at midnight)"""
+    ts = pd.Timestamp(value)
+    if ts == ts.normalize():
+        return ts.strftime('%Y-%m-%d')
+    return ts.strftime('%Y-%m-%d %H:%M:%S')
+
+def get_data_source(source=None):
+    """
+    Resolve a data source
+
+    Args:
+        source: DataSource instance (returned as-is), or a URI:
+            'postgres', 'sqlite:///path.db' / 'path.db', 'path.csv',
+            'path.parquet'. None: FETCH_CONFIG['source'] (env KPI_DATA_SOURCE)
+
+    Returns:
+        DataSource
+    """
+    if isinstance(source, DataSource):
+        return source
+
+    uri = source or FETCH_CONFIG['source']
+    lower = uri.lower()
+
+    if lower in ('postgres', 'postgresql'):
+        return PostgresSource()
+    if lower.startswith('sqlite:///'):
+        return SQLiteSource(uri[len('sqlite:///'):])
+    if lower.endswith(SQLITE_SUFFIXES):
+        return SQLiteSource(uri)
+    if lower.endswith(CSV_SUFFIXES + PARQUET_SUFFIXES):
+        return FileSource(uri)
+    raise ValueError(f"Unknown data source: {uri}")
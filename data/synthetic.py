@@ -0,0 +1,206 @@
+"""
+Synthetic cluster_5g data for scale testing and benchmarks
+
+Produces per-cluster daily rows with the real cluster_5g column names and
+value ranges seen in production, fully vectorized (one NumPy draw per
+column), so millions of rows take seconds:
+
+    from data.synthetic import generate_cluster_data, write_synthetic_data
+    df = generate_cluster_data(n_clusters=10000, n_days=730, missing_days=5, zero_days=2)
+    write_synthetic_data('bench/cluster_5g.db', n_clusters=10000, n_days=730)
+
+The written file is a regular data source (data.SQLiteSource / FileSource):
+
+    KPI_DATA_SOURCE=sqlite:///bench/cluster_5g.db python dashboard_monthly.py
+"""
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from .sources import get_data_source, PostgresSource
+
+# Column -> (low, high, kind) of the per-cluster daily value
+#   ratio:  success ratios, mostly close to high
+#   rate:   failure / drop rates, mostly close to low
+#   volume: traffic / users, per-cluster level with weekly pattern and growth
+#   level:  per-cluster level with daily noise (throughput, util, CQI...)
+#   count:  integer counters
+COLUMN_SPECS = {
+    # 5G
+    'avail_auto_5g': (0.995, 1.0, 'ratio'),
+    'da_5g': (0.98, 1.0, 'ratio'),
+    'g5_cdr': (0.00002, 0.0001, 'rate'),
+    'sgnb_addition_sr': (0.995, 1.0, 'ratio'),
+    'traffic_5g': (20000, 40000, 'volume'),
+    'g5_eut_bhv': (40, 90, 'level'),
+    'g5_userdl_thp': (50, 100, 'level'),
+    'sum_en_dc_user_5g_wd': (100000, 300000, 'volume'),
+    'g5_dlprb_util': (0.1, 0.4, 'level'),
+    'dl_prb_util_5g_count_gt_085': (0, 8, 'count'),
+    'inter_esgnb': (0.5, 1.0, 'ratio'),
+    'intra_esgnb': (0.999, 1.0, 'ratio'),
+    'intra_sgnb_intrafreq': (0.999, 1.0, 'ratio'),
+    'inter_sgnb_intrafreq': (0.995, 1.0, 'ratio'),
+    # 4G
+    'g4_avail_auto': (0.99, 1.0, 'ratio'),
+    's1_failure': (0.0, 0.01, 'rate'),
+    'rrc_ue': (1000, 5000, 'volume'),
+    'traffic_4g': (100, 500, 'volume'),
+    'eut_4g_bh': (10, 30, 'level'),
+    'dl_prb_util': (0.2, 0.6, 'level'),
+    'cqi_bh': (8, 11, 'level'),
+    'traffic_3id': (50, 200, 'volume'),
+    'traffic_im3': (50, 200, 'volume'),
+    'user_3id': (100, 300, 'volume'),
+    'user_im3': (100, 300, 'volume'),
+    'dl_user_thp_bhv': (5, 20, 'level')
+}
+
+# Volume columns: weekend uplift and growth over the whole window
+WEEKEND_FACTOR = 1.08
+GROWTH = 0.10
+
+def pick_days(spec, n_days, rng, exclude=()):
+    """
+    Day offsets (0 = first day) from a count or an explicit list
+
+    Args:
+        spec: int (that many random days) or iterable of day offsets / dates
+        n_days (int): Days in the window
+        rng: np.random.Generator
+        exclude (iterable): Offsets never picked at random (e.g. the last day)
+
+    Returns:
+        np.ndarray: Sorted unique day offsets
+    """
+    if spec is None:
+        return np.array([], dtype=int)
+    if isinstance(spec, (int, np.integer)):
+        candidates = np.setdiff1d(np.arange(n_days), list(exclude))
+        return np.sort(rng.choice(candidates, size=min(int(spec), len(candidates)), replace=False))
+    return np.unique(np.asarray(list(spec), dtype=int))
+
+def generate_cluster_data(n_clusters=100, n_days=35, end_date=None, columns=None,
+                          missing_days=0, zero_days=0, nan_rate=0.0, seed=0,
+                          dtype=np.float64):
+    """
+    Generate cluster_5g rows (one row per cluster per day)
+
+    Args:
+        n_clusters (int): Number of clusters (nc_5g values)
+        n_days (int): Calendar days in the window (before dropping missing days)
+        end_date: Newest date (default: today)
+        columns (iterable): KPI columns to generate (default: all COLUMN_SPECS)
+        missing_days: Days without any rows - int (random days, never the
+            newest) or list of day offsets from the first day
+        zero_days: Days where every KPI is 0 (outage rows) - int or offsets
+        nan_rate (float or dict): Fraction of NaN values, per column if dict
+        seed (int): Random seed (same arguments + seed = same frame)
+        dtype: KPI column dtype (np.float32 halves memory)
+
+    Returns:
+        pd.DataFrame: date_column, nc_5g + KPI columns, sorted like
+            get_data_from_db (date_column, nc_5g)
+    """
+    rng = np.random.default_rng(seed)
+    columns = list(COLUMN_SPECS) if columns is None else list(columns)
+    unknown = [column for column in columns if column not in COLUMN_SPECS]
+    if unknown:
+        raise ValueError(f"No synthetic spec for columns: {unknown}")
+
+    end = pd.Timestamp(end_date or pd.Timestamp.today()).normalize()
+    calendar = pd.date_range(end=end, periods=n_days, freq='D')
+
+    missing = pick_days(missing_days, n_days, rng, exclude=[n_days - 1])
+    zero = pick_days(zero_days, n_days, rng, exclude=np.append(missing, n_days - 1))
+    kept = np.setdiff1d(np.arange(n_days), missing)
+
+    n_kept = len(kept)
+    n_rows = n_kept * n_clusters
+    # Row r: day kept[r // n_clusters], cluster r % n_clusters
+    day_of_row = np.repeat(np.arange(n_kept), n_clusters)
+    cluster_of_row = np.tile(np.arange(n_clusters), n_kept)
+
+    # Zero-padded names sort like the row order (ORDER BY date_column, nc_5g)
+    width = len(str(max(n_clusters - 1, 0)))
+    names = np.array([f'CLUSTER_{i:0{width}d}' for i in range(n_clusters)], dtype=object)
+
+    data = {
+        'date_column': np.repeat(calendar.values[kept], n_clusters),
+        'nc_5g': names[cluster_of_row]
+    }
+
+    # Volume day factor: weekend uplift + linear growth
+    weekend = calendar[kept].dayofweek >= 5
+    day_factor = np.where(weekend, WEEKEND_FACTOR, 1.0) * (1 + GROWTH * kept / max(n_days - 1, 1))
+
+    zero_rows = np.isin(day_of_row, np.searchsorted(kept, zero)) if len(zero) else None
+
+    for column in columns:
+        low, high, kind = COLUMN_SPECS[column]
+        span = high - low
+
+        if kind == 'ratio':
+            values = high - span * rng.random(n_rows) ** 3
+        elif kind == 'rate':
+            values = low + span * rng.random(n_rows) ** 3
+        elif kind == 'volume':
+            base = rng.uniform(low, high, n_clusters)
+            values = base[cluster_of_row] * day_factor[day_of_row] * rng.lognormal(0, 0.05, n_rows)
+        elif kind == 'level':
+            base = rng.uniform(low, high, n_clusters)
+            values = np.clip(base[cluster_of_row] + 0.1 * span * rng.standard_normal(n_rows), low, high)
+        else:
+            values = rng.poisson((low + high) / 2, n_rows).clip(low, high)
+
+        values = values.astype(dtype)
+        if zero_rows is not None:
+            values[zero_rows] = 0
+
+        rate = nan_rate.get(column, 0.0) if isinstance(nan_rate, dict) else nan_rate
+        if rate:
+            values[rng.random(n_rows) < rate] = np.nan
+
+        data[column] = values
+
+    return pd.DataFrame(data)
+
+def write_synthetic_data(path, **kwargs):
+    """
+    Generate synthetic rows and write them to a local data source
+
+    Args:
+        path (str): .db/.sqlite (SQLiteSource), .csv or .parquet (FileSource)
+            file, or a 'sqlite:///' URI
+        **kwargs: generate_cluster_data arguments
+
+    Returns:
+        DataSource: Source serving the written rows
+    """
+    source = get_data_source(path)
+    if isinstance(source, PostgresSource):
+        raise ValueError("Synthetic data is only written to local sources (SQLite, CSV, Parquet)")
+
+    df = generate_cluster_data(**kwargs)
+    source.write(df)
+    return source
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic cluster_5g data")
+    parser.add_argument('output', help="Output file (.db, .csv or .parquet)")
+    parser.add_argument('--clusters', type=int, default=100)
+    parser.add_argument('--days', type=int, default=35)
+    parser.add_argument('--missing-days', type=int, default=0)
+    parser.add_argument('--zero-days', type=int, default=0)
+    parser.add_argument('--nan-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    source = write_synthetic_data(
+        args.output, n_clusters=args.clusters, n_days=args.days,
+        missing_days=args.missing_days, zero_days=args.zero_days,
+        nan_rate=args.nan_rate, seed=args.seed
+    )
+    print(f"✓ {args.clusters} clusters x {args.days} days written to {source} "
+          f"in {time.perf_counter() - start:.1f}s")
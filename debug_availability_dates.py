@@ -3,23 +3,14 @@ Debug script untuk melihat detail data availability per tanggal
 Melihat mengapa index dimulai dari 19/09
 """
 
-import psycopg2
+from data import get_connection, release_connection
 import pandas as pd
 from datetime import datetime
 
-# Database config
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
-
 def check_availability_data():
     """Check availability data untuk 35 hari terakhir"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     
     # Get 35 days data
     query = """
@@ -30,7 +21,7 @@ def check_availability_data():
     """
     
     df = pd.read_sql(query, conn)
-    conn.close()
+    release_connection(conn)
     
     df['date_column'] = pd.to_datetime(df['date_column'])
     
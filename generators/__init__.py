@@ -1,7 +1,67 @@
 """
 Generators module
 """
-from .dashboard_5g import generate_5g_charts
-from .dashboard_4g import generate_4g_charts
+from .catalog import (
+    load_catalog, compile_plan, execute_plan, ChartPlan, CATALOG_FILE
+)
+from .dashboard_5g import (
+    generate_5g_charts, build_5g_chart_jobs,
+    REQUIRED_COLUMNS_5G, DAILY_AGGREGATIONS_5G
+)
+from .dashboard_4g import (
+    generate_4g_charts, build_4g_chart_jobs,
+    REQUIRED_COLUMNS_4G, DAILY_AGGREGATIONS_4G
+)
 
-__all__ = ['generate_5g_charts', 'generate_4g_charts']
+def build_chart_jobs(df, plan=None):
+    """
+    Aggregate data and describe the charts of every slide (without
+    rendering): one daily rollup and one pass per distinct day selection
+    for both slides
+    
+    Args:
+        df (pd.DataFrame): Raw or daily data
+        plan (ChartPlan): Charts to build (default: every enabled chart
+            of generators/catalog.json)
+    
+    Returns:
+        dict: Slide ('5g', '4g') -> {chart name -> ChartJob}
+    """
+    return execute_plan(plan or compile_plan(), df)
+
+def get_required_columns():
+    """
+    Get all cluster_5g columns read by the registered 5G and 4G charts
+    
+    Returns:
+        list: Column names (no duplicates, 5G first)
+    """
+    return compile_plan().columns
+
+def get_column_groups():
+    """
+    Get the columns read by the 5G charts and by the 4G charts as separate
+    groups (disjoint, can be fetched as concurrent queries)
+    
+    Returns:
+        list: [5G columns, 4G columns]
+    """
+    return compile_plan().column_groups()
+
+def get_daily_aggregations():
+    """
+    Get the daily aggregation of every column read by the 5G and 4G charts
+    
+    Returns:
+        dict: Column name -> aggregation ('max' or 'sum')
+    """
+    return dict(compile_plan().aggregations)
+
+__all__ = [
+    'generate_5g_charts', 'generate_4g_charts',
+    'build_5g_chart_jobs', 'build_4g_chart_jobs', 'build_chart_jobs',
+    'REQUIRED_COLUMNS_5G', 'REQUIRED_COLUMNS_4G',
+    'DAILY_AGGREGATIONS_5G', 'DAILY_AGGREGATIONS_4G',
+    'get_required_columns', 'get_column_groups', 'get_daily_aggregations',
+    'load_catalog', 'compile_plan', 'execute_plan', 'ChartPlan', 'CATALOG_FILE'
+]
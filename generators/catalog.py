@@ -0,0 +1,278 @@
+"""
+KPI chart catalog and execution plan
+
+Every chart of the 5G/4G slides is described in catalog.json: the daily
+aggregation of its columns, how its days are selected (zero/NaN rule,
+window, interval, gap detection), the series passed to the chart class
+(scale factor, 1 - x, share of a total), its title/labels, the chart
+options (ylim, tick format, color) and which lines get precomputed
+smoothed curves.
+
+compile_plan() turns the enabled charts into one plan:
+
+    - the union of the columns to fetch and their daily aggregation
+      (one rollup for every slide)
+    - the distinct day selections (charts with the same rule, e.g. the
+      4G charts, share one selection pass)
+    - one ChartJob per chart
+
+Disabled charts ("enabled": false) cost nothing: their columns, selections
+and jobs are left out of the plan.
+
+    plan = compile_plan()
+    jobs = execute_plan(plan, df)      # {'5g': {...}, '4g': {...}}
+"""
+import json
+import os
+import charts
+from utils import build_daily_rollup, select_days, positive_points, smooth_chart_lines, stage, staged
+
+CATALOG_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'catalog.json')
+
+# Defaults of a day selection (see utils.select_days)
+SELECTION_DEFAULTS = {
+    'rule': 'skip_zero',
+    'days_back': 35,
+    'interval': 1,
+    'gap_detection': False,
+    'min_value': None,
+    'interpolate': None
+}
+
+_catalogs = {}
+
+def load_catalog(path=None):
+    """
+    Load a chart catalog (parsed once per file)
+
+    Args:
+        path (str): Catalog JSON (default: generators/catalog.json)
+
+    Returns:
+        dict: Parsed catalog
+    """
+    path = path or CATALOG_FILE
+    if path not in _catalogs:
+        with open(path, encoding='utf-8') as f:
+            _catalogs[path] = json.load(f)
+    return _catalogs[path]
+
+def normalize_selection(spec):
+    """Selection spec with every default filled in"""
+    selection = dict(SELECTION_DEFAULTS)
+    selection.update(spec)
+    selection['columns'] = list(selection['columns'])
+    return selection
+
+def selection_id(spec):
+    """Identity of a selection: equal specs share one pass"""
+    return json.dumps(spec, sort_keys=True)
+
+class ChartPlan:
+    """Deduplicated work for a set of charts (see compile_plan)"""
+
+    def __init__(self, charts, selections, aggregations, selection_names=None):
+        # (slide, chart spec, selection id), in slide order
+        self.charts = charts
+        # Selection id -> normalized selection spec
+        self.selections = selections
+        # Selection id -> readable name ('4g/daily_4g', '5g/cdr'), used as stage name
+        self.selection_names = selection_names or {}
+        # Column -> daily aggregation, every column to fetch
+        self.aggregations = aggregations
+
+    @property
+    def columns(self):
+        """Columns of cluster_5g read by the plan"""
+        return list(self.aggregations)
+
+    @property
+    def slides(self):
+        """Slides with at least one chart, in catalog order"""
+        return list(dict.fromkeys(slide for slide, _, _ in self.charts))
+
+    def slide_columns(self, slide):
+        """Columns read by the charts of one slide"""
+        columns = {}
+        for chart_slide, spec, sid in self.charts:
+            if chart_slide == slide:
+                columns.update(dict.fromkeys(spec.get('aggregations', {})))
+                columns.update(dict.fromkeys(self.selections[sid]['columns']))
+        return list(columns)
+
+    def column_groups(self):
+        """
+        Columns per slide, without duplicates across slides (can be
+        fetched as concurrent queries)
+
+        Returns:
+            list: One column list per slide
+        """
+        groups, seen = [], set()
+        for slide in self.slides:
+            group = [column for column in self.slide_columns(slide) if column not in seen]
+            seen.update(group)
+            if group:
+                groups.append(group)
+        return groups
+
+    def __repr__(self):
+        return (f'ChartPlan({len(self.charts)} charts, {len(self.selections)} selections, '
+                f'{len(self.aggregations)} columns)')
+
+def compile_plan(catalog=None, slides=None, keys=None):
+    """
+    Compile the enabled charts of a catalog into a plan
+
+    Args:
+        catalog (dict or str): Parsed catalog or path (default: catalog.json)
+        slides (list): Only these slides ('5g', '4g'; default: all)
+        keys (list): Only charts with these keys (default: all)
+
+    Returns:
+        ChartPlan: Charts, distinct selections and columns to fetch
+    """
+    if catalog is None or isinstance(catalog, str):
+        catalog = load_catalog(catalog)
+
+    plan_charts, selections, aggregations, names = [], {}, {}, {}
+    for slide, slide_spec in catalog['slides'].items():
+        if slides is not None and slide not in slides:
+            continue
+
+        # Aggregation of every column of the slide (shared selections may
+        # read columns of disabled charts)
+        slide_aggregations = {}
+        for spec in slide_spec['charts']:
+            slide_aggregations.update(spec.get('aggregations', {}))
+
+        for spec in slide_spec['charts']:
+            if not spec.get('enabled', True) or (keys is not None and spec['key'] not in keys):
+                continue
+            if not hasattr(charts, spec['chart']):
+                raise ValueError(f"Unknown chart class in catalog: {spec['chart']} ({slide}/{spec['key']})")
+
+            select = spec['select']
+            name = f"{slide}/{select if isinstance(select, str) else spec['key']}"
+            if isinstance(select, str):
+                select = slide_spec.get('selections', {}).get(select)
+                if select is None:
+                    raise ValueError(f"Unknown selection in catalog: {spec['select']} ({slide}/{spec['key']})")
+            select = normalize_selection(select)
+            sid = selection_id(select)
+            selections.setdefault(sid, select)
+            # Inline selections shared by several charts: every chart key
+            names.setdefault(sid, [])
+            if name not in names[sid]:
+                names[sid].append(name)
+
+            columns = dict(spec.get('aggregations', {}))
+            for column in select['columns']:
+                columns.setdefault(column, slide_aggregations.get(column, 'max'))
+            for column, agg in columns.items():
+                if aggregations.setdefault(column, agg) != agg:
+                    raise ValueError(f"Conflicting daily aggregation for {column}: "
+                                     f"{aggregations[column]} / {agg}")
+
+            plan_charts.append((slide, spec, sid))
+
+    return ChartPlan(plan_charts, selections, aggregations,
+                     {sid: ','.join(sid_names) for sid, sid_names in names.items()})
+
+def series_values(data, spec):
+    """
+    One chart series from the selected days
+
+    Args:
+        data (pd.DataFrame): Selected days
+        spec (str or dict): Column name, or {"column", "complement", "scale",
+            "array"} / {"share", "of", "scale"}
+
+    Returns:
+        pd.Series or np.ndarray: Values passed to the chart class
+    """
+    if isinstance(spec, str):
+        return data[spec]
+
+    if 'share' in spec:
+        total = data[spec['of'][0]]
+        for column in spec['of'][1:]:
+            total = total + data[column]
+        return (data[spec['share']] / total * spec.get('scale', 1)).fillna(0)
+
+    values = data[spec['column']]
+    if spec.get('complement'):
+        values = 1 - values
+    if 'scale' in spec:
+        values = values * spec['scale']
+    if spec.get('array'):
+        values = values.values
+    return values
+
+def group_curves(curves):
+    """((slide, key), line) -> curve  =>  (slide, key) -> {line: curve}"""
+    smoothed = {}
+    for (key, line), curve in curves.items():
+        smoothed.setdefault(key, {})[line] = curve
+    return smoothed
+
+@staged(name='plan')
+def execute_plan(plan, df):
+    """
+    Run a plan: one daily rollup, each distinct selection once, one
+    ChartJob per chart (nothing is rendered)
+
+    Args:
+        plan (ChartPlan): From compile_plan
+        df (pd.DataFrame): Raw or daily data with the plan's columns
+
+    Returns:
+        dict: Slide -> {chart key -> ChartJob}, in catalog order
+    """
+    daily = build_daily_rollup(df, plan.aggregations)
+
+    # One labelled stage per selection (run report: which rule was slow)
+    selected = {}
+    for sid, spec in plan.selections.items():
+        with stage(f"select:{plan.selection_names.get(sid, sid)}"):
+            selected[sid] = select_days(daily, aggregations=plan.aggregations, **spec)
+
+    # Chart series, and the lines to smooth grouped by selection (same x)
+    values, lines, point_lines = {}, {}, {}
+    for slide, spec, sid in plan.charts:
+        series = [series_values(selected[sid], item) for item in spec['series']]
+        values[(slide, spec['key'])] = series
+        for line, smooth in spec.get('smooth', {}).items():
+            y = series[smooth['series']]
+            if 'scale' in smooth:
+                y = y * smooth['scale']
+            if smooth.get('points') == 'positive':
+                point_lines[(slide, spec['key'], line)] = positive_points(y)
+            else:
+                lines.setdefault(sid, {})[((slide, spec['key']), line)] = y
+
+    # One batched spline fit per selection
+    curves = {}
+    for sid_lines in lines.values():
+        curves.update(smooth_chart_lines(sid_lines))
+    for (slide, key, line), (x, y) in point_lines.items():
+        curves[((slide, key), line)] = smooth_chart_lines({line: y}, x=x)[line]
+    smoothed = group_curves(curves)
+
+    jobs = {slide: {} for slide in plan.slides}
+    for slide, spec, sid in plan.charts:
+        kwargs = dict(spec.get('options', {}))
+        if 'ylim' in kwargs:
+            kwargs['ylim'] = tuple(kwargs['ylim'])
+        if (slide, spec['key']) in smoothed:
+            kwargs['smoothed'] = smoothed[(slide, spec['key'])]
+
+        jobs[slide][spec['key']] = charts.ChartJob(
+            getattr(charts, spec['chart']),
+            selected[sid]['date_column'],
+            *values[(slide, spec['key'])],
+            *spec.get('args', []),
+            **kwargs
+        )
+
+    return jobs
@@ -0,0 +1,137 @@
+"""
+Single-chart preview: build and render one chart of the catalog only
+
+Only the chart's columns are fetched, only its rollup and day selection
+are computed and only its figure is rendered, through the same plan as
+the dashboards (generators/catalog.json).
+
+    from generators.preview import render_chart
+    render_chart('prb_util', output='prb_util.png')
+
+    python -m generators.preview prb_util --source kpi.db --output prb_util.png
+    python -m generators.preview availability --slide 4g
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+from config import apply_chart_styles
+from data import get_cached_data, get_data_source
+from .catalog import load_catalog, compile_plan, execute_plan
+
+def chart_keys(slide=None, enabled_only=False):
+    """
+    Chart keys of the catalog
+
+    Args:
+        slide (str): Only this slide (default: all)
+        enabled_only (bool): Leave out disabled charts
+
+    Returns:
+        list: (slide, key) pairs, in catalog order
+    """
+    return [(name, spec['key'])
+            for name, slide_spec in load_catalog()['slides'].items()
+            if slide is None or name == slide
+            for spec in slide_spec['charts']
+            if not enabled_only or spec.get('enabled', True)]
+
+def chart_plan(key, slide='5g'):
+    """
+    Plan of one chart (its columns and day selection only)
+
+    Raises:
+        ValueError: Unknown or disabled chart
+    """
+    plan = compile_plan(slides=[slide], keys=[key])
+    if not plan.charts:
+        known = ', '.join(k for _, k in chart_keys(slide, enabled_only=True))
+        raise ValueError(f"No enabled chart '{key}' on slide '{slide}' (charts: {known})")
+    return plan
+
+def build_chart_job(df, key, slide='5g'):
+    """
+    ChartJob of one chart from data already in memory
+
+    Args:
+        df (pd.DataFrame): Raw or daily data (at least the chart's columns)
+        key (str): Chart key, e.g. 'prb_util'
+        slide (str): '5g' or '4g'
+
+    Returns:
+        ChartJob: Not rendered yet
+    """
+    return execute_plan(chart_plan(key, slide), df)[slide][key]
+
+def render_chart(key, slide='5g', days_back=35, source=None, use_cache=False, output=None):
+    """
+    Fetch, aggregate and render one chart
+
+    Args:
+        key (str): Chart key, e.g. 'prb_util'
+        slide (str): '5g' or '4g'
+        days_back (int): Number of days to fetch
+        source: DataSource or URI (see data.get_data_source)
+        use_cache (bool): Fetch through the local columnar cache
+        output (str): Also save the PNG to this file
+
+    Returns:
+        BytesIO: PNG of the chart
+    """
+    plan = chart_plan(key, slide)
+    source = get_data_source(source)
+    if use_cache:
+        df = get_cached_data(days_back=days_back, columns=plan.columns, source=source)
+    else:
+        df = source.fetch(days_back=days_back, columns=plan.columns)
+
+    apply_chart_styles()
+    png = execute_plan(plan, df)[slide][key].create()
+
+    if output:
+        with open(output, 'wb') as f:
+            f.write(png.getvalue())
+        print(f"✓ Chart saved: {output}")
+    return png
+
+def preview_main(key=None, slide='5g', use_cache=False, output_dir=None, argv=None):
+    """
+    Command line entry point (also used by the tests/test_*.py scripts)
+
+    Args:
+        key (str): Chart key (default: first positional argument)
+        slide (str): Default slide
+        use_cache (bool): Fetch through the local cache by default
+        output_dir (str): Directory of the default output file
+        argv (list): Arguments (default: sys.argv[1:])
+    """
+    parser = argparse.ArgumentParser(description="Render one dashboard chart")
+    if key is None:
+        parser.add_argument('key', help="Chart key, e.g. prb_util ('list' shows all)")
+    parser.add_argument('--slide', default=slide, choices=['5g', '4g'])
+    parser.add_argument('--days-back', type=int, default=35)
+    parser.add_argument('--source', help="postgres, sqlite:///path.db, path.csv, path.parquet")
+    parser.add_argument('--cache', action=argparse.BooleanOptionalAction, default=use_cache,
+                        help="Fetch through the local columnar cache")
+    parser.add_argument('--output', help="PNG file (default: <key>_test_<timestamp>.png)")
+    args = parser.parse_args(argv)
+    key = key or args.key
+
+    if key == 'list':
+        for name, chart in chart_keys():
+            print(f"{name}  {chart}")
+        return 0
+
+    known = [chart for _, chart in chart_keys(args.slide, enabled_only=True)]
+    if key not in known:
+        parser.error(f"unknown chart '{key}' on slide '{args.slide}' (charts: {', '.join(known)})")
+
+    output = args.output or os.path.join(
+        output_dir or '', f'{key}_test_{datetime.now().strftime("%Y%m%d_%H%M%S")}.png'
+    )
+    render_chart(key, slide=args.slide, days_back=args.days_back, source=args.source,
+                 use_cache=args.cache, output=output)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(preview_main())
@@ -0,0 +1,389 @@
+"""
+Native (editable) PowerPoint charts
+
+Each chart class of charts/chart_5g.py is mapped to a python-pptx chart
+with the same series, colors, fixed axis ranges and hidden top labels.
+Nothing is drawn with matplotlib: the ChartJob arguments are turned
+straight into chart XML (rendered by PowerPoint when the deck is opened).
+"""
+import re
+import numpy as np
+import pandas as pd
+from pptx.chart.axis import ValueAxis
+from pptx.chart.data import CategoryChartData
+from pptx.dml.color import RGBColor
+from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_MARKER_STYLE
+from pptx.enum.dml import MSO_LINE_DASH_STYLE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import nsdecls, qn
+from pptx.util import Pt
+from charts import (
+    AvailabilityChart5G, LineChart5G, AreaChart5G, BarChart5G,
+    DualLineChart5G, StackedBarChart5G, CDRChart5G, SgnbSRChart5G,
+    TrafficChart5G, EUTThpChart5G, User5GChart, PRBUtilChart5G
+)
+from config import COLORS
+
+# Chart box on the slide is ~2.3" wide: small fonts, thinner lines than the PNGs
+FONT_SIZE = Pt(6)
+TITLE_FONT_SIZE = Pt(8)
+LINE_WIDTH = Pt(1.75)
+
+# ---------- helpers ----------
+
+def category_labels(dates, date_format='%d/%m/%Y'):
+    """Date labels of the x-axis (same as BaseChart.format_common)"""
+    return [d.strftime(date_format) for d in pd.to_datetime(pd.Series(dates))]
+
+def to_points(values):
+    """Float values with NaN as None (empty point)"""
+    return [None if pd.isna(v) else float(v) for v in np.asarray(values, dtype=float)]
+
+def hidden_top_format(top, number_format, tolerance):
+    """
+    Number format hiding the label at the top of the axis
+
+    Args:
+        top (float): Top of the value axis
+        number_format (str): Format of all other labels, e.g. '0.00"%"'
+        tolerance (float): Labels >= top - tolerance are hidden
+    """
+    return f'[>={top - tolerance:g}]"";{number_format}'
+
+def python_to_number_format(ytick_format):
+    """
+    Convert a ytick_format such as '{:.2f}%' to a number format ('0.00"%"')
+
+    Returns:
+        str: Number format, None if the format is not understood
+    """
+    match = re.fullmatch(r'(.*)\{:\.(\d+)f\}(.*)', ytick_format or '')
+    if not match:
+        return None
+    prefix, decimals, suffix = match.groups()
+    number = '0' + ('.' + '0' * int(decimals) if int(decimals) else '')
+    return (f'"{prefix}"' if prefix else '') + number + (f'"{suffix}"' if suffix else '')
+
+def add_chart(slide, chart_type, categories, series, box):
+    """
+    Add a chart shape to the slide
+
+    Args:
+        slide: PowerPoint slide object
+        chart_type: XL_CHART_TYPE member
+        categories (list): X-axis labels
+        series (list): (name, values) pairs
+        box (tuple): left, top, width, height
+
+    Returns:
+        Chart: python-pptx chart
+    """
+    chart_data = CategoryChartData()
+    chart_data.categories = categories
+    for name, values in series:
+        chart_data.add_series(name, to_points(values))
+
+    chart = slide.shapes.add_chart(chart_type, *box, chart_data).chart
+    chart.font.size = FONT_SIZE
+    return chart
+
+def style_chart(chart, title, ylabel, legend=False):
+    """Title, y-axis label, grid and x-axis labels (like format_common)"""
+    chart.has_title = True
+    chart.chart_title.text_frame.text = title
+    title_font = chart.chart_title.text_frame.paragraphs[0].font
+    title_font.size = TITLE_FONT_SIZE
+    title_font.bold = True
+
+    chart.has_legend = legend
+    if legend:
+        chart.legend.position = XL_LEGEND_POSITION.TOP
+        chart.legend.include_in_layout = False
+        chart.legend.font.size = FONT_SIZE
+
+    value_axis = chart.value_axis
+    value_axis.has_title = True
+    value_axis.axis_title.text_frame.text = ylabel
+    value_axis.axis_title.text_frame.paragraphs[0].font.size = FONT_SIZE
+
+    # TRANSPARENT dashed grid
+    value_axis.has_major_gridlines = True
+    grid_line = value_axis.major_gridlines.format.line
+    grid_line.color.rgb = RGBColor(0xD3, 0xD3, 0xD3)
+    grid_line.width = Pt(0.5)
+    grid_line.dash_style = MSO_LINE_DASH_STYLE.DASH
+
+    # Dates rotated 45 degrees
+    category_axis = chart.category_axis
+    category_axis.tick_labels.font.size = Pt(5)
+    category_axis.format.line.color.rgb = RGBColor(0x80, 0x80, 0x80)
+    body_pr = category_axis._element.find(qn('c:txPr')).find(qn('a:bodyPr'))
+    body_pr.set('rot', '-2700000')
+
+def style_value_axis(axis, minimum=None, maximum=None, major_unit=None, number_format=None):
+    """Fixed range / interval / label format of a value axis"""
+    if minimum is not None:
+        axis.minimum_scale = minimum
+    if maximum is not None:
+        axis.maximum_scale = maximum
+    if major_unit is not None:
+        axis.major_unit = major_unit
+    if number_format is not None:
+        axis.tick_labels.number_format = number_format
+        axis.tick_labels.number_format_is_linked = False
+    axis.tick_labels.font.size = FONT_SIZE
+    axis.format.line.color.rgb = RGBColor(0x80, 0x80, 0x80)
+
+def hex_color(color):
+    """'#1f77b4' -> RGBColor"""
+    return RGBColor.from_string(color.lstrip('#').upper())
+
+def style_line(series, color, smooth=True):
+    """BOLD line without markers"""
+    series.format.line.color.rgb = hex_color(color)
+    series.format.line.width = LINE_WIDTH
+    series.smooth = smooth
+    series.marker.style = XL_MARKER_STYLE.NONE
+
+def style_fill(series, color, alpha=None):
+    """Solid fill, optionally transparent (alpha 0-1)"""
+    series.format.fill.solid()
+    series.format.fill.fore_color.rgb = hex_color(color)
+    if alpha is not None:
+        srgb = series.format.fill._xPr.find(qn('a:solidFill')).find(qn('a:srgbClr'))
+        srgb.append(parse_xml(f'<a:alpha {nsdecls("a")} val="{int(alpha * 100000)}"/>'))
+
+def span_gaps(chart):
+    """Draw lines across empty points (matplotlib connects the valid points)"""
+    chart_space = chart._chartSpace
+    chart_el = chart_space.find(qn('c:chart'))
+    disp_blanks = chart_el.find(qn('c:dispBlanksAs'))
+    if disp_blanks is None:
+        disp_blanks = parse_xml(f'<c:dispBlanksAs {nsdecls("c")} val="span"/>')
+        chart_el.find(qn('c:plotVisOnly')).addnext(disp_blanks)
+    else:
+        disp_blanks.set('val', 'span')
+
+def add_secondary_bar(chart, series_index, gap_width=25):
+    """
+    Move one series of a line chart to a bar chart on a secondary y-axis
+
+    python-pptx has no combo charts: the series is moved (with its data
+    references) into a new c:barChart plotted on its own category axis
+    (hidden) and value axis (right side).
+
+    Returns:
+        ValueAxis: The secondary (right) value axis
+    """
+    plot_area = chart._chartSpace.find(qn('c:chart')).find(qn('c:plotArea'))
+    line_chart = plot_area.find(qn('c:lineChart'))
+    ser = line_chart.findall(qn('c:ser'))[series_index]
+    line_chart.remove(ser)
+
+    # Line-only elements are not valid in a bar series
+    for tag in ('c:marker', 'c:smooth'):
+        for el in ser.findall(qn(tag)):
+            ser.remove(el)
+
+    cat_ax_id, val_ax_id = '50030001', '50030002'
+    bar_chart = parse_xml(
+        f'<c:barChart {nsdecls("c")}>'
+        '<c:barDir val="col"/><c:grouping val="clustered"/><c:varyColors val="0"/>'
+        f'<c:gapWidth val="{gap_width}"/>'
+        f'<c:axId val="{cat_ax_id}"/><c:axId val="{val_ax_id}"/>'
+        '</c:barChart>'
+    )
+    bar_chart.find(qn('c:varyColors')).addnext(ser)
+    # Bars first (behind the line)
+    line_chart.addprevious(bar_chart)
+
+    axes = parse_xml(
+        f'<c:axes {nsdecls("c")}>'
+        f'<c:catAx><c:axId val="{cat_ax_id}"/>'
+        '<c:scaling><c:orientation val="minMax"/></c:scaling>'
+        '<c:delete val="1"/><c:axPos val="b"/>'
+        '<c:majorTickMark val="none"/><c:minorTickMark val="none"/>'
+        '<c:tickLblPos val="nextTo"/>'
+        f'<c:crossAx val="{val_ax_id}"/><c:crosses val="autoZero"/>'
+        '<c:auto val="1"/><c:lblAlgn val="ctr"/><c:lblOffset val="100"/>'
+        '<c:noMultiLvlLbl val="0"/></c:catAx>'
+        f'<c:valAx><c:axId val="{val_ax_id}"/>'
+        '<c:scaling><c:orientation val="minMax"/></c:scaling>'
+        '<c:delete val="0"/><c:axPos val="r"/>'
+        '<c:numFmt formatCode="General" sourceLinked="0"/>'
+        '<c:majorTickMark val="out"/><c:minorTickMark val="none"/>'
+        '<c:tickLblPos val="nextTo"/>'
+        f'<c:crossAx val="{cat_ax_id}"/><c:crosses val="max"/>'
+        '<c:crossBetween val="between"/></c:valAx>'
+        '</c:axes>'
+    )
+    last_axis = plot_area.findall(qn('c:valAx'))[-1]
+    for axis in reversed(list(axes)):
+        last_axis.addnext(axis)
+
+    return ValueAxis(plot_area.findall(qn('c:valAx'))[-1])
+
+# ---------- one builder per chart class ----------
+
+def percent_line_chart(slide, chart, box, minimum, maximum, major_unit, number_format, tolerance):
+    """Smooth % line on a fixed axis with the top label hidden"""
+    native = add_chart(slide, XL_CHART_TYPE.LINE, category_labels(chart.dates),
+                       [(chart.title, np.asarray(chart.values, dtype=float) * 100)], box)
+    style_line(native.series[0], COLORS['primary'])
+    style_chart(native, chart.title, chart.ylabel)
+    style_value_axis(native.value_axis, minimum, maximum, major_unit,
+                     hidden_top_format(maximum, number_format, tolerance))
+    return native
+
+def availability_chart(slide, chart, box):
+    """AvailabilityChart5G / SgnbSRChart5G: 99.00-100.20%, interval 0.20"""
+    return percent_line_chart(slide, chart, box, 99.00, 100.20, 0.20, '0.00"%"', 0.01)
+
+def cdr_chart(slide, chart, box):
+    """CDRChart5G: 0.000-0.016%, interval 0.002"""
+    return percent_line_chart(slide, chart, box, 0, 0.016, 0.002, '0.000"%"', 0.0001)
+
+def line_chart(slide, chart, box):
+    """LineChart5G: optional ylim (values clipped to it) and label format"""
+    values = np.asarray(chart.values, dtype=float)
+    if chart.ylim:
+        values = np.clip(values, chart.ylim[0], chart.ylim[1])
+
+    native = add_chart(slide, XL_CHART_TYPE.LINE, category_labels(chart.dates),
+                       [(chart.title, values)], box)
+    style_line(native.series[0], chart.color)
+    style_chart(native, chart.title, chart.ylabel)
+
+    number_format = python_to_number_format(chart.ytick_format)
+    if chart.ylim:
+        if chart.hide_top_label:
+            number_format = hidden_top_format(chart.ylim[1], number_format or '0.00', 0.01)
+        style_value_axis(native.value_axis, chart.ylim[0], chart.ylim[1],
+                         number_format=number_format)
+    else:
+        style_value_axis(native.value_axis, number_format=number_format)
+    return native
+
+def area_chart(slide, chart, box, color=None, maximum=None, major_unit=None, number_format=None):
+    """AreaChart5G (auto axis) / TrafficChart5G (0-50,000, interval 5,000)"""
+    native = add_chart(slide, XL_CHART_TYPE.AREA, category_labels(chart.dates),
+                       [(chart.title, chart.values)], box)
+    series = native.series[0]
+    style_fill(series, color or chart.color, alpha=0.7)
+    series.format.line.color.rgb = hex_color(color or chart.color)
+    series.format.line.width = LINE_WIDTH
+    style_chart(native, chart.title, chart.ylabel)
+    style_value_axis(native.value_axis, 0 if maximum else None, maximum, major_unit, number_format)
+    return native
+
+def traffic_chart(slide, chart, box):
+    """TrafficChart5G: 0-50,000 GB, hide 50,000"""
+    return area_chart(slide, chart, box, color='#17516d', maximum=50000, major_unit=5000,
+                      number_format=hidden_top_format(50000, '#,##0', 100))
+
+def bar_chart(slide, chart, box, color=None, maximum=None, major_unit=None, number_format=None):
+    """BarChart5G (auto axis) / User5GChart (0-400K, interval 50K)"""
+    native = add_chart(slide, XL_CHART_TYPE.COLUMN_CLUSTERED, category_labels(chart.dates),
+                       [(chart.title, chart.values)], box)
+    style_fill(native.series[0], color or chart.color)
+    native.plots[0].gap_width = 25  # width=0.8
+    style_chart(native, chart.title, chart.ylabel)
+    style_value_axis(native.value_axis, 0 if maximum else None, maximum, major_unit, number_format)
+    return native
+
+def user_5g_chart(slide, chart, box):
+    """User5GChart: 0-400,000 as K, hide 400K"""
+    return bar_chart(slide, chart, box, color='#1f77b4', maximum=400000, major_unit=50000,
+                     number_format=hidden_top_format(400000, '0,"K"', 100))
+
+def dual_line_chart(slide, chart, box):
+    """DualLineChart5G: two smooth lines with legend"""
+    native = add_chart(slide, XL_CHART_TYPE.LINE, category_labels(chart.dates),
+                       [(chart.label1, chart.values), (chart.label2, chart.values2)], box)
+    style_line(native.series[0], chart.color1)
+    style_line(native.series[1], chart.color2)
+    style_chart(native, chart.title, chart.ylabel, legend=True)
+    style_value_axis(native.value_axis)
+    return native
+
+def stacked_bar_chart(slide, chart, box):
+    """StackedBarChart5G: two stacked columns with legend"""
+    native = add_chart(slide, XL_CHART_TYPE.COLUMN_STACKED, category_labels(chart.dates),
+                       [(chart.label1, chart.values), (chart.label2, chart.values2)], box)
+    style_fill(native.series[0], chart.color1)
+    style_fill(native.series[1], chart.color2)
+    native.plots[0].gap_width = 25
+    style_chart(native, chart.title, chart.ylabel, legend=True)
+    style_value_axis(native.value_axis)
+    return native
+
+def eut_thp_chart(slide, chart, box):
+    """EUTThpChart5G: EUT (only > 0) and Thp lines, 0-120, hide 120"""
+    eut = np.asarray(chart.values, dtype=float)
+    eut = np.where(eut > 0, eut, np.nan)
+
+    native = add_chart(slide, XL_CHART_TYPE.LINE, category_labels(chart.dates),
+                       [('g5_eut_bhv', eut), ('g5_userdl_thp', chart.thp_values)], box)
+    style_line(native.series[0], '#1f77b4')
+    style_line(native.series[1], '#ff7f0e')
+    span_gaps(native)
+    style_chart(native, chart.title, chart.ylabel, legend=True)
+    style_value_axis(native.value_axis, 0, 120, 20, hidden_top_format(120, '0', 0.1))
+    return native
+
+def prb_util_chart(slide, chart, box):
+    """PRBUtilChart5G: PRB Util % line (0-50%) + #cells bars on right axis (0-10)"""
+    cells = np.asarray(chart.cells_count_values, dtype=float)
+    cells = np.where(cells > 0, cells, np.nan)
+
+    native = add_chart(slide, XL_CHART_TYPE.LINE, category_labels(chart.dates),
+                       [(chart.ylabel, np.asarray(chart.values, dtype=float) * 100),
+                        (chart.ylabel_right, cells)], box)
+    style_line(native.series[0], '#1f77b4')
+    # Bar fill is set before the move (series order changes: bars first)
+    style_fill(native.series[1], '#ff7f0e', alpha=0.3)
+    style_chart(native, chart.title, chart.ylabel)
+    style_value_axis(native.value_axis, 0, 50, 5, hidden_top_format(50, '0"%"', 0.1))
+
+    right_axis = add_secondary_bar(native, 1)
+    style_value_axis(right_axis, 0, 10, 1, hidden_top_format(10, '0', 0.1))
+    right_axis.has_title = True
+    right_axis.axis_title.text_frame.text = chart.ylabel_right
+    right_axis.axis_title.text_frame.paragraphs[0].font.size = FONT_SIZE
+    return native
+
+# Chart class -> native builder (4G classes are aliases of the 5G ones)
+NATIVE_BUILDERS = {
+    AvailabilityChart5G: availability_chart,
+    SgnbSRChart5G: availability_chart,
+    CDRChart5G: cdr_chart,
+    LineChart5G: line_chart,
+    AreaChart5G: area_chart,
+    TrafficChart5G: traffic_chart,
+    BarChart5G: bar_chart,
+    User5GChart: user_5g_chart,
+    DualLineChart5G: dual_line_chart,
+    StackedBarChart5G: stacked_bar_chart,
+    EUTThpChart5G: eut_thp_chart,
+    PRBUtilChart5G: prb_util_chart
+}
+
+def has_native_chart(job):
+    """True if the ChartJob's chart class has a native builder"""
+    return job.chart_class in NATIVE_BUILDERS
+
+def add_native_chart(slide, job, left, top, width, height):
+    """
+    Add a ChartJob to the slide as a native PowerPoint chart
+
+    Args:
+        slide: PowerPoint slide object
+        job (ChartJob): Chart class + constructor arguments
+        left, top, width, height: Chart box
+
+    Returns:
+        Chart: python-pptx chart
+    """
+    # Chart __init__ only stores the arguments (no figure is created)
+    chart = job.chart_class(*job.args, **job.kwargs)
+    return NATIVE_BUILDERS[job.chart_class](slide, chart, (left, top, width, height))
@@ -4,6 +4,9 @@ PowerPoint presentation builder
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from datetime import datetime
+from charts import ChartJob
+from utils.instrumentation import staged
+from .native_charts import add_native_chart, has_native_chart
 
 class PPTBuilder:
     """PowerPoint presentation builder"""
@@ -41,7 +44,8 @@ class PPTBuilder:
         
         Args:
             slide: PowerPoint slide object
-            charts (dict): Dictionary of chart BytesIO streams
+            charts (dict): Dictionary of chart BytesIO streams (PNG), or of
+                ChartJob for native (editable) PowerPoint charts
             chart_list (list): List of chart names in order
         """
         for idx, chart_name in enumerate(chart_list):
@@ -50,17 +54,27 @@ class PPTBuilder:
                 col = idx % 4
                 left = self.start_left + (col * self.h_spacing)
                 top = self.start_top + (row * self.v_spacing)
+                chart = charts[chart_name]
+                
+                if isinstance(chart, ChartJob):
+                    if has_native_chart(chart):
+                        add_native_chart(slide, chart, left, top,
+                                         self.chart_width, self.chart_height)
+                        continue
+                    # No native equivalent: fall back to the PNG
+                    chart = chart.create()
                 
                 slide.shapes.add_picture(
-                    charts[chart_name],
+                    chart,
                     left, top,
                     width=self.chart_width,
                     height=self.chart_height
                 )
     
-    def create_5g_slide(self, charts):
+    @staged(name='ppt:5g_slide')
+    def create_5g_slide(self, charts, title=None):
         """Create 5G dashboard slide"""
-        slide = self.add_slide_with_title('KPI MONITORING 5G EAST JAVA')
+        slide = self.add_slide_with_title(title or 'KPI MONITORING 5G EAST JAVA')
         
         chart_list = [
             'availability', 'accessibility', 'cdr', 'sgnb_sr',
@@ -71,9 +85,10 @@ class PPTBuilder:
         self.add_charts_to_slide(slide, charts, chart_list)
         return slide
     
-    def create_4g_slide(self, charts):
+    @staged(name='ppt:4g_slide')
+    def create_4g_slide(self, charts, title=None):
         """Create 4G dashboard slide"""
-        slide = self.add_slide_with_title('KPI MONITORING 4G EAST JAVA')
+        slide = self.add_slide_with_title(title or 'KPI MONITORING 4G EAST JAVA')
         
         chart_list = [
             'availability', 's1sr', 'rrc_user', 'traffic',
@@ -84,10 +99,18 @@ class PPTBuilder:
         self.add_charts_to_slide(slide, charts, chart_list)
         return slide
     
-    def save(self, filename=None):
-        """Save presentation to file"""
+    @staged(name='ppt:save')
+    def save(self, filename=None, prefix=None):
+        """
+        Save presentation to file
+        
+        Args:
+            filename (str): Output filename (default: timestamped name)
+            prefix (str): Inserted in the default filename, e.g. 'Weekly'
+        """
         if filename is None:
-            filename = f'KPI_Monitoring_Dashboard_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pptx'
+            name = 'KPI_Monitoring_Dashboard' + (f'_{prefix}' if prefix else '')
+            filename = f'{name}_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pptx'
         
         self.prs.save(filename)
         return filename
@@ -6,19 +6,11 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
+from data import get_connection, release_connection
 import pandas as pd
 
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
-
 def calculate_availability_index():
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     
     query_max = "SELECT MAX(date_column) as max_date FROM cluster_5g"
     max_date = pd.read_sql(query_max, conn).iloc[0]['max_date']
@@ -49,7 +41,7 @@ def calculate_availability_index():
     """
     
     df_range = pd.read_sql(query_range, conn)
-    conn.close()
+    release_connection(conn)
     
     print(f"\n4. DATA YANG DITEMUKAN:")
     print(f"   Total hari dengan data: {len(df_range)}")
@@ -6,20 +6,12 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
-
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
+from data import get_connection, release_connection
 
 def check_prb_columns():
     """Check columns related to PRB"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     cursor = conn.cursor()
     
     # Get all columns
@@ -66,7 +58,7 @@ def check_prb_columns():
     for row in rows:
         print(f"{str(row[0]):<15} {row[1]:<20}")
     
-    conn.close()
+    release_connection(conn)
     
     print("\n" + "="*70)
     print("💡 REKOMENDASI:")
@@ -6,34 +6,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
 import pandas as pd
-
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
+from data import get_cached_data
 
 def check_accessibility_data():
     """Check accessibility data untuk 35 hari terakhir"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
-    
-    # Get 35 days data
-    query = """
-    SELECT date_column, da_5g
-    FROM cluster_5g 
-    WHERE date_column >= (SELECT MAX(date_column)::date - INTERVAL '35 days' FROM cluster_5g)
-    ORDER BY date_column ASC, nc_5g
-    """
-    
-    df = pd.read_sql(query, conn)
-    conn.close()
-    
-    df['date_column'] = pd.to_datetime(df['date_column'])
+    # Last 35 days, served from the local cache (only new dates are downloaded)
+    df = get_cached_data(days_back=35, columns=['da_5g'])
     
     # Get date range
     max_date = df['date_column'].max()
@@ -7,22 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
+from data import get_connection, release_connection
 import pandas as pd
 import numpy as np
 
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
-
 def observe_eut_thp_data():
     """Observasi lengkap data EUT vs DL User Thp"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     
     # Check all possible EUT/Throughput-related columns
     query_columns = """
@@ -158,7 +150,7 @@ def observe_eut_thp_data():
     else:
         print("\n  ⚠️  Tidak ada column 5G EUT yang tersedia")
     
-    conn.close()
+    release_connection(conn)
     
     print("\n" + "="*80)
 
@@ -7,22 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
+from data import get_connection, release_connection
 import pandas as pd
 import numpy as np
 
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
-
 def observe_sgnb_sr_data():
     """Observasi lengkap data Sgnb addition SR"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     
     # Get current date and 35 days back
     query_dates = """
@@ -105,7 +97,7 @@ def observe_sgnb_sr_data():
     print(f"   Suggested max: {suggested_max:.3f} ({suggested_max*100:.1f}%)")
     print(f"   Current setting: 98.00% to 100.50%")
     
-    conn.close()
+    release_connection(conn)
     
     print("\n" + "="*80)
     print("✓ Observasi selesai!")
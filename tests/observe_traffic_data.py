@@ -7,22 +7,14 @@ import sys
 import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-import psycopg2
+from data import get_connection, release_connection
 import pandas as pd
 import numpy as np
 
-DB_CONFIG = {
-    'host': '1.tcp.ap.ngrok.io',
-    'port': 21039,
-    'database': 'postgres',
-    'user': 'postgres',
-    'password': 'option88'
-}
-
 def observe_traffic_data():
     """Observasi lengkap data Total Traffic"""
     
-    conn = psycopg2.connect(**DB_CONFIG)
+    conn = get_connection()
     
     # Get current date and 35 days back
     query_dates = """
@@ -181,7 +173,7 @@ def observe_traffic_data():
         print(f"   Range: 0 - {suggested_max:,} GB")
         print(f"   Interval: {int(suggested_max/5):,} GB")
     
-    conn.close()
+    release_connection(conn)
     
     print("\n" + "="*80)
     print("✓ Observasi selesai!")
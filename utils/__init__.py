@@ -3,6 +3,7 @@ Utilities module
 """
 from .data_processor import (
     aggregate_daily_data, 
+    build_daily_rollup,
     aggregate_availability_data,
     aggregate_accessibility_data,
     aggregate_cdr_data,
@@ -18,11 +19,18 @@ from .data_processor import (
     interpolate_availability, 
     get_every_nth_row,
     get_date_range_data,
-    validate_daily_data
+    select_interval_indices,
+    validate_daily_data,
+    select_days,
+    positive_points,
+    smooth_chart_lines
 )
+from .instrumentation import RunReport, instrument_run, stage, staged
+from .smoothing import smooth_series, smooth_many, sample_count, clear_smoothing_memo
 
 __all__ = [
     'aggregate_daily_data',
+    'build_daily_rollup',
     'aggregate_availability_data',
     'aggregate_accessibility_data',
     'aggregate_cdr_data',
@@ -38,5 +46,17 @@ __all__ = [
     'interpolate_availability', 
     'get_every_nth_row',
     'get_date_range_data',
-    'validate_daily_data'
+    'select_interval_indices',
+    'validate_daily_data',
+    'select_days',
+    'positive_points',
+    'smooth_chart_lines',
+    'RunReport',
+    'instrument_run',
+    'stage',
+    'staged',
+    'smooth_series',
+    'smooth_many',
+    'sample_count',
+    'clear_smoothing_memo'
 ]
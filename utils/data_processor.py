@@ -3,6 +3,45 @@ Data processing utilities
 """
 import pandas as pd
 import numpy as np
+from config import CHART_SIZE, CHART_DPI
+from .instrumentation import staged
+from .smoothing import smooth_many, sample_count
+
+# Aggregations that are a no-op on a single row (sum: NaN -> 0, like pandas)
+SINGLE_ROW_AGGREGATIONS = ('max', 'min', 'sum', 'mean')
+
+# Spline samples of the precomputed chart curves (exported chart width)
+SMOOTH_SAMPLES = sample_count(CHART_SIZE[0] * CHART_DPI)
+
+def collapse_daily(df, aggregations):
+    """
+    Group data by date_column with the given aggregations
+    
+    If df already has one row per date (daily rollup from build_daily_rollup
+    or the SQL push-down), the groupby is skipped: each group would be a
+    single row, so only 'sum' changes anything (NaN -> 0).
+    
+    Args:
+        df (pd.DataFrame): Raw or daily data
+        aggregations (dict): Column name -> aggregation
+        
+    Returns:
+        pd.DataFrame: One row per date, sorted by date_column
+    """
+    columns = list(aggregations)
+    
+    if (not df['date_column'].is_unique or
+            any(agg not in SINGLE_ROW_AGGREGATIONS for agg in aggregations.values())):
+        return df.groupby('date_column').agg(aggregations).reset_index()
+    
+    daily = df[['date_column'] + columns].sort_values('date_column', kind='stable')
+    daily = daily.reset_index(drop=True)
+    
+    sum_columns = [c for c, agg in aggregations.items() if agg == 'sum']
+    if sum_columns:
+        daily[sum_columns] = daily[sum_columns].fillna(0)
+    
+    return daily
 
 def aggregate_daily_data(df, metrics):
     """
@@ -18,7 +57,7 @@ def aggregate_daily_data(df, metrics):
         pd.DataFrame: Aggregated daily data (days with all zero values are excluded)
     """
     # First, aggregate by date
-    daily_agg = df.groupby('date_column').agg(metrics).reset_index()
+    daily_agg = collapse_daily(df, metrics)
     
     # Filter out days where ALL metric values are 0 or NaN
     # Keep days where at least one metric has a value > 0
@@ -34,6 +73,31 @@ def aggregate_daily_data(df, metrics):
     
     return result
 
+@staged
+def build_daily_rollup(df, aggregations):
+    """
+    Aggregate raw per-cluster data to one row per date (pandas reference
+    of data.get_daily_rollup_from_db)
+    
+    Unlike aggregate_daily_data, no day is filtered out: the rollup keeps
+    the raw column names and can be passed to the generators / aggregate_*
+    functions (and sliced per deck with get_date_range_data) as-is.
+    Data that is already one row per date is returned unchanged.
+    
+    Args:
+        df (pd.DataFrame): Raw data
+        aggregations (dict): Column name -> aggregation ('max', 'sum', ...)
+        
+    Returns:
+        pd.DataFrame: Daily data, one row per date
+    """
+    daily = collapse_daily(df, aggregations)
+    
+    print(f"Daily rollup: {len(df)} records -> {len(daily)} days, {len(aggregations)} metrics")
+    
+    return daily
+
+@staged
 def aggregate_availability_data(df, avail_column, days_back=35):
     """
     Special aggregation for Availability chart
@@ -54,9 +118,9 @@ def aggregate_availability_data(df, avail_column, days_back=35):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate availability by date (max value per day)
-    daily_avail = df.groupby('date_column').agg({
+    daily_avail = collapse_daily(df, {
         avail_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_avail = daily_avail[
@@ -135,6 +199,57 @@ def get_every_nth_row(df, n=2):
     """
     return df.iloc[::n]
 
+NS_PER_DAY = 86_400_000_000_000
+
+def select_interval_indices(dates, interval=2, gap_detection=True):
+    """
+    Select which days to display: EVERY Nth day counting from LAST date (newest)
+    
+    Simple: positions n-1, n-1-N, n-1-2N, ... (like CDR / User 5G)
+    Gap detection: if the date N positions back is more than 1.5*N days
+    away (some days were skipped), jump another N positions (like Accessibility)
+    
+    The next position for every day is computed at once on datetime64
+    values, then the chain is followed once from the newest day.
+    
+    Args:
+        dates: Dates of the valid days, sorted oldest to newest
+        interval (int): Show every Nth day (default: 2)
+        gap_detection (bool): Jump another interval when a gap is found
+        
+    Returns:
+        np.ndarray: Positions to display, in chronological order
+    """
+    n_total = len(dates)
+    
+    if not gap_detection or n_total == 0:
+        return np.arange(n_total - 1, -1, -interval)[::-1]
+    
+    # Dates as int64 nanoseconds (datetime64[ns])
+    date_ns = np.asarray(dates, dtype='datetime64[ns]').astype(np.int64)
+    
+    # Next position (interval back) and its distance in whole days
+    positions = np.arange(n_total)
+    next_pos = positions - interval
+    has_next = next_pos >= 0
+    
+    days_diff = np.zeros(n_total, dtype=np.int64)
+    days_diff[has_next] = (date_ns[has_next] - date_ns[next_pos[has_next]]) // NS_PER_DAY
+    
+    # Gap larger than expected: jump by another interval (becomes 4 days total)
+    next_pos = np.where(days_diff > interval * 1.5, next_pos - interval, next_pos)
+    
+    # Follow the chain from LAST index
+    next_list = next_pos.tolist()
+    result_indices = []
+    current_idx = n_total - 1
+    while current_idx >= 0:
+        result_indices.append(current_idx)
+        current_idx = next_list[current_idx]
+    
+    # Reverse to get chronological order (oldest to newest)
+    return np.array(result_indices[::-1], dtype=np.int64)
+
 def validate_daily_data(df, metric_columns):
     """
     Validate that daily data has at least one non-zero value
@@ -155,6 +270,7 @@ def validate_daily_data(df, metric_columns):
     
     return valid_data
 
+@staged
 def aggregate_accessibility_data(df, access_column, days_back=35, interval=2):
     """
     Special aggregation for Accessibility chart
@@ -175,9 +291,9 @@ def aggregate_accessibility_data(df, access_column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate accessibility by date (max value per day)
-    daily_access = df.groupby('date_column').agg({
+    daily_access = collapse_daily(df, {
         access_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_access = daily_access[
@@ -193,35 +309,7 @@ def aggregate_accessibility_data(df, access_column, days_back=35, interval=2):
         return valid_data
     
     # Apply interval logic: every 2 days, COUNT FROM END (newest data)
-    result_indices = []
-    current_idx = len(valid_data) - 1  # Start from LAST index
-    
-    while current_idx >= 0:
-        result_indices.append(current_idx)
-        
-        # Try to jump by interval (2 days) BACKWARD
-        next_idx = current_idx - interval
-        
-        # Check if next_idx exists
-        if next_idx >= 0:
-            # Check actual date difference
-            current_date = valid_data.iloc[current_idx]['date_column']
-            next_date = valid_data.iloc[next_idx]['date_column']
-            days_diff = (current_date - next_date).days
-            
-            # If gap is larger than expected (means some days were skipped)
-            # Jump further by interval (becomes 4 days total)
-            if days_diff > interval * 1.5:  # Allow some tolerance
-                # Data was skipped, jump by another interval
-                next_idx = next_idx - interval
-            
-            current_idx = next_idx
-        else:
-            # No more data
-            break
-    
-    # Reverse to get chronological order (oldest to newest)
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=True)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"Accessibility data: {(max_date - start_date).days + 1} days in range")
@@ -230,6 +318,7 @@ def aggregate_accessibility_data(df, access_column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_cdr_data(df, cdr_column, days_back=35, interval=2):
     """
     Special aggregation for Call Drop Rate chart
@@ -251,9 +340,9 @@ def aggregate_cdr_data(df, cdr_column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate CDR by date (max value per day)
-    daily_cdr = df.groupby('date_column').agg({
+    daily_cdr = collapse_daily(df, {
         cdr_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_cdr = daily_cdr[
@@ -273,13 +362,7 @@ def aggregate_cdr_data(df, cdr_column, days_back=35, interval=2):
     
     # Apply interval logic: every 2 days, COUNT FROM END (newest data)
     # Simple: take every Nth row FROM THE END
-    n_total = len(valid_data)
-    
-    # Calculate indices from end: n-1, n-3, n-5, ... (counting backward)
-    result_indices = list(range(n_total - 1, -1, -interval))
-    
-    # Reverse to get chronological order
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=False)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"CDR data: {(max_date - start_date).days + 1} days in range")
@@ -288,6 +371,7 @@ def aggregate_cdr_data(df, cdr_column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_sgnb_sr_data(df, sgnb_column, days_back=35, interval=2):
     """
     Special aggregation for Sgnb addition SR chart
@@ -308,9 +392,9 @@ def aggregate_sgnb_sr_data(df, sgnb_column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (max value per day)
-    daily_sgnb = df.groupby('date_column').agg({
+    daily_sgnb = collapse_daily(df, {
         sgnb_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_sgnb = daily_sgnb[
@@ -330,35 +414,7 @@ def aggregate_sgnb_sr_data(df, sgnb_column, days_back=35, interval=2):
     
     # Apply interval logic: every 2 days, COUNT FROM END (newest data)
     # WITH GAP DETECTION (like Accessibility)
-    result_indices = []
-    current_idx = len(valid_data) - 1  # Start from LAST index
-    
-    while current_idx >= 0:
-        result_indices.append(current_idx)
-        
-        # Try to jump by interval (2 days) BACKWARD
-        next_idx = current_idx - interval
-        
-        # Check if next_idx exists
-        if next_idx >= 0:
-            # Check actual date difference
-            current_date = valid_data.iloc[current_idx]['date_column']
-            next_date = valid_data.iloc[next_idx]['date_column']
-            days_diff = (current_date - next_date).days
-            
-            # If gap is larger than expected (means some days were skipped)
-            # Jump further by interval (becomes 4 days total)
-            if days_diff > interval * 1.5:  # Allow some tolerance
-                # Data was skipped, jump by another interval
-                next_idx = next_idx - interval
-            
-            current_idx = next_idx
-        else:
-            # No more data
-            break
-    
-    # Reverse to get chronological order (oldest to newest)
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=True)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"Sgnb SR data: {(max_date - start_date).days + 1} days in range")
@@ -367,6 +423,7 @@ def aggregate_sgnb_sr_data(df, sgnb_column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_traffic_data(df, traffic_column, days_back=35, interval=2):
     """
     Special aggregation for Traffic chart
@@ -389,9 +446,9 @@ def aggregate_traffic_data(df, traffic_column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (MAX per day - ambil nilai tertinggi, bukan sum)
-    daily_traffic = df.groupby('date_column').agg({
+    daily_traffic = collapse_daily(df, {
         traffic_column: 'max'  # MAX, bukan SUM!
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_traffic = daily_traffic[
@@ -410,35 +467,7 @@ def aggregate_traffic_data(df, traffic_column, days_back=35, interval=2):
     
     # Apply interval logic: every 2 days, COUNT FROM END (newest data)
     # WITH GAP DETECTION (like Accessibility)
-    result_indices = []
-    current_idx = len(valid_data) - 1  # Start from LAST index
-    
-    while current_idx >= 0:
-        result_indices.append(current_idx)
-        
-        # Try to jump by interval (2 days) BACKWARD
-        next_idx = current_idx - interval
-        
-        # Check if next_idx exists
-        if next_idx >= 0:
-            # Check actual date difference
-            current_date = valid_data.iloc[current_idx]['date_column']
-            next_date = valid_data.iloc[next_idx]['date_column']
-            days_diff = (current_date - next_date).days
-            
-            # If gap is larger than expected (means some days were skipped)
-            # Jump further by interval (becomes 4 days total)
-            if days_diff > interval * 1.5:  # Allow some tolerance
-                # Data was skipped, jump by another interval
-                next_idx = next_idx - interval
-            
-            current_idx = next_idx
-        else:
-            # No more data
-            break
-    
-    # Reverse to get chronological order (oldest to newest)
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=True)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"Traffic data: {(max_date - start_date).days + 1} days in range")
@@ -448,6 +477,7 @@ def aggregate_traffic_data(df, traffic_column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_eut_thp_data(df, eut_column, thp_column, days_back=35):
     """
     Special aggregation for EUT vs DL User Thp chart
@@ -469,10 +499,10 @@ def aggregate_eut_thp_data(df, eut_column, thp_column, days_back=35):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (MAX for both)
-    daily_data = df.groupby('date_column').agg({
+    daily_data = collapse_daily(df, {
         eut_column: 'max',
         thp_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_data = daily_data[
@@ -497,6 +527,7 @@ def aggregate_eut_thp_data(df, eut_column, thp_column, days_back=35):
     
     return valid_data
 
+@staged
 def aggregate_user5g_data(df, user_column, days_back=35, interval=2):
     """
     Special aggregation for User 5G chart
@@ -519,9 +550,9 @@ def aggregate_user5g_data(df, user_column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (MAX per day - NOT SUM!)
-    daily_user = df.groupby('date_column').agg({
+    daily_user = collapse_daily(df, {
         user_column: 'max'  # MAX, bukan SUM!
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_user = daily_user[
@@ -540,9 +571,7 @@ def aggregate_user5g_data(df, user_column, days_back=35, interval=2):
     
     # Apply interval logic: every 2 days, COUNT FROM END (newest data)
     # Simple interval (no gap detection, like CDR)
-    n_total = len(valid_data)
-    result_indices = list(range(n_total - 1, -1, -interval))
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=False)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"User 5G data: {(max_date - start_date).days + 1} days in range")
@@ -552,6 +581,7 @@ def aggregate_user5g_data(df, user_column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_prb_util_data(df, prb_column, count_column, days_back=35, interval=2):
     """
     Special aggregation for PRB Util chart (Line + Bar dual Y-axis)
@@ -572,10 +602,10 @@ def aggregate_prb_util_data(df, prb_column, count_column, days_back=35, interval
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (MAX for both)
-    daily_data = df.groupby('date_column').agg({
+    daily_data = collapse_daily(df, {
         prb_column: 'max',
         count_column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_data = daily_data[
@@ -594,26 +624,7 @@ def aggregate_prb_util_data(df, prb_column, count_column, days_back=35, interval
         return valid_data
     
     # Apply interval logic: every 2 days from END with gap detection
-    result_indices = []
-    current_idx = len(valid_data) - 1
-    
-    while current_idx >= 0:
-        result_indices.append(current_idx)
-        next_idx = current_idx - interval
-        
-        if next_idx >= 0:
-            current_date = valid_data.iloc[current_idx]['date_column']
-            next_date = valid_data.iloc[next_idx]['date_column']
-            days_diff = (current_date - next_date).days
-            
-            if days_diff > interval * 1.5:
-                next_idx = next_idx - interval
-            
-            current_idx = next_idx
-        else:
-            break
-    
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=True)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"PRB Util data: {(max_date - start_date).days + 1} days in range")
@@ -622,6 +633,7 @@ def aggregate_prb_util_data(df, prb_column, count_column, days_back=35, interval
     
     return result
 
+@staged
 def aggregate_inter_esgnb_data(df, column, days_back=35, interval=2):
     """
     Special aggregation for Inter esgNB chart
@@ -641,9 +653,9 @@ def aggregate_inter_esgnb_data(df, column, days_back=35, interval=2):
     start_date = max_date - pd.Timedelta(days=days_back)
     
     # Aggregate by date (MAX per day)
-    daily_data = df.groupby('date_column').agg({
+    daily_data = collapse_daily(df, {
         column: 'max'
-    }).reset_index()
+    })
     
     # Filter: only dates within range
     daily_data = daily_data[
@@ -659,9 +671,7 @@ def aggregate_inter_esgnb_data(df, column, days_back=35, interval=2):
         return valid_data
     
     # Apply interval logic: every 2 days from END (simple, no gap)
-    n_total = len(valid_data)
-    result_indices = list(range(n_total - 1, -1, -interval))
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=False)
     result = valid_data.iloc[result_indices].copy()
     
     print(f"Inter esgNB data: {(max_date - start_date).days + 1} days in range")
@@ -671,6 +681,7 @@ def aggregate_inter_esgnb_data(df, column, days_back=35, interval=2):
     
     return result
 
+@staged
 def aggregate_intra_esgnb_data(df, column, days_back=35, interval=2):
     """
     Special aggregation for Intra esgNB chart
@@ -679,7 +690,7 @@ def aggregate_intra_esgnb_data(df, column, days_back=35, interval=2):
     max_date = df['date_column'].max()
     start_date = max_date - pd.Timedelta(days=days_back)
     
-    daily_data = df.groupby('date_column').agg({column: 'max'}).reset_index()
+    daily_data = collapse_daily(df, {column: 'max'})
     
     daily_data = daily_data[
         (daily_data['date_column'] >= start_date) & 
@@ -695,28 +706,10 @@ def aggregate_intra_esgnb_data(df, column, days_back=35, interval=2):
         return valid_data
     
     # Every 2 days from END with gap detection
-    result_indices = []
-    current_idx = len(valid_data) - 1
-    
-    while current_idx >= 0:
-        result_indices.append(current_idx)
-        next_idx = current_idx - interval
-        
-        if next_idx >= 0:
-            current_date = valid_data.iloc[current_idx]['date_column']
-            next_date = valid_data.iloc[next_idx]['date_column']
-            days_diff = (current_date - next_date).days
-            
-            if days_diff > interval * 1.5:
-                next_idx = next_idx - interval
-            
-            current_idx = next_idx
-        else:
-            break
-    
-    result_indices.reverse()
+    result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection=True)
     return valid_data.iloc[result_indices].copy()
 
+@staged
 def aggregate_intra_sgnb_data(df, column, days_back=35, interval=2):
     """
     Special aggregation for Intra sgNB intrafreq chart
@@ -724,9 +717,123 @@ def aggregate_intra_sgnb_data(df, column, days_back=35, interval=2):
     """
     return aggregate_intra_esgnb_data(df, column, days_back, interval)
 
+@staged
 def aggregate_inter_sgnb_intrafreq_data(df, column, days_back=35, interval=2):
     """
     Special aggregation for Inter sgNB intrafreq chart
     SAME as Intra esgNB
     """
     return aggregate_intra_esgnb_data(df, column, days_back, interval)
+
+# Day filters of select_days (zero / NaN handling of a chart)
+DAY_RULES = ('skip_zero', 'keep_zero', 'non_negative', 'any_positive')
+
+@staged
+def select_days(df, columns, rule='skip_zero', aggregations=None, days_back=35,
+                interval=1, gap_detection=False, min_value=None, interpolate=None):
+    """
+    Generic day selection of a chart (same steps as the aggregate_* functions)
+    
+    Daily values of the columns -> date window -> day filter -> optional
+    minimum -> every Nth day from the END -> optional interpolation.
+    
+    Args:
+        df (pd.DataFrame): Raw or daily data
+        columns (list): Columns of the chart, the first one is the primary
+            (the filter is applied to it)
+        rule (str): 'skip_zero' (> 0), 'keep_zero' (not null),
+            'non_negative' (not null, >= 0) or 'any_positive' (any column > 0)
+        aggregations (dict): Column -> daily aggregation (default: 'max')
+        days_back (int): Days before the newest date (None: no window)
+        interval (int): Show every Nth day (1: every valid day)
+        gap_detection (bool): Jump another interval when a gap is found
+        min_value (float): Also drop days where the primary is below this
+        interpolate (float): Interpolate primary values <= this threshold
+            (interpolate_availability)
+        
+    Returns:
+        pd.DataFrame: Selected days, sorted by date_column
+    """
+    if rule not in DAY_RULES:
+        raise ValueError(f"Unknown day rule: {rule}")
+    
+    aggregations = aggregations or {}
+    daily = collapse_daily(df, {column: aggregations.get(column, 'max') for column in columns})
+    primary = daily[columns[0]]
+    
+    # Filter: only dates within range
+    if days_back is not None:
+        max_date = df['date_column'].max()
+        start_date = max_date - pd.Timedelta(days=days_back)
+        in_range = (daily['date_column'] >= start_date) & (daily['date_column'] <= max_date)
+    else:
+        in_range = pd.Series(True, index=daily.index)
+    
+    if rule == 'skip_zero':
+        valid = primary.notna() & (primary > 0)
+    elif rule == 'keep_zero':
+        valid = primary.notna()
+    elif rule == 'non_negative':
+        valid = primary.notna() & (primary >= 0)
+    else:
+        valid = (daily[columns] > 0).any(axis=1)
+    
+    valid_data = daily[in_range & valid]
+    if min_value is not None:
+        valid_data = valid_data[valid_data[columns[0]] >= min_value]
+    valid_data = valid_data.copy()
+    
+    if len(valid_data) > 0 and interval > 1:
+        result_indices = select_interval_indices(valid_data['date_column'], interval, gap_detection)
+        valid_data = valid_data.iloc[result_indices].copy()
+    
+    if interpolate is not None:
+        valid_data = interpolate_availability(valid_data, columns[0], threshold=interpolate)
+    
+    return valid_data
+
+def positive_points(values):
+    """
+    Points of a line drawn only where data exists (value > 0, not NaN)
+    
+    Args:
+        values (array-like): Values on x = 0..n-1
+        
+    Returns:
+        tuple: (x, y) ndarrays of the valid points
+    """
+    values = np.asarray(values, dtype=float)
+    x = np.flatnonzero(values > 0)
+    return x, values[x]
+
+def smooth_chart_lines(lines, x=None, samples=SMOOTH_SAMPLES):
+    """
+    Precompute the smoothed curves of a chart's lines (data stage)
+    
+    The curves are computed once from the aggregated daily series and
+    passed to the chart as smoothed=..., so rendering (PNG, any worker or
+    export format) does no spline work and every output draws the same
+    curve. Lines of the same length are fitted in one batched call.
+    
+    Args:
+        lines (dict): Line name -> values as drawn (after unit scaling)
+        x (array-like): x positions shared by the lines (default: 0..n-1)
+        samples (int): Spline samples (default: exported chart width)
+        
+    Returns:
+        dict: Line name -> (x_smooth, y_smooth), or None for lines that
+            are drawn as a polyline (too few points, missing values)
+    """
+    by_length = {}
+    for name, values in lines.items():
+        values = np.asarray(values, dtype=float)
+        by_length.setdefault(len(values), []).append((name, values))
+    
+    curves = {}
+    for n_points, group in by_length.items():
+        x_data = np.arange(n_points) if x is None else x
+        smoothed = smooth_many(x_data, [values for _, values in group], samples)
+        for (name, _), curve in zip(group, smoothed):
+            curves[name] = curve
+    
+    return curves
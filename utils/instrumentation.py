@@ -0,0 +1,180 @@
+"""
+Stage-level timing and memory instrumentation
+
+Stages (fetch, aggregators, chart create, PPT assembly) are recorded only
+inside an instrument_run() block; outside of it stage() and @staged cost
+one check. Each stage records wall time, CPU time (this process) and the
+tracemalloc peak above the memory in use when the stage started.
+
+    with instrument_run('run_report.json') as report:
+        create_monthly_dashboard()
+"""
+import functools
+import json
+import os
+import time
+import tracemalloc
+from contextlib import contextmanager
+from datetime import datetime
+
+# Active RunReport (None: instrumentation off)
+_run = None
+
+class RunReport:
+    """Stages recorded during one run"""
+
+    def __init__(self, trace_memory=True):
+        self.trace_memory = trace_memory
+        self.started_at = datetime.now()
+        self.stages = []
+        # Open stages: [record, peak seen so far (bytes)]
+        self._open = []
+
+    def enter(self, name):
+        """Start a stage, returns its record"""
+        record = {
+            'name': name,
+            'parent': self._open[-1][0]['name'] if self._open else None,
+            'depth': len(self._open),
+            'wall_s': None,
+            'cpu_s': None,
+            'peak_mb': None
+        }
+        self.stages.append(record)
+
+        start_mem = 0
+        if self.trace_memory:
+            current, peak = tracemalloc.get_traced_memory()
+            # Keep the enclosing stage's peak before resetting it
+            if self._open:
+                self._open[-1][2] = max(self._open[-1][2], peak)
+            tracemalloc.reset_peak()
+            start_mem = current
+
+        self._open.append([record, start_mem, start_mem, time.perf_counter(), time.process_time()])
+        return record
+
+    def exit(self):
+        """Close the innermost stage"""
+        record, start_mem, peak_seen, wall_start, cpu_start = self._open.pop()
+        record['wall_s'] = time.perf_counter() - wall_start
+        record['cpu_s'] = time.process_time() - cpu_start
+
+        if self.trace_memory:
+            peak = max(peak_seen, tracemalloc.get_traced_memory()[1])
+            record['peak_mb'] = (peak - start_mem) / 1024 / 1024
+            if self._open:
+                self._open[-1][2] = max(self._open[-1][2], peak)
+
+    def to_dict(self):
+        """JSON-serializable report"""
+        return {
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'trace_memory': self.trace_memory,
+            'stages': self.stages
+        }
+
+    def save(self, filename):
+        """Write the report as JSON"""
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(filename, 'w') as f:
+            json.dump(self.to_dict(), f, indent=2)
+        return filename
+
+    def summary(self):
+        """
+        Human-readable table of the stages (nested stages indented)
+
+        Returns:
+            str: Summary table
+        """
+        lines = [f"{'STAGE':<44} {'WALL (s)':>9} {'CPU (s)':>9} {'PEAK (MB)':>10}"]
+        lines.append('-' * len(lines[0]))
+        for record in self.stages:
+            name = '  ' * record['depth'] + record['name']
+            peak = '' if record['peak_mb'] is None else f"{record['peak_mb']:.1f}"
+            lines.append(f"{name:<44} {record['wall_s'] or 0:>9.3f} "
+                         f"{record['cpu_s'] or 0:>9.3f} {peak:>10}")
+        return '\n'.join(lines)
+
+@contextmanager
+def stage(name):
+    """
+    Record one pipeline stage (no-op outside instrument_run)
+
+    Args:
+        name (str): Stage name, e.g. 'fetch' or 'chart:availability'
+    """
+    run = _run
+    if run is None:
+        yield None
+        return
+
+    record = run.enter(name)
+    try:
+        yield record
+    finally:
+        run.exit()
+
+def staged(func=None, name=None):
+    """
+    Decorator: record every call of the function as a stage
+
+    Usage: @staged or @staged(name='fetch')
+    """
+    if func is None:
+        return functools.partial(staged, name=name)
+
+    stage_name = name or func.__name__
+
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        if _run is None:
+            return func(*args, **kwargs)
+        with stage(stage_name):
+            return func(*args, **kwargs)
+
+    return wrapper
+
+@contextmanager
+def instrument_run(report_file=None, trace_memory=True, summary=True):
+    """
+    Instrument every stage run inside the block
+
+    Args:
+        report_file (str): Write the JSON run report here (None: no file)
+        trace_memory (bool): Record peak memory with tracemalloc (slows
+            allocation-heavy code down)
+        summary (bool): Print the summary table at the end
+
+    Yields:
+        RunReport: Stages recorded so far
+    """
+    global _run
+    if _run is not None:
+        # Nested run: stages go to the outer report
+        yield _run
+        return
+
+    started_tracing = trace_memory and not tracemalloc.is_tracing()
+    if started_tracing:
+        tracemalloc.start()
+
+    _run = RunReport(trace_memory=trace_memory)
+    report = _run
+    try:
+        with stage('total'):
+            yield report
+    finally:
+        _run = None
+        if started_tracing:
+            tracemalloc.stop()
+
+        if report_file:
+            report.save(report_file)
+        if summary:
+            print('\n' + report.summary())
+            if report_file:
+                print(f"Run report saved as: {report_file}")